@@ -10,6 +10,12 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By 
+from pymongo import ReturnDocument
+from ..services.job_service import invalidate_job_posting
+from ..services.job_popularity import empty_popularity_counters
+from ..services.company_service import CompanyService
+from ..models.init_db import bump_collection_version
+from ..utils.normalizers import parse_salary, empty_salary, normalize_location, canonicalize_skills
 # Chrome 옵션 설정
 chrome_options = Options()
 service = Service()  # ChromeDriver 경로를 자동으로 관리
@@ -27,6 +33,8 @@ class SaraminCrawler:
     def __init__(self, db):
         """크롤러 초기화"""
         self.db = db
+        self.company_service = CompanyService(db)
+        self._updated_companies = {}  # 이번 크롤링에서 갱신된 회사 스냅샷 (company_id -> snapshot)
         self.base_url = "https://www.saramin.co.kr/zf_user/search/recruit"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -302,19 +310,22 @@ class SaraminCrawler:
     def _save_job_posting(self, job_data: Dict) -> bool:
         """채용공고 정보를 데이터베이스에 저장합니다"""
         try:
-            # 회사 정보 저장
-            company_result = self.db.companies.update_one(
+            # 회사 정보 저장 (저장된 문서를 바로 반환받아 스냅샷 생성에 사용)
+            company = self.db.companies.find_one_and_update(
                 {'name': job_data['company_name']},
                 {'$set': {
                     'name': job_data['company_name'],
                     'location': job_data.get('location', ''),
-                    'updated_at': datetime.now()
+                    'updated_at': datetime.utcnow()
                 }},
-                upsert=True
+                projection={'name': 1, 'location': 1},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
             )
 
-            company_id = str(company_result.upserted_id or 
-                        self.db.companies.find_one({'name': job_data['company_name']})['_id'])
+            company_snapshot = self.company_service.build_snapshot(company)
+            company_id = company_snapshot['_id']
+            self._updated_companies[company_id] = company_snapshot
 
             # 마감일 처리
             deadline = job_data.get('deadline', '')
@@ -333,6 +344,7 @@ class SaraminCrawler:
             job_posting = {
                 'company_id': company_id,
                 'company_name': job_data['company_name'],
+                'company': company_snapshot,  # 조회 시 조인을 피하기 위한 회사 스냅샷
                 'title': job_data['title'],
                 'description': job_data.get('description', ''),
                 'requirements': job_data.get('requirements', []),
@@ -341,19 +353,21 @@ class SaraminCrawler:
                 'tasks': job_data.get('tasks', []),
                 'process': job_data.get('process', []), 
                 'salary_text': job_data.get('salary_text', ''),
+                'salary': parse_salary(job_data.get('salary_text', '')) or empty_salary(),
                 'location': job_data.get('location', ''),
+                'region_codes': normalize_location(job_data.get('location', '')),
                 'job_type': job_data.get('job_type', ''),
                 'experience_level': job_data.get('experience', ''),
                 'education': job_data.get('education', ''),
                 'detail_location': job_data.get('detail_location', ''),
-                'skills': job_data.get('skills', []),
+                'skills': canonicalize_skills(job_data.get('skills', [])),
                 'sector': job_data.get('sector', ''),
                 'deadline': deadline,
                 'deadline_timestamp': deadline_date,
                 'original_url': job_data.get('original_url', ''),
                 'status': 'active',
-                'created_at': datetime.now(),
-                'updated_at': datetime.now(),
+                'created_at': datetime.utcnow(),
+                'updated_at': datetime.utcnow(),
                 'conditions': {  # 근무조건 상세 정보 추가
                     'location': job_data.get('conditions', {}).get('location', ''),
                     'job_type': job_data.get('conditions', {}).get('job_type', ''),
@@ -366,18 +380,52 @@ class SaraminCrawler:
                     'company_id': company_id,
                     'title': job_data['title']
                 },
-                {'$set': job_posting},
+                {
+                    '$set': job_posting,
+                    # 새로 저장되는 공고만 인기 카운터를 0으로 초기화합니다 (재크롤링 시 유지)
+                    '$setOnInsert': empty_popularity_counters()
+                },
                 upsert=True
             )
 
+            # 상세 캐시 무효화 (별도 프로세스로 실행되면 컬렉션 버전 증가로 API 서버의 캐시가 미스 처리됩니다)
+            job_id = result.upserted_id
+            if job_id is None:
+                job_id = self.db.job_postings.find_one(
+                    {'company_id': company_id, 'title': job_data['title']},
+                    {'_id': 1}
+                )['_id']
+            invalidate_job_posting(job_id)
+            bump_collection_version(self.db, 'job_postings')
+
             return bool(result.upserted_id or result.modified_count)
 
         except Exception as e:
             logger.error(f"채용공고 저장 실패: {str(e)}")
             return False
 
+    def _sync_company_snapshots(self) -> None:
+        """크롤링 중 갱신된 회사 정보를 기존 채용공고의 스냅샷에 일괄 반영합니다"""
+        if not self._updated_companies:
+            return
+
+        try:
+            modified = self.company_service.sync_job_snapshots(self._updated_companies.values())
+            logger.info(f"회사 스냅샷 동기화 완료: {modified}개 채용공고 갱신")
+        except Exception as e:
+            logger.error(f"회사 스냅샷 동기화 실패: {str(e)}")
+        finally:
+            self._updated_companies = {}
+
     def crawl(self, max_pages: int = 5) -> int:
         """채용공고를 크롤링합니다"""
+        try:
+            return self._crawl_pages(max_pages)
+        finally:
+            self._sync_company_snapshots()
+
+    def _crawl_pages(self, max_pages: int) -> int:
+        """목록 페이지를 순회하며 채용공고를 수집하고 저장합니다"""
         total_jobs = 0
         page = 1
         
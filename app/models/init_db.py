@@ -52,6 +52,25 @@ def init_indexes(db):
    db.job_postings.create_index([("education", ASCENDING)])
    db.job_postings.create_index([("skills", ASCENDING)])
    
+   # 지역 필터 (계층형 지역 코드 정확 일치)
+   db.job_postings.create_index([
+       ("status", ASCENDING),
+       ("region_codes", ASCENDING)
+   ])
+   
+   # 급여 필터(salary.max 범위)와 급여순 정렬을 함께 처리하는 복합 인덱스
+   db.job_postings.create_index([
+       ("status", ASCENDING),
+       ("salary.max", DESCENDING)
+   ])
+   
+   # 인기순 정렬(sort_by=popular)과 인기 급상승 후보 조회
+   db.job_postings.create_index([
+       ("status", ASCENDING),
+       ("popularity_score", DESCENDING),
+       ("created_at", DESCENDING)
+   ])
+   
    # 리스트 형태 필드들에 대한 개별 인덱스
    db.job_postings.create_index([("tasks", ASCENDING)])
    db.job_postings.create_index([("requirements", ASCENDING)])
@@ -61,6 +80,28 @@ def init_indexes(db):
    # 크롤링 데이터 관리를 위한 인덱스
    db.job_postings.create_index([("original_url", ASCENDING)], unique=True)
    db.job_postings.create_index([("updated_at", DESCENDING)])
+   
+   # Application 컬렉션 인덱스
+   # 취소되지 않은(is_active) 지원은 사용자/채용공고별로 하나만 허용하여 중복 지원을 막습니다
+   db.applications.create_index([
+       ("user_id", ASCENDING),
+       ("job_posting_id", ASCENDING)
+   ], unique=True, partialFilterExpression={"is_active": True})
+   
+   # Bookmark 컬렉션 인덱스
+   # 사용자/채용공고별 북마크는 하나만 허용 (동시 토글 요청의 중복 저장 방지)
+   db.bookmarks.create_index([
+       ("user_id", ASCENDING),
+       ("job_posting_id", ASCENDING)
+   ], unique=True)
+   db.bookmarks.create_index([("user_id", ASCENDING), ("created_at", DESCENDING)])
+   
+   # ResumeVersion 컬렉션 인덱스
+   # 지원별 이력서 버전 이력을 최신 버전부터 페이지 단위로 조회
+   db.resume_versions.create_index([
+       ("application_id", ASCENDING),
+       ("version", DESCENDING)
+   ], unique=True)
 
 def init_db():
    """데이터베이스 초기화
@@ -72,4 +113,38 @@ def init_db():
    """
    db = get_db()
    init_indexes(db)
-   return db
\ No newline at end of file
+   return db
+
+def get_collection_version(db, collection_name):
+   """컬렉션 버전 조회
+   
+   컬렉션 내용이 바뀔 때마다 증가하는 버전 번호를 반환합니다.
+   목록 응답의 ETag 계산에 사용합니다.
+   
+   Args:
+       db: MongoDB database object
+       collection_name: 컬렉션 이름
+       
+   Returns:
+       int: 현재 버전 (기록이 없으면 0)
+   """
+   doc = db.collection_versions.find_one({'_id': collection_name}, {'version': 1})
+   return doc['version'] if doc else 0
+
+def bump_collection_version(db, collection_name):
+   """컬렉션 버전 증가
+   
+   컬렉션에 쓰기가 발생한 뒤 호출하여 캐시된 목록 응답(ETag)을 무효화합니다.
+   
+   Args:
+       db: MongoDB database object
+       collection_name: 컬렉션 이름
+   """
+   db.collection_versions.update_one(
+       {'_id': collection_name},
+       {
+           '$inc': {'version': 1},
+           '$currentDate': {'updated_at': True}
+       },
+       upsert=True
+   )
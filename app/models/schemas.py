@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, EmailStr
 
 class Company(BaseModel):
@@ -14,6 +14,27 @@ class Company(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+class CompanySnapshot(BaseModel):
+    """채용공고에 임베드되는 회사 요약 정보 모델
+    
+    조회 시 companies 컬렉션 조인 없이 회사 정보를 제공하기 위해 저장 시점에 임베드합니다.
+    회사 정보가 변경되면 배치 백필로 동기화됩니다.
+    """
+    id: str = Field(default_factory=str, alias='_id')
+    name: str = ""
+    location: str = ""
+
+class SalaryInfo(BaseModel):
+    """급여 정보 모델
+    
+    salary_text를 파싱한 연간 환산 금액(만원 단위)입니다.
+    min은 항상 max 이하이며, 파싱할 수 없으면 0으로 저장됩니다.
+    """
+    min: int = 0
+    max: int = 0
+    unit: str = "만원"
+    period: Optional[str] = None  # 원래 지급 주기 (year, month, day, hour)
+
 class WorkConditions(BaseModel):
     """근무조건 상세 정보 모델
     
@@ -33,6 +54,7 @@ class JobPosting(BaseModel):
     id: str = Field(default_factory=str)
     company_id: str
     company_name: str
+    company: Optional[CompanySnapshot] = None  # 임베드된 회사 스냅샷
     title: str
     original_url: str  # 원본 채용공고 URL
     
@@ -49,6 +71,7 @@ class JobPosting(BaseModel):
     # 근무 조건 
     location: str = ""  # 근무지 주소
     detail_location: str = ""  # 상세 근무지
+    region_codes: List[str] = Field(default_factory=list)  # 계층형 지역 코드 (예: 서울, 서울>강남구)
     job_type: str = ""  # 고용형태
     experience_level: str = ""  # 경력 요건
     education: str = ""  # 학력 요건
@@ -56,6 +79,7 @@ class JobPosting(BaseModel):
     
     # 급여 정보
     salary_text: str = ""  # 텍스트형 급여 정보
+    salary: SalaryInfo = Field(default_factory=SalaryInfo)  # 파싱된 급여 정보
     
     # 직무 분야
     sector: str = ""  # 직무분야
@@ -65,6 +89,12 @@ class JobPosting(BaseModel):
     deadline: str = ""  # 마감일 텍스트
     deadline_timestamp: Optional[datetime] = None  # 파싱된 마감일
     
+    # 인기 카운터 (write-behind 집계기가 주기적으로 $inc 반영)
+    view_count: int = 0  # 상세 조회 수
+    bookmark_count: int = 0  # 북마크 수
+    application_count: int = 0  # 취소되지 않은 지원 수
+    popularity_score: int = 0  # 가중합 (조회 1, 북마크 3, 지원 5) - 인기순 정렬에 사용
+    
     # 메타 정보
     status: str = "active"
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -145,9 +175,11 @@ class Application(BaseModel):
     user_id: str
     job_posting_id: str
     status: str  # applied, in_review, interview_scheduled, accepted, rejected, canceled
+    is_active: bool = True  # 취소되지 않은 지원 여부 (중복 지원 방지 유니크 인덱스에 사용)
+    job_category: Optional[str] = None  # 통계 집계를 위한 채용공고 카테고리
     resume_url: Optional[str] = None
-    resume_versions: List[Dict] = Field(default_factory=list)
     current_resume_url: Optional[str] = None
+    resume_version_count: int = 0  # 이력서 버전 수 (= 현재 버전 번호), 버전 이력은 ResumeVersion에 저장
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     canceled_at: Optional[datetime] = None
@@ -168,6 +200,20 @@ class Application(BaseModel):
             }
         }
 
+class ResumeVersion(BaseModel):
+    """지원 이력서 버전 모델
+    
+    지원 문서가 계속 커지지 않도록 이력서 버전 이력을 별도 컬렉션에 저장합니다.
+    application_id와 version 조합으로 유니크하게 관리됩니다.
+    """
+    id: str = Field(default_factory=str)
+    application_id: str
+    user_id: str
+    version: int
+    resume_url: Optional[str] = None
+    notes: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
 class Bookmark(BaseModel):
     """채용공고 북마크 모델
     
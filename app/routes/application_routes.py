@@ -14,6 +14,209 @@ def record_params(setup_state):
 
 # [기존 라우트들은 그대로 유지...]
 
+@application_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+@swag_from({
+    'tags': ['Applications'],
+    'summary': '일괄 지원',
+    'description': '여러 채용공고에 한 번에 지원합니다 (최대 100건). 항목별 처리 결과를 요청 순서대로 반환합니다.',
+    'security': [{'bearerAuth': []}],
+    'requestBody': {
+        'required': True,
+        'content': {
+            'application/json': {
+                'schema': {
+                    'type': 'object',
+                    'required': ['applications'],
+                    'properties': {
+                        'applications': {
+                            'type': 'array',
+                            'items': {
+                                'type': 'object',
+                                'required': ['job_id'],
+                                'properties': {
+                                    'job_id': {'type': 'string'},
+                                    'resume_url': {'type': 'string'}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    },
+    'responses': {
+        '200': {
+            'description': '일괄 지원 처리 결과',
+            'content': {
+                'application/json': {
+                    'schema': {
+                        'type': 'object',
+                        'properties': {
+                            'status': {'type': 'string'},
+                            'data': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'job_id': {'type': 'string'},
+                                        'status': {
+                                            'type': 'string',
+                                            'enum': ['applied', 'duplicate', 'not_found', 'invalid_id', 'error']
+                                        },
+                                        'application_id': {'type': 'string'},
+                                        'message': {'type': 'string'}
+                                    }
+                                }
+                            },
+                            'summary': {
+                                'type': 'object',
+                                'properties': {
+                                    'requested': {'type': 'integer'},
+                                    'applied': {'type': 'integer'},
+                                    'failed': {'type': 'integer'}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+})
+def apply_jobs_bulk():
+    """여러 채용공고에 한 번에 지원하는 API입니다."""
+    try:
+        user_id = get_jwt_identity()
+        data = request.get_json(silent=True) or {}
+        items = data.get('applications')
+
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            return jsonify({
+                'status': 'error',
+                'message': 'applications must be a list of objects'
+            }), 400
+
+        result = application_service.apply_jobs_bulk(user_id, items)
+
+        if result['status'] == 'success':
+            return jsonify(result), 200
+
+        return jsonify(result), 400
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@application_bp.route('/bulk/status', methods=['PUT'])
+@jwt_required()
+@swag_from({
+    'tags': ['Applications'],
+    'summary': '지원 상태 일괄 업데이트',
+    'description': '여러 지원의 상태를 한 번에 업데이트합니다 (최대 100건). 항목별 처리 결과를 요청 순서대로 반환합니다.',
+    'security': [{'bearerAuth': []}],
+    'requestBody': {
+        'required': True,
+        'content': {
+            'application/json': {
+                'schema': {
+                    'type': 'object',
+                    'required': ['updates'],
+                    'properties': {
+                        'updates': {
+                            'type': 'array',
+                            'items': {
+                                'type': 'object',
+                                'required': ['application_id', 'status'],
+                                'properties': {
+                                    'application_id': {'type': 'string'},
+                                    'status': {
+                                        'type': 'string',
+                                        'enum': [
+                                            'applied',
+                                            'in_review',
+                                            'interview_scheduled',
+                                            'accepted',
+                                            'rejected',
+                                            'canceled'
+                                        ]
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    },
+    'responses': {
+        '200': {
+            'description': '일괄 상태 업데이트 결과',
+            'content': {
+                'application/json': {
+                    'schema': {
+                        'type': 'object',
+                        'properties': {
+                            'status': {'type': 'string'},
+                            'data': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'application_id': {'type': 'string'},
+                                        'status': {
+                                            'type': 'string',
+                                            'enum': ['updated', 'duplicate', 'conflict', 'not_found', 'invalid_status']
+                                        },
+                                        'previous_status': {'type': 'string'},
+                                        'new_status': {'type': 'string'},
+                                        'message': {'type': 'string'}
+                                    }
+                                }
+                            },
+                            'summary': {
+                                'type': 'object',
+                                'properties': {
+                                    'requested': {'type': 'integer'},
+                                    'updated': {'type': 'integer'},
+                                    'failed': {'type': 'integer'}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+})
+def update_application_statuses_bulk():
+    """여러 지원의 상태를 한 번에 업데이트하는 API입니다."""
+    try:
+        user_id = get_jwt_identity()
+        data = request.get_json(silent=True) or {}
+        updates = data.get('updates')
+
+        if not isinstance(updates, list) or not all(isinstance(update, dict) for update in updates):
+            return jsonify({
+                'status': 'error',
+                'message': 'updates must be a list of objects'
+            }), 400
+
+        result = application_service.update_statuses_bulk(user_id, updates)
+
+        if result['status'] == 'success':
+            return jsonify(result), 200
+
+        return jsonify(result), 400
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
 @application_bp.route('/<application_id>/status', methods=['PUT'])
 @jwt_required()
 @swag_from({
@@ -219,7 +422,10 @@ def get_application_statistics():
                                 'type': 'object',
                                 'properties': {
                                     'current_resume_url': {'type': 'string'},
-                                    'resume_versions': {'type': 'array'}
+                                    'resume_version_count': {'type': 'integer'},
+                                    'current_resume_version': {
+                                        '$ref': '#/components/schemas/ResumeVersion'
+                                    }
                                 }
                             }
                         }
@@ -261,4 +467,69 @@ def update_application_resume(application_id):
         return jsonify({
             'status': 'error',
             'message': str(e)
-        }), 500
\ No newline at end of file
+        }), 500
+
+@application_bp.route('/<application_id>/resume/versions', methods=['GET'])
+@jwt_required()
+@swag_from({
+    'tags': ['Applications'],
+    'summary': '이력서 버전 이력 조회',
+    'description': '지원 이력서의 버전 이력을 최신 버전부터 페이지 단위로 조회합니다.',
+    'security': [{'bearerAuth': []}],
+    'parameters': [
+        {
+            'in': 'path',
+            'name': 'application_id',
+            'required': True,
+            'schema': {'type': 'string'}
+        },
+        {
+            'in': 'query',
+            'name': 'page',
+            'schema': {'type': 'integer', 'default': 1},
+            'description': '조회할 페이지 번호'
+        }
+    ],
+    'responses': {
+        '200': {
+            'description': '이력서 버전 이력 조회 성공',
+            'content': {
+                'application/json': {
+                    'schema': {
+                        'type': 'object',
+                        'properties': {
+                            'status': {'type': 'string'},
+                            'data': {
+                                'type': 'array',
+                                'items': {
+                                    '$ref': '#/components/schemas/ResumeVersion'
+                                }
+                            },
+                            'pagination': {
+                                '$ref': '#/components/schemas/Pagination'
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+})
+def get_resume_versions(application_id):
+    """지원 이력서의 버전 이력을 조회하는 API입니다."""
+    try:
+        user_id = get_jwt_identity()
+        page = request.args.get('page', 1, type=int)
+
+        result = application_service.get_resume_versions(user_id, application_id, max(page, 1))
+
+        if result['status'] == 'success':
+            return jsonify(result), 200
+
+        return jsonify(result), 404
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
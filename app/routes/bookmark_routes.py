@@ -107,7 +107,8 @@ def toggle_bookmark():
 @swag_from({
     'tags': ['Bookmarks'],
     'summary': '북마크 목록 조회',
-    'description': '사용자의 북마크 목록을 조회합니다. 페이지네이션, 정렬, 필터링 기능을 제공합니다.',
+    'description': '사용자의 북마크 목록을 조회합니다. 페이지네이션, 정렬, 필터링 기능을 제공합니다. '
+                   '채용공고가 삭제된 북마크는 job_posting이 null이고 job_posting_available이 false입니다.',
     'security': [{'bearerAuth': []}],
     'parameters': [
         {
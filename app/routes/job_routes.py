@@ -1,7 +1,12 @@
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from datetime import datetime
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from typing import Optional
+from flask_jwt_extended import jwt_required, get_jwt_identity, verify_jwt_in_request
 from flasgger import swag_from
 from ..services.job_service import JobService
+from ..utils.http_cache import make_etag, request_signature, not_modified, with_etag
+from ..utils.compression import cached_json_response, cache_json_response
+from ..utils.streaming import ndjson_chunks
 
 job_bp = Blueprint('jobs', __name__, url_prefix='/jobs')
 job_service = None
@@ -13,10 +18,37 @@ def record_params(setup_state):
     app = setup_state.app
     job_service = JobService(app.db)
 
+def optional_user_id() -> Optional[str]:
+    """유효한 액세스 토큰이 있으면 사용자 ID를 반환하고, 없거나 유효하지 않으면 None을 반환합니다."""
+    try:
+        verify_jwt_in_request(optional=True)
+        return get_jwt_identity()
+    except Exception:
+        return None
+
+def user_etag_parts(user_id: Optional[str]) -> tuple:
+    """로그인한 사용자의 응답은 북마크/지원 집합이 바뀌면 ETag도 바뀌도록 집합 버전을 포함합니다."""
+    return ('user', user_id, job_service.get_user_flags_version(user_id)) if user_id else ()
+
+def counter_version(sort_by: Optional[str] = None):
+    """
+    응답 ETag에 포함할 인기 카운터 버전입니다. 카운터로 정렬하는 인기순 목록은 반영될 때마다 바뀌는 버전을,
+    그 외 응답은 근사치인 카운터가 일정 시간 늦게 반영되도록 시간 단위 버전을 사용합니다.
+    """
+    if sort_by == 'popular':
+        return ('popular', job_service.get_popularity_version())
+    return job_service.get_counter_bucket()
+
+def vary_on_user(response):
+    """응답이 Authorization 헤더(로그인 사용자)에 따라 달라짐을 표시합니다."""
+    response.vary.add('Authorization')
+    return response
+
 @job_bp.route('', methods=['GET'])
 @swag_from({
     'tags': ['Jobs'],
     'summary': '채용공고 목록 조회',
+    'description': 'ETag를 반환하며, If-None-Match가 일치하면 304 Not Modified로 응답합니다. 액세스 토큰을 함께 보내면(선택) 각 공고에 is_bookmarked/has_applied 플래그가 포함됩니다.',
     'parameters': [
         {
             'in': 'query',
@@ -31,7 +63,8 @@ def record_params(setup_state):
             'name': 'location',
             'schema': {
                 'type': 'string'
-            }
+            },
+            'description': 'Region such as "서울" or "서울 강남구" (comma separated for multiple regions)'
         },
         {
             'in': 'query',
@@ -45,7 +78,8 @@ def record_params(setup_state):
             'name': 'min_salary',
             'schema': {
                 'type': 'integer'
-            }
+            },
+            'description': 'Minimum annual salary in 만원 (monthly/hourly pay is annualized)'
         },
         {
             'in': 'query',
@@ -55,13 +89,41 @@ def record_params(setup_state):
             },
             'description': 'Comma separated skills'
         },
+        {
+            'in': 'query',
+            'name': 'skills_mode',
+            'schema': {
+                'type': 'string',
+                'enum': ['all', 'any'],
+                'default': 'all'
+            },
+            'description': 'Match all skills (AND) or any skill (OR)'
+        },
+        {
+            'in': 'query',
+            'name': 'fields',
+            'schema': {
+                'type': 'string'
+            },
+            'description': 'Comma separated fields to return (default: card fields)'
+        },
+        {
+            'in': 'query',
+            'name': 'facets',
+            'schema': {
+                'type': 'boolean',
+                'default': False
+            },
+            'description': 'Include counts per location, experience level, job type, education and skills'
+        },
         {
             'in': 'query',
             'name': 'sort_by',
             'schema': {
                 'type': 'string',
-                'enum': ['salary', 'deadline']
-            }
+                'enum': ['salary', 'deadline', 'popular']
+            },
+            'description': 'popular: 조회/북마크/지원 수 기반 인기순'
         }
     ],
     'responses': {
@@ -84,6 +146,10 @@ def record_params(setup_state):
                             },
                             'pagination': {
                                 '$ref': '#/components/schemas/Pagination'
+                            },
+                            'facets': {
+                                'type': 'object',
+                                'description': 'facets=true 일 때만 포함 ({facet: [{value, count}]})'
                             }
                         }
                     }
@@ -95,13 +161,29 @@ def record_params(setup_state):
 def get_job_postings():
     """채용공고 목록 조회 API"""
     try:
+        # 컬렉션 버전, 카운터 버전과 쿼리 파라미터(로그인 시 사용자 집합 버전)가 같으면
+        # 응답도 같으므로 304로 응답합니다
+        user_id = optional_user_id()
+        sort_by = request.args.get('sort_by')
+        etag = make_etag('jobs', job_service.get_listing_version(), counter_version(sort_by),
+                         request_signature(), *user_etag_parts(user_id))
+        cached_response = not_modified(etag)
+        if cached_response:
+            return vary_on_user(cached_response)
+
+        # 같은 ETag의 응답은 직렬화/압축된 본문을 재사용합니다 (사용자별 응답은 캐시하지 않음)
+        cached_response = None if user_id else cached_json_response(etag)
+        if cached_response:
+            return vary_on_user(with_etag(cached_response, etag)), 200
+
         # 쿼리 파라미터 가져오기
         page = request.args.get('page', 1, type=int)
         location = request.args.get('location')
         experience_level = request.args.get('experience_level')
         min_salary = request.args.get('min_salary', type=int)
         skills = request.args.get('skills')
-        sort_by = request.args.get('sort_by')
+        fields = request.args.get('fields')
+        facets = request.args.get('facets', 'false').lower() in ('true', '1')
 
         # 필터 구성
         filters = {}
@@ -113,12 +195,21 @@ def get_job_postings():
             filters['min_salary'] = min_salary
         if skills:
             filters['skills'] = skills.split(',')
+            filters['skills_mode'] = request.args.get('skills_mode', 'all')
 
         # 서비스 호출
-        result = job_service.get_job_postings(page=page, filters=filters, sort_by=sort_by)
+        result = job_service.get_job_postings(
+            page=page,
+            filters=filters,
+            sort_by=sort_by,
+            fields=fields.split(',') if fields else None,
+            facets=facets,
+            user_id=user_id
+        )
         
         if result['status'] == 'success':
-            return jsonify(result), 200
+            response = jsonify(result) if user_id else cache_json_response(etag, result)
+            return vary_on_user(with_etag(response, etag)), 200
         
         return jsonify(result), 400
 
@@ -132,6 +223,7 @@ def get_job_postings():
 @swag_from({
     'tags': ['Jobs'],
     'summary': '채용공고 검색',
+    'description': 'ETag를 반환하며, If-None-Match가 일치하면 304 Not Modified로 응답합니다. 액세스 토큰을 함께 보내면(선택) 각 공고에 is_bookmarked/has_applied 플래그가 포함됩니다.',
     'parameters': [
         {
             'in': 'query',
@@ -148,6 +240,14 @@ def get_job_postings():
                 'type': 'integer',
                 'default': 1
             }
+        },
+        {
+            'in': 'query',
+            'name': 'fields',
+            'schema': {
+                'type': 'string'
+            },
+            'description': 'Comma separated fields to return (default: card fields)'
         }
     ],
     'responses': {
@@ -188,11 +288,30 @@ def search_jobs():
                 'message': '검색어를 입력해주세요.'
             }), 400
 
+        user_id = optional_user_id()
+        etag = make_etag('search', job_service.get_listing_version(), counter_version(),
+                         request_signature(), *user_etag_parts(user_id))
+        cached_response = not_modified(etag)
+        if cached_response:
+            return vary_on_user(cached_response)
+
+        # 같은 ETag의 응답은 직렬화/압축된 본문을 재사용합니다 (사용자별 응답은 캐시하지 않음)
+        cached_response = None if user_id else cached_json_response(etag)
+        if cached_response:
+            return vary_on_user(with_etag(cached_response, etag)), 200
+
         page = request.args.get('page', 1, type=int)
-        result = job_service.search_jobs(keyword=keyword, page=page)
+        fields = request.args.get('fields')
+        result = job_service.search_jobs(
+            keyword=keyword,
+            page=page,
+            fields=fields.split(',') if fields else None,
+            user_id=user_id
+        )
         
         if result['status'] == 'success':
-            return jsonify(result), 200
+            response = jsonify(result) if user_id else cache_json_response(etag, result)
+            return vary_on_user(with_etag(response, etag)), 200
             
         return jsonify(result), 400
 
@@ -202,10 +321,393 @@ def search_jobs():
             'message': str(e)
         }), 500
 
+@job_bp.route('/suggest', methods=['GET'])
+@swag_from({
+    'tags': ['Jobs'],
+    'summary': '검색어 자동완성',
+    'parameters': [
+        {
+            'in': 'query',
+            'name': 'q',
+            'required': True,
+            'schema': {
+                'type': 'string'
+            },
+            'description': '자동완성할 접두어'
+        },
+        {
+            'in': 'query',
+            'name': 'limit',
+            'schema': {
+                'type': 'integer',
+                'default': 10,
+                'maximum': 50
+            }
+        }
+    ],
+    'responses': {
+        '200': {
+            'description': '빈도순 자동완성 후보',
+            'content': {
+                'application/json': {
+                    'schema': {
+                        'type': 'object',
+                        'properties': {
+                            'status': {
+                                'type': 'string',
+                                'example': 'success'
+                            },
+                            'data': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'text': {'type': 'string'},
+                                        'type': {
+                                            'type': 'string',
+                                            'enum': ['skill', 'sector', 'company', 'keyword']
+                                        },
+                                        'count': {'type': 'integer'}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+})
+def suggest_jobs():
+    """검색어 자동완성 API"""
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({
+                'status': 'error',
+                'message': '검색어를 입력해주세요.'
+            }), 400
+
+        limit = min(max(request.args.get('limit', 10, type=int), 1), 50)
+        result = job_service.suggest(query=query, limit=limit)
+
+        if result['status'] == 'success':
+            return jsonify(result), 200
+
+        return jsonify(result), 400
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@job_bp.route('/trending', methods=['GET'])
+@swag_from({
+    'tags': ['Jobs'],
+    'summary': '인기 급상승 채용공고 조회',
+    'description': '조회/북마크/지원 수와 게시 후 경과 시간으로 계산한 인기 급상승 공고 목록입니다. '
+                   '1분마다 미리 계산한 목록을 반환합니다. 액세스 토큰을 함께 보내면(선택) '
+                   '각 공고에 is_bookmarked/has_applied 플래그가 포함됩니다.',
+    'parameters': [
+        {
+            'in': 'query',
+            'name': 'limit',
+            'schema': {
+                'type': 'integer',
+                'default': 20,
+                'maximum': 50
+            }
+        }
+    ],
+    'responses': {
+        '200': {
+            'description': '인기 급상승 공고 목록',
+            'content': {
+                'application/json': {
+                    'schema': {
+                        'type': 'object',
+                        'properties': {
+                            'status': {
+                                'type': 'string',
+                                'example': 'success'
+                            },
+                            'data': {
+                                'type': 'array',
+                                'items': {
+                                    '$ref': '#/components/schemas/JobPosting'
+                                }
+                            },
+                            'refreshed_at': {
+                                'type': 'string',
+                                'format': 'date-time',
+                                'description': '목록을 계산한 시각'
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+})
+def get_trending_jobs():
+    """인기 급상승 채용공고 조회 API"""
+    try:
+        limit = min(max(request.args.get('limit', 20, type=int), 1), 50)
+        user_id = optional_user_id()
+        result = job_service.get_trending_jobs(limit=limit, user_id=user_id)
+
+        if result['status'] == 'success':
+            etag = make_etag('trending', result['refreshed_at'], limit, *user_etag_parts(user_id))
+            cached_response = not_modified(etag)
+            if cached_response:
+                return vary_on_user(cached_response)
+            return vary_on_user(with_etag(jsonify(result), etag)), 200
+
+        return jsonify(result), 400
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@job_bp.route('/batch', methods=['GET', 'POST'])
+@swag_from({
+    'tags': ['Jobs'],
+    'summary': '채용공고 일괄 상세 조회',
+    'description': '여러 채용공고의 상세 정보를 한 번에 조회합니다. GET은 ids 쿼리, POST는 JSON 본문을 사용합니다. (최대 50개)',
+    'parameters': [
+        {
+            'in': 'query',
+            'name': 'ids',
+            'schema': {
+                'type': 'string'
+            },
+            'description': 'Comma separated job ids (GET)'
+        }
+    ],
+    'requestBody': {
+        'required': False,
+        'content': {
+            'application/json': {
+                'schema': {
+                    'type': 'object',
+                    'properties': {
+                        'ids': {
+                            'type': 'array',
+                            'items': {'type': 'string'}
+                        }
+                    }
+                }
+            }
+        }
+    },
+    'responses': {
+        '200': {
+            'description': '요청 순서대로의 항목별 조회 결과',
+            'content': {
+                'application/json': {
+                    'schema': {
+                        'type': 'object',
+                        'properties': {
+                            'status': {
+                                'type': 'string',
+                                'example': 'success'
+                            },
+                            'data': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'job_id': {'type': 'string'},
+                                        'status': {
+                                            'type': 'string',
+                                            'enum': ['found', 'not_found', 'invalid_id']
+                                        },
+                                        'data': {
+                                            '$ref': '#/components/schemas/JobPosting'
+                                        }
+                                    }
+                                }
+                            },
+                            'summary': {
+                                'type': 'object',
+                                'properties': {
+                                    'requested': {'type': 'integer'},
+                                    'found': {'type': 'integer'}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+})
+def get_job_details():
+    """채용공고 일괄 상세 조회 API"""
+    try:
+        if request.method == 'POST':
+            data = request.get_json(silent=True) or {}
+            job_ids = data.get('ids')
+            if not isinstance(job_ids, list):
+                return jsonify({
+                    'status': 'error',
+                    'message': 'ids 배열을 입력해주세요.'
+                }), 400
+            job_ids = [str(job_id) for job_id in job_ids]
+        else:
+            ids = request.args.get('ids', '')
+            job_ids = ids.split(',') if ids else []
+
+        result = job_service.get_job_details(job_ids)
+
+        if result['status'] == 'success':
+            return jsonify(result), 200
+
+        return jsonify(result), 400
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@job_bp.route('/export', methods=['GET'])
+@jwt_required()
+@swag_from({
+    'tags': ['Jobs'],
+    'summary': '채용공고 전체 내보내기 (NDJSON)',
+    'description': '활성 채용공고를 updated_at 오름차순의 NDJSON으로 스트리밍합니다. '
+                   '마지막 줄의 updated_at을 다음 요청의 updated_since로 사용하면 증분 수집이 가능합니다.',
+    'security': [{'bearerAuth': []}],
+    'parameters': [
+        {
+            'in': 'query',
+            'name': 'updated_since',
+            'schema': {
+                'type': 'string',
+                'format': 'date-time'
+            },
+            'description': 'ISO 8601 timestamp; only postings updated at or after it'
+        },
+        {
+            'in': 'query',
+            'name': 'gzip',
+            'schema': {
+                'type': 'boolean',
+                'default': False
+            },
+            'description': 'Compress the stream with gzip'
+        }
+    ],
+    'responses': {
+        '200': {
+            'description': '한 줄에 채용공고 하나씩 담긴 NDJSON 스트림',
+            'content': {
+                'application/x-ndjson': {
+                    'schema': {
+                        'type': 'string'
+                    }
+                }
+            }
+        }
+    }
+})
+def export_jobs():
+    """채용공고 NDJSON 내보내기 API"""
+    try:
+        updated_since = request.args.get('updated_since')
+        if updated_since:
+            try:
+                updated_since = datetime.fromisoformat(updated_since.replace('Z', '+00:00'))
+            except ValueError:
+                return jsonify({
+                    'status': 'error',
+                    'message': 'updated_since는 ISO 8601 형식이어야 합니다.'
+                }), 400
+
+        compress = request.args.get('gzip', 'false').lower() in ('true', '1')
+        lines = job_service.iter_export_lines(updated_since=updated_since)
+
+        response = Response(
+            stream_with_context(ndjson_chunks(lines, compress=compress)),
+            mimetype='application/x-ndjson'
+        )
+        if compress:
+            response.headers['Content-Encoding'] = 'gzip'
+        return response
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@job_bp.route('/cache/stats', methods=['GET'])
+@jwt_required()
+@swag_from({
+    'tags': ['Jobs'],
+    'summary': '채용공고 상세 캐시 통계 조회',
+    'security': [{'bearerAuth': []}],
+    'responses': {
+        '200': {
+            'description': '캐시 적중/미스/제거 통계',
+            'content': {
+                'application/json': {
+                    'schema': {
+                        'type': 'object',
+                        'properties': {
+                            'status': {'type': 'string', 'example': 'success'},
+                            'data': {
+                                'type': 'object',
+                                'properties': {
+                                    'size': {'type': 'integer'},
+                                    'max_size': {'type': 'integer'},
+                                    'ttl_seconds': {'type': 'number'},
+                                    'hits': {'type': 'integer'},
+                                    'misses': {'type': 'integer'},
+                                    'hit_rate': {'type': 'number'},
+                                    'evictions': {'type': 'integer'},
+                                    'expirations': {'type': 'integer'},
+                                    'invalidations': {'type': 'integer'},
+                                    'single_flight': {
+                                        'type': 'object',
+                                        'properties': {
+                                            'in_flight': {'type': 'integer'},
+                                            'executions': {'type': 'integer'},
+                                            'shared': {'type': 'integer'}
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+})
+def get_cache_stats():
+    """채용공고 상세 캐시 통계 조회 API"""
+    try:
+        return jsonify({
+            'status': 'success',
+            'data': job_service.get_cache_stats()
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
 @job_bp.route('/<job_id>', methods=['GET'])
 @swag_from({
     'tags': ['Jobs'],
     'summary': '채용공고 상세 조회',
+    'description': 'ETag를 반환하며, If-None-Match가 일치하면 304 Not Modified로 응답합니다. 액세스 토큰을 함께 보내면(선택) 각 공고에 is_bookmarked/has_applied 플래그가 포함됩니다.',
     'parameters': [
         {
             'in': 'path',
@@ -232,19 +734,107 @@ def search_jobs():
 def get_job_detail(job_id):
     """채용공고 상세 조회 API"""
     try:
-        success, message, job = job_service.get_job_detail(job_id)
+        user_id = optional_user_id()
+        success, message, job = job_service.get_job_detail(job_id, user_id=user_id)
         
         if success:
-            return jsonify({
+            # 공고의 수정 시각과 카운터 버전(로그인 시 사용자 집합 버전)이 같으면
+            # 직렬화/전송 없이 304로 응답합니다
+            etag = make_etag('job', job['_id'], job.get('updated_at'), counter_version(),
+                             *user_etag_parts(user_id))
+            cached_response = not_modified(etag)
+            if cached_response:
+                return vary_on_user(cached_response)
+
+            payload = {
                 'status': 'success',
                 'data': job
-            }), 200
+            }
+            if user_id:
+                return vary_on_user(with_etag(jsonify(payload), etag)), 200
+
+            cached_response = cached_json_response(etag)
+            if cached_response:
+                return vary_on_user(with_etag(cached_response, etag)), 200
+
+            return vary_on_user(with_etag(cache_json_response(etag, payload), etag)), 200
         
         return jsonify({
             'status': 'error',
             'message': message
         }), 404
 
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@job_bp.route('/<job_id>/similar', methods=['GET'])
+@swag_from({
+    'tags': ['Jobs'],
+    'summary': '유사 채용공고 조회',
+    'parameters': [
+        {
+            'in': 'path',
+            'name': 'job_id',
+            'required': True,
+            'schema': {
+                'type': 'string'
+            }
+        },
+        {
+            'in': 'query',
+            'name': 'limit',
+            'schema': {
+                'type': 'integer',
+                'default': 10,
+                'maximum': 50
+            }
+        }
+    ],
+    'responses': {
+        '200': {
+            'description': '유사도 순 채용공고 목록 (similarity: 0~1)',
+            'content': {
+                'application/json': {
+                    'schema': {
+                        'type': 'object',
+                        'properties': {
+                            'status': {
+                                'type': 'string',
+                                'example': 'success'
+                            },
+                            'data': {
+                                'type': 'array',
+                                'items': {
+                                    '$ref': '#/components/schemas/JobPosting'
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+})
+def get_similar_jobs(job_id):
+    """유사 채용공고 조회 API"""
+    try:
+        limit = min(max(request.args.get('limit', 10, type=int), 1), 50)
+        success, message, jobs = job_service.get_similar_jobs(job_id, limit=limit)
+
+        if success:
+            return jsonify({
+                'status': 'success',
+                'data': jobs
+            }), 200
+
+        return jsonify({
+            'status': 'error',
+            'message': message
+        }), 404
+
     except Exception as e:
         return jsonify({
             'status': 'error',
@@ -1,52 +1,82 @@
-from typing import Dict, Tuple, Optional
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple, Optional
 from datetime import datetime, timedelta
 from bson import ObjectId
+from pymongo import InsertOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from .job_service import JobService
+from .user_job_sets import update_user_job_set, invalidate_user_job_sets
+from ..utils.documents import update_and_return
+
+STATS_WINDOW_DAYS = 30  # 일별 지원 현황을 유지하는 기간
+
+VALID_STATUSES = [
+    'applied',
+    'in_review',
+    'interview_scheduled',
+    'accepted',
+    'rejected',
+    'canceled'
+]
+
+# 지원 내역 조회/응답에서 제외하는 필드
+# 이력서 버전 이력은 resume_versions 컬렉션에 저장하며, 마이그레이션 전 문서에 남은 배열은 읽지 않습니다
+APPLICATION_PROJECTION = {'resume_versions': 0}
+
+# 이력서 버전 배열을 resume_versions 컬렉션으로 옮길 때 읽는 필드
+LEGACY_RESUME_PROJECTION = {'user_id': 1, 'resume_versions': 1, 'current_resume_url': 1, 'resume_url': 1}
+
+def _stats_key(value: str) -> str:
+    """통계 문서의 필드 이름으로 쓸 수 있도록 '.'과 선행 '$'를 치환합니다."""
+    key = str(value).replace('.', '\uff0e')
+    return '\uff04' + key[1:] if key.startswith('$') else key
+
+def _unstats_key(key: str) -> str:
+    """_stats_key로 치환한 필드 이름을 원래 값으로 되돌립니다."""
+    key = key.replace('\uff0e', '.')
+    return '$' + key[1:] if key.startswith('\uff04') else key
+
+def _job_category(job: Optional[Dict]) -> Optional[str]:
+    """통계에 사용할 채용공고 카테고리 (category가 없으면 직무 분야 sector)"""
+    if not job:
+        return None
+    return job.get('category') or job.get('sector') or None
 
 class ApplicationService:
     def __init__(self, db):
         self.db = db
+        self.job_service = JobService(db)
         self.ITEMS_PER_PAGE = 20
+        self.MAX_BULK_SIZE = 100  # 일괄 지원/상태 변경 요청당 최대 항목 수
+        self.STATS_BATCH_SIZE = 1000  # 통계 재구성 시 한 번에 처리할 지원 내역 수
+        self.RESUME_VERSIONS_PER_PAGE = 20
+        self.MIGRATION_BATCH_SIZE = 500  # 이력서 버전 마이그레이션 배치 크기
 
     def apply_job(self, user_id: str, job_id: str, data: Dict) -> Tuple[bool, str, Optional[Dict]]:
-        """채용공고 지원을 처리하는 메서드입니다."""
+        """
+        채용공고 지원을 처리하는 메서드입니다.
+        중복 지원은 (user_id, job_posting_id) 부분 유니크 인덱스로 막으므로 insert 한 번으로 처리합니다.
+        """
         try:
-            # 이미 지원한 공고인지 확인합니다
-            existing_application = self.db.applications.find_one({
-                'user_id': user_id,
-                'job_posting_id': job_id,
-                'status': {'$ne': 'canceled'}  # 취소된 지원은 제외
-            })
-            
-            if existing_application:
-                return False, "이미 지원한 채용공고입니다", None
-
-            # 채용공고가 존재하고 활성 상태인지 확인합니다
-            job = self.db.job_postings.find_one({
-                '_id': ObjectId(job_id),
-                'status': 'active'
-            })
+            # 채용공고가 존재하고 활성 상태인지 확인합니다 (활성 공고 캐시 사용)
+            job = self.job_service.get_active_job_summary(job_id)
             
             if not job:
                 return False, "채용공고를 찾을 수 없거나 비활성화되었습니다", None
 
             # 지원 데이터를 준비합니다
-            application_data = {
-                'user_id': user_id,
-                'job_posting_id': job_id,
-                'status': 'applied',
-                'resume_url': data.get('resume_url'),
-                'created_at': datetime.utcnow(),
-                'updated_at': datetime.utcnow(),
-                'resume_versions': [{
-                    'version': 1,
-                    'resume_url': data.get('resume_url'),
-                    'status': 'active',
-                    'created_at': datetime.utcnow()
-                }] if data.get('resume_url') else []
-            }
+            application_data = self._new_application(user_id, job_id, job, data)
             
-            result = self.db.applications.insert_one(application_data)
+            try:
+                result = self.db.applications.insert_one(application_data)
+            except DuplicateKeyError:
+                return False, "이미 지원한 채용공고입니다", None
+
+            self._insert_initial_resumes([application_data])
             application_data['_id'] = str(result.inserted_id)
+            self._record_application(user_id, application_data)
+            update_user_job_set(user_id, 'applied', [job_id], True)
+            self.job_service.record_popularity(job_id, 'application_count')
             
             return True, "채용공고 지원이 완료되었습니다", application_data
 
@@ -56,27 +86,17 @@ class ApplicationService:
     def cancel_application(self, user_id: str, application_id: str) -> Tuple[bool, str, Optional[Dict]]:
         """지원 취소를 처리하는 메서드입니다."""
         try:
-            # 지원 상태를 'canceled'로 업데이트합니다
-            result = self.db.applications.update_one(
+            # 지원 상태를 'canceled'로 업데이트하고 갱신된 지원 내역을 바로 받습니다
+            updated_application = self._change_status(
                 {
                     '_id': ObjectId(application_id),
                     'user_id': user_id,
                     'status': {'$ne': 'canceled'}
                 },
-                {
-                    '$set': {
-                        'status': 'canceled',
-                        'updated_at': datetime.utcnow(),
-                        'canceled_at': datetime.utcnow()
-                    }
-                }
+                'canceled'
             )
             
-            if result.modified_count:
-                updated_application = self.db.applications.find_one(
-                    {'_id': ObjectId(application_id)}
-                )
-                updated_application['_id'] = str(updated_application['_id'])
+            if updated_application:
                 return True, "지원이 취소되었습니다", updated_application
                 
             return False, "지원 내역을 찾을 수 없거나 이미 취소되었습니다", None
@@ -84,6 +104,261 @@ class ApplicationService:
         except Exception as e:
             return False, str(e), None
 
+    def _new_application(self, user_id: str, job_id: str, job: Dict, data: Dict) -> Dict:
+        """저장할 지원 문서를 생성합니다."""
+        now = datetime.utcnow()
+        return {
+            'user_id': user_id,
+            'job_posting_id': job_id,
+            'job_category': job['category'],  # 통계 집계를 위한 추가 정보
+            'status': 'applied',
+            'is_active': True,  # 취소되지 않은 지원 (중복 지원 방지 인덱스 대상)
+            'resume_url': data.get('resume_url'),
+            'current_resume_url': data.get('resume_url'),
+            'resume_version_count': 1 if data.get('resume_url') else 0,
+            'created_at': now,
+            'updated_at': now
+        }
+
+    @staticmethod
+    def _resume_version(application: Dict, version: int, resume_url: Optional[str],
+                        notes: Optional[str] = None, created_at: Optional[datetime] = None) -> Dict:
+        """resume_versions 컬렉션에 저장할 이력서 버전 문서를 생성합니다."""
+        return {
+            'application_id': str(application['_id']),
+            'user_id': application['user_id'],
+            'version': version,
+            'resume_url': resume_url,
+            'notes': notes,
+            'created_at': created_at or datetime.utcnow()
+        }
+
+    def _insert_initial_resumes(self, applications: List[Dict]) -> None:
+        """지원 시 첨부한 이력서를 1번 버전으로 저장합니다."""
+        versions = [
+            self._resume_version(app, 1, app['resume_url'], created_at=app['created_at'])
+            for app in applications if app.get('resume_url')
+        ]
+        if versions:
+            self.db.resume_versions.insert_many(versions, ordered=False)
+
+    @staticmethod
+    def _bulk_write_errors(e: BulkWriteError) -> Dict[int, int]:
+        """BulkWriteError에서 실패한 연산의 인덱스 -> 오류 코드를 추출합니다."""
+        return {error['index']: error['code'] for error in e.details.get('writeErrors', [])}
+
+    def apply_jobs_bulk(self, user_id: str, items: List[Dict]) -> Dict:
+        """
+        여러 채용공고에 한 번에 지원합니다.
+        채용공고는 한 번의 $in 쿼리로 확인하고, 지원은 bulk_write 한 번으로 저장하며
+        통계는 배치 단위로 한 번만 갱신합니다. 항목별 처리 결과를 요청 순서대로 반환합니다.
+
+        Parameters:
+            user_id (str): 사용자 ID
+            items (List[Dict]): [{'job_id': ..., 'resume_url': ...}, ...]
+        """
+        try:
+            if not items:
+                return {'status': 'error', 'message': "지원할 채용공고를 입력해주세요"}
+            if len(items) > self.MAX_BULK_SIZE:
+                return {
+                    'status': 'error',
+                    'message': f"한 번에 최대 {self.MAX_BULK_SIZE}개까지 지원할 수 있습니다"
+                }
+
+            job_ids = [str(item.get('job_id', '')) for item in items]
+            jobs = self.job_service.get_active_job_summaries(set(job_ids))
+
+            results = []
+            operations = []
+            pending = []  # (결과 인덱스, 지원 문서)
+            seen = set()
+            for job_id, item in zip(job_ids, items):
+                if not ObjectId.is_valid(job_id):
+                    results.append({'job_id': job_id, 'status': 'invalid_id',
+                                    'message': "유효하지 않은 채용공고 ID입니다"})
+                elif job_id not in jobs:
+                    results.append({'job_id': job_id, 'status': 'not_found',
+                                    'message': "채용공고를 찾을 수 없거나 비활성화되었습니다"})
+                elif job_id in seen:
+                    results.append({'job_id': job_id, 'status': 'duplicate',
+                                    'message': "이미 지원한 채용공고입니다"})
+                else:
+                    seen.add(job_id)
+                    application = self._new_application(user_id, job_id, jobs[job_id], item)
+                    operations.append(InsertOne(application))
+                    pending.append((len(results), application))
+                    results.append(None)
+
+            failed = {}
+            if operations:
+                try:
+                    self.db.applications.bulk_write(operations, ordered=False)
+                except BulkWriteError as e:
+                    failed = self._bulk_write_errors(e)
+
+            self._insert_initial_resumes([
+                application for op_index, (_, application) in enumerate(pending)
+                if op_index not in failed
+            ])
+
+            increments = Counter()
+            for op_index, (result_index, application) in enumerate(pending):
+                code = failed.get(op_index)
+                if code is None:
+                    self._add_application_increments(increments, application)
+                    self.job_service.record_popularity(application['job_posting_id'], 'application_count')
+                    results[result_index] = {'job_id': application['job_posting_id'], 'status': 'applied',
+                                             'application_id': str(application['_id'])}
+                elif code == 11000:
+                    results[result_index] = {'job_id': application['job_posting_id'], 'status': 'duplicate',
+                                             'message': "이미 지원한 채용공고입니다"}
+                else:
+                    results[result_index] = {'job_id': application['job_posting_id'], 'status': 'error',
+                                             'message': "지원 저장에 실패했습니다"}
+            self._update_statistics(user_id, increments)
+            update_user_job_set(
+                user_id, 'applied',
+                [result['job_id'] for result in results if result['status'] == 'applied'], True
+            )
+
+            applied = sum(1 for result in results if result['status'] == 'applied')
+            return {
+                'status': 'success',
+                'data': results,
+                'summary': {
+                    'requested': len(items),
+                    'applied': applied,
+                    'failed': len(items) - applied
+                }
+            }
+
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': f"일괄 지원 처리 중 오류가 발생했습니다: {str(e)}"
+            }
+
+    def update_statuses_bulk(self, user_id: str, updates: List[Dict]) -> Dict:
+        """
+        여러 지원 내역의 상태를 한 번에 변경합니다.
+        현재 상태를 한 번의 $in 쿼리로 읽은 뒤, 상태가 그 사이 바뀌지 않은 경우에만 갱신하는
+        조건부 UpdateOne들을 bulk_write로 실행합니다. 통계는 배치 단위로 한 번만 갱신합니다.
+
+        Parameters:
+            user_id (str): 사용자 ID
+            updates (List[Dict]): [{'application_id': ..., 'status': ...}, ...]
+        """
+        try:
+            if not updates:
+                return {'status': 'error', 'message': "변경할 지원 내역을 입력해주세요"}
+            if len(updates) > self.MAX_BULK_SIZE:
+                return {
+                    'status': 'error',
+                    'message': f"한 번에 최대 {self.MAX_BULK_SIZE}개까지 변경할 수 있습니다"
+                }
+
+            application_ids = [str(update.get('application_id', '')) for update in updates]
+            valid_ids = [ObjectId(application_id) for application_id in set(application_ids)
+                         if ObjectId.is_valid(application_id)]
+            current = {
+                str(app['_id']): app
+                for app in self.db.applications.find(
+                    {'_id': {'$in': valid_ids}, 'user_id': user_id}, {'status': 1, 'job_posting_id': 1}
+                )
+            }
+
+            now = datetime.utcnow()
+            results = []
+            operations = []
+            pending = []  # (결과 인덱스, 지원 ID, 이전 상태, 새 상태)
+            seen = set()
+            for application_id, update in zip(application_ids, updates):
+                status = update.get('status')
+                if status not in VALID_STATUSES:
+                    results.append({'application_id': application_id, 'status': 'invalid_status',
+                                    'message': "유효하지 않은 상태값입니다"})
+                elif application_id not in current:
+                    results.append({'application_id': application_id, 'status': 'not_found',
+                                    'message': "지원 내역을 찾을 수 없습니다"})
+                elif application_id in seen:
+                    results.append({'application_id': application_id, 'status': 'duplicate',
+                                    'message': "같은 지원 내역이 중복되었습니다"})
+                else:
+                    seen.add(application_id)
+                    previous_status = current[application_id].get('status')
+                    operations.append(UpdateOne(
+                        {'_id': ObjectId(application_id), 'user_id': user_id, 'status': previous_status},
+                        [{
+                            '$set': {
+                                'previous_status': '$status',
+                                'status': {'$literal': status},
+                                'is_active': status != 'canceled',
+                                'updated_at': now,
+                                f'{status}_at': now  # 상태별 타임스탬프
+                            }
+                        }]
+                    ))
+                    pending.append((len(results), application_id, previous_status, status))
+                    results.append(None)
+
+            failed = {}
+            matched = len(operations)
+            if operations:
+                try:
+                    matched = self.db.applications.bulk_write(operations, ordered=False).matched_count
+                except BulkWriteError as e:
+                    failed = self._bulk_write_errors(e)
+                    matched = e.details.get('nMatched', 0)
+
+            # 조회 이후 상태가 바뀌어 조건이 맞지 않은 항목이 있으면 이번 배치로 갱신된 항목을 확인합니다
+            updated_ids = None
+            if matched < len(operations) - len(failed):
+                updated_ids = {
+                    str(app['_id']) for app in self.db.applications.find(
+                        {'_id': {'$in': [ObjectId(item[1]) for item in pending]}, 'updated_at': now},
+                        {'_id': 1}
+                    )
+                }
+
+            increments = Counter()
+            for op_index, (result_index, application_id, previous_status, status) in enumerate(pending):
+                code = failed.get(op_index)
+                if code == 11000:
+                    results[result_index] = {'application_id': application_id, 'status': 'duplicate',
+                                             'message': "이미 지원한 채용공고입니다"}
+                elif code is not None or (updated_ids is not None and application_id not in updated_ids):
+                    results[result_index] = {'application_id': application_id, 'status': 'conflict',
+                                             'message': "상태 업데이트에 실패했습니다"}
+                else:
+                    self._add_status_change_increments(increments, previous_status, status)
+                    self._record_application_count(
+                        current[application_id].get('job_posting_id'), previous_status, status
+                    )
+                    results[result_index] = {'application_id': application_id, 'status': 'updated',
+                                             'previous_status': previous_status, 'new_status': status}
+            self._update_statistics(user_id, increments)
+            if increments:
+                # 상태 변경으로 취소/재지원된 공고를 반영하도록 사용자의 지원 집합을 다시 로드합니다
+                invalidate_user_job_sets(user_id)
+
+            updated = sum(1 for result in results if result['status'] == 'updated')
+            return {
+                'status': 'success',
+                'data': results,
+                'summary': {
+                    'requested': len(updates),
+                    'updated': updated,
+                    'failed': len(updates) - updated
+                }
+            }
+
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': f"일괄 상태 변경 중 오류가 발생했습니다: {str(e)}"
+            }
+
     def get_user_applications(
         self, 
         user_id: str, 
@@ -114,20 +389,17 @@ class ApplicationService:
             total_pages = (total_items + self.ITEMS_PER_PAGE - 1) // self.ITEMS_PER_PAGE
             skip = (page - 1) * self.ITEMS_PER_PAGE
             
-            # 지원 내역을 조회합니다
-            applications = list(self.db.applications.find(query)
+            # 지원 내역을 조회합니다 (이력서 버전 이력은 제외)
+            applications = list(self.db.applications.find(query, APPLICATION_PROJECTION)
                               .sort(sort_field, sort_order)
                               .skip(skip)
                               .limit(self.ITEMS_PER_PAGE))
 
-            # 채용공고 정보를 함께 반환합니다
+            # 페이지의 채용공고 정보를 한 번의 쿼리로 가져와 함께 반환합니다
+            jobs = self.job_service.get_job_cards(app['job_posting_id'] for app in applications)
             for app in applications:
-                app['_id'] = str(app['_id'])
-                job = self.db.job_postings.find_one(
-                    {'_id': ObjectId(app['job_posting_id'])}
-                )
+                job = jobs.get(str(app['job_posting_id']))
                 if job:
-                    job['_id'] = str(job['_id'])
                     app['job_posting'] = job
 
             return {
@@ -155,125 +427,247 @@ class ApplicationService:
     ) -> Tuple[bool, str, Optional[Dict]]:
         """지원 상태를 업데이트하는 메서드입니다."""
         try:
-            valid_statuses = [
-                'applied', 
-                'in_review', 
-                'interview_scheduled', 
-                'accepted', 
-                'rejected', 
-                'canceled'
-            ]
-            
-            if status not in valid_statuses:
+            if status not in VALID_STATUSES:
                 return False, "유효하지 않은 상태값입니다", None
 
-            # 지원 내역을 확인합니다
-            application = self.db.applications.find_one({
-                '_id': ObjectId(application_id),
-                'user_id': user_id
-            })
+            # 상태를 업데이트하고 갱신된 지원 내역을 바로 받습니다
+            try:
+                updated_application = self._change_status(
+                    {'_id': ObjectId(application_id), 'user_id': user_id},
+                    status
+                )
+            except DuplicateKeyError:
+                # 취소된 지원을 되살릴 때 같은 공고에 다른 활성 지원이 있는 경우
+                return False, "이미 지원한 채용공고입니다", None
             
-            if not application:
+            if not updated_application:
                 return False, "지원 내역을 찾을 수 없습니다", None
 
-            # 상태를 업데이트합니다
-            result = self.db.applications.update_one(
-                {'_id': ObjectId(application_id)},
-                {
-                    '$set': {
-                        'status': status,
-                        'updated_at': datetime.utcnow(),
-                        f'{status}_at': datetime.utcnow()  # 상태별 타임스탬프
-                    }
-                }
-            )
-            
-            if result.modified_count:
-                updated_application = self.db.applications.find_one(
-                    {'_id': ObjectId(application_id)}
-                )
-                updated_application['_id'] = str(updated_application['_id'])
-                return True, "지원 상태가 업데이트되었습니다", updated_application
-                
-            return False, "상태 업데이트에 실패했습니다", None
+            return True, "지원 상태가 업데이트되었습니다", updated_application
 
         except Exception as e:
             return False, str(e), None
 
+    def _change_status(self, query: Dict, status: str) -> Optional[Dict]:
+        """
+        지원 상태를 변경하고 변경된 지원 내역을 반환합니다 (일치하는 지원이 없으면 None).
+        파이프라인 업데이트로 이전 상태를 previous_status에 기록하여 한 번의 왕복으로 통계까지 반영합니다.
+        """
+        now = datetime.utcnow()
+        application = update_and_return(
+            self.db.applications,
+            query,
+            [{
+                '$set': {
+                    'previous_status': '$status',
+                    'status': {'$literal': status},
+                    'is_active': status != 'canceled',
+                    'updated_at': now,
+                    f'{status}_at': now  # 상태별 타임스탬프
+                }
+            }],
+            projection=APPLICATION_PROJECTION
+        )
+        if application:
+            self._record_status_change(
+                application['user_id'], application.get('previous_status'), status
+            )
+            update_user_job_set(
+                application['user_id'], 'applied', [application['job_posting_id']], status != 'canceled'
+            )
+            self._record_application_count(
+                application['job_posting_id'], application.get('previous_status'), status
+            )
+        return application
+
+    def _record_application_count(self, job_id: Optional[str], previous_status: Optional[str],
+                                  status: str) -> None:
+        """취소/재지원으로 활성 지원 여부가 바뀌면 공고의 지원 수(application_count)를 증감합니다."""
+        delta = (status != 'canceled') - (previous_status != 'canceled')
+        if job_id and delta:
+            self.job_service.record_popularity(job_id, 'application_count', delta)
+
+    def backfill_active_flags(self) -> int:
+        """is_active 필드가 없는 기존 지원 내역에 취소 여부를 반영합니다. 갱신된 건수를 반환합니다."""
+        missing = {'is_active': {'$exists': False}}
+        modified = self.db.applications.update_many(
+            {**missing, 'status': {'$ne': 'canceled'}}, {'$set': {'is_active': True}}
+        ).modified_count
+        modified += self.db.applications.update_many(
+            {**missing, 'status': 'canceled'}, {'$set': {'is_active': False}}
+        ).modified_count
+        return modified
+
+    def _update_statistics(self, user_id: str, increments: Dict) -> None:
+        """
+        사용자 통계 문서의 카운터를 원자적으로 증감합니다.
+        통계 문서가 없던 사용자(통계 도입 전에 지원한 사용자 포함)는 upsert로 이번 증감분만 담긴
+        문서가 생성되므로, 생성된 경우 지원 내역 전체로 다시 집계합니다 (이번 변경도 포함됩니다).
+        """
+        increments = {key: value for key, value in increments.items() if value}
+        if not increments:
+            return
+        result = self.db.application_stats.update_one(
+            {'_id': user_id},
+            {'$inc': increments, '$set': {'updated_at': datetime.utcnow()}},
+            upsert=True
+        )
+        if result.upserted_id is not None:
+            self.rebuild_statistics(user_id)
+
+    @staticmethod
+    def _add_application_increments(increments: Counter, application: Dict) -> None:
+        """새 지원 내역에 해당하는 통계 증감분을 누적합니다."""
+        increments['total'] += 1
+        increments[f"status_counts.{_stats_key(application['status'])}"] += 1
+        increments[f"daily_counts.{application['created_at'].strftime('%Y-%m-%d')}"] += 1
+        if application.get('job_category'):
+            increments[f"category_counts.{_stats_key(application['job_category'])}"] += 1
+
+    @staticmethod
+    def _add_status_change_increments(increments: Counter, old_status: Optional[str],
+                                      new_status: str) -> None:
+        """지원 상태 변경에 해당하는 통계 증감분을 누적합니다."""
+        if old_status == new_status:
+            return
+        increments[f'status_counts.{_stats_key(new_status)}'] += 1
+        if old_status:
+            increments[f'status_counts.{_stats_key(old_status)}'] -= 1
+
+    def _record_application(self, user_id: str, application: Dict) -> None:
+        """새 지원 내역을 통계에 반영합니다."""
+        increments = Counter()
+        self._add_application_increments(increments, application)
+        self._update_statistics(user_id, increments)
+
+    def _record_status_change(self, user_id: str, old_status: Optional[str], new_status: str) -> None:
+        """지원 상태 변경을 통계에 반영합니다."""
+        increments = Counter()
+        self._add_status_change_increments(increments, old_status, new_status)
+        self._update_statistics(user_id, increments)
+
+    def _empty_statistics(self, user_id: str) -> Dict:
+        return {
+            '_id': user_id,
+            'total': 0,
+            'status_counts': {},
+            'daily_counts': {},
+            'category_counts': {},
+            'updated_at': datetime.utcnow()
+        }
+
+    def _resolve_categories(self, applications: List[Dict]) -> None:
+        """job_category가 없는 (이전에 저장된) 지원 내역의 카테고리를 한 번의 쿼리로 채웁니다."""
+        missing = {
+            app['job_posting_id'] for app in applications
+            if 'job_category' not in app and ObjectId.is_valid(str(app.get('job_posting_id')))
+        }
+        if not missing:
+            return
+
+        jobs = self.db.job_postings.find(
+            {'_id': {'$in': [ObjectId(str(job_id)) for job_id in missing]}},
+            {'category': 1, 'sector': 1}
+        )
+        categories = {str(job['_id']): _job_category(job) for job in jobs}
+        for app in applications:
+            if 'job_category' not in app:
+                app['job_category'] = categories.get(str(app.get('job_posting_id')))
+
+    def _accumulate_statistics(self, stats: Dict[str, Dict], applications: List[Dict],
+                               since: datetime) -> None:
+        """지원 내역 배치를 사용자별 통계 문서에 누적합니다."""
+        self._resolve_categories(applications)
+        for app in applications:
+            doc = stats.setdefault(app['user_id'], self._empty_statistics(app['user_id']))
+            doc['total'] += 1
+
+            status = _stats_key(app.get('status'))
+            doc['status_counts'][status] = doc['status_counts'].get(status, 0) + 1
+
+            created_at = app.get('created_at')
+            if created_at and created_at >= since:
+                day = created_at.strftime('%Y-%m-%d')
+                doc['daily_counts'][day] = doc['daily_counts'].get(day, 0) + 1
+
+            if app.get('job_category'):
+                category = _stats_key(app['job_category'])
+                doc['category_counts'][category] = doc['category_counts'].get(category, 0) + 1
+
+    def _write_statistics(self, docs: Iterable[Dict]) -> None:
+        operations = []
+        for doc in docs:
+            operations.append(ReplaceOne({'_id': doc['_id']}, doc, upsert=True))
+            if len(operations) >= self.STATS_BATCH_SIZE:
+                self.db.application_stats.bulk_write(operations, ordered=False)
+                operations = []
+        if operations:
+            self.db.application_stats.bulk_write(operations, ordered=False)
+
+    def rebuild_statistics(self, user_id: Optional[str] = None) -> int:
+        """
+        지원 내역 전체를 다시 집계하여 사용자별 통계 문서를 재구성합니다.
+        user_id를 지정하면 해당 사용자만 재구성하며, 재구성한 사용자 수를 반환합니다.
+        """
+        since = datetime.utcnow() - timedelta(days=STATS_WINDOW_DAYS)
+        query = {'user_id': user_id} if user_id else {}
+        applications = self.db.applications.find(
+            query,
+            {'user_id': 1, 'status': 1, 'created_at': 1, 'job_posting_id': 1, 'job_category': 1},
+            batch_size=self.STATS_BATCH_SIZE
+        )
+
+        stats: Dict[str, Dict] = {}
+        batch = []
+        for app in applications:
+            batch.append(app)
+            if len(batch) >= self.STATS_BATCH_SIZE:
+                self._accumulate_statistics(stats, batch, since)
+                batch = []
+        if batch:
+            self._accumulate_statistics(stats, batch, since)
+
+        if user_id and user_id not in stats:
+            stats[user_id] = self._empty_statistics(user_id)
+
+        self._write_statistics(stats.values())
+        return len(stats)
+
     def get_application_statistics(self, user_id: str) -> Tuple[bool, str, Optional[Dict]]:
-        """사용자의 지원 통계를 조회하는 메서드입니다."""
+        """사용자의 지원 통계를 조회하는 메서드입니다 (지원/상태 변경 시 갱신되는 통계 문서를 읽습니다)."""
         try:
-            # 상태별 통계를 집계합니다
-            status_pipeline = [
-                {'$match': {'user_id': user_id}},
-                {
-                    '$group': {
-                        '_id': '$status',
-                        'count': {'$sum': 1}
-                    }
-                }
-            ]
-            status_stats = list(self.db.applications.aggregate(status_pipeline))
-            
-            # 최근 30일간의 지원 현황을 조회합니다
-            thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-            daily_pipeline = [
-                {
-                    '$match': {
-                        'user_id': user_id,
-                        'created_at': {'$gte': thirty_days_ago}
-                    }
-                },
-                {
-                    '$group': {
-                        '_id': {
-                            '$dateToString': {
-                                'format': '%Y-%m-%d',
-                                'date': '$created_at'
-                            }
-                        },
-                        'count': {'$sum': 1}
-                    }
-                },
-                {'$sort': {'_id': 1}}
-            ]
-            daily_stats = list(self.db.applications.aggregate(daily_pipeline))
+            stats = self.db.application_stats.find_one({'_id': user_id})
+            if stats is None:
+                # 통계 문서가 아직 없는 사용자는 지원 내역으로 한 번 재구성합니다
+                self.rebuild_statistics(user_id)
+                stats = self.db.application_stats.find_one({'_id': user_id}) or self._empty_statistics(user_id)
 
-            # 카테고리별 지원 현황을 집계합니다
-            category_pipeline = [
-                {'$match': {'user_id': user_id}},
-                {
-                    '$lookup': {
-                        'from': 'job_postings',
-                        'localField': 'job_posting_id',
-                        'foreignField': '_id',
-                        'as': 'job'
-                    }
-                },
-                {'$unwind': '$job'},
-                {
-                    '$group': {
-                        '_id': '$job.category',
-                        'count': {'$sum': 1}
-                    }
-                }
-            ]
-            category_stats = list(self.db.applications.aggregate(category_pipeline))
+            # 최근 30일이 지난 일별 카운트는 응답에서 제외하고 문서에서도 정리합니다
+            cutoff = (datetime.utcnow() - timedelta(days=STATS_WINDOW_DAYS)).strftime('%Y-%m-%d')
+            daily_counts = stats.get('daily_counts', {})
+            expired = [day for day in daily_counts if day < cutoff]
+            if expired:
+                self.db.application_stats.update_one(
+                    {'_id': user_id},
+                    {'$unset': {f'daily_counts.{day}': '' for day in expired}}
+                )
 
             # 통계 데이터를 구성합니다
             statistics = {
-                'total_applications': sum(stat['count'] for stat in status_stats),
+                'total_applications': stats.get('total', 0),
                 'status_distribution': {
-                    stat['_id']: stat['count'] for stat in status_stats
+                    _unstats_key(status): count
+                    for status, count in stats.get('status_counts', {}).items() if count
                 },
                 'daily_applications': [
                     {
-                        'date': stat['_id'],
-                        'count': stat['count']
-                    } for stat in daily_stats
+                        'date': day,
+                        'count': count
+                    } for day, count in sorted(daily_counts.items()) if day >= cutoff
                 ],
                 'category_distribution': {
-                    stat['_id']: stat['count'] for stat in category_stats
+                    _unstats_key(category): count
+                    for category, count in stats.get('category_counts', {}).items() if count
                 }
             }
             
@@ -288,47 +682,188 @@ class ApplicationService:
         application_id: str, 
         resume_data: Dict
     ) -> Tuple[bool, str, Optional[Dict]]:
-        """지원 이력서를 관리하는 메서드입니다."""
+        """
+        지원 이력서를 관리하는 메서드입니다.
+        지원 문서에는 현재 이력서와 버전 수만 유지하고, 각 버전은 resume_versions 컬렉션에 저장합니다.
+        """
         try:
-            # 지원 내역을 확인합니다
-            application = self.db.applications.find_one({
+            # 버전 수를 증가시키고 현재 이력서를 교체합니다 (증가된 버전 수가 새 버전 번호)
+            # 버전 배열이 남아 있는(마이그레이션 전) 지원은 조건에서 제외하고, 먼저 옮긴 뒤 다시 시도합니다
+            now = datetime.utcnow()
+            query = {
                 '_id': ObjectId(application_id),
-                'user_id': user_id
-            })
+                'user_id': user_id,
+                'resume_versions': {'$exists': False}
+            }
+            update = {
+                '$inc': {'resume_version_count': 1},
+                '$set': {
+                    'current_resume_url': resume_data.get('resume_url'),
+                    'updated_at': now
+                }
+            }
+            updated_application = update_and_return(
+                self.db.applications, query, update, projection=APPLICATION_PROJECTION
+            )
+
+            if not updated_application and self._migrate_legacy_resumes(user_id, application_id):
+                updated_application = update_and_return(
+                    self.db.applications, query, update, projection=APPLICATION_PROJECTION
+                )
             
-            if not application:
+            if not updated_application:
                 return False, "지원 내역을 찾을 수 없습니다", None
 
-            # 새로운 이력서 버전을 생성합니다
-            current_versions = application.get('resume_versions', [])
-            new_version = {
-                'version': len(current_versions) + 1,
-                'resume_url': resume_data.get('resume_url'),
-                'status': 'active',
-                'created_at': datetime.utcnow(),
-                'notes': resume_data.get('notes')
-            }
+            version = self._resume_version(
+                updated_application,
+                updated_application['resume_version_count'],
+                resume_data.get('resume_url'),
+                resume_data.get('notes'),
+                now
+            )
+            self.db.resume_versions.insert_one(version)
+            version['_id'] = str(version['_id'])
+            updated_application['current_resume_version'] = version
+            return True, "이력서가 업데이트되었습니다", updated_application
 
-            # 기존 이력서를 보관하고 새 버전을 추가합니다
-            result = self.db.applications.update_one(
-                {'_id': ObjectId(application_id)},
-                {
-                    '$push': {'resume_versions': new_version},
-                    '$set': {
-                        'current_resume_url': resume_data.get('resume_url'),
-                        'updated_at': datetime.utcnow()
-                    }
-                }
+        except Exception as e:
+            return False, str(e), None
+
+    def get_resume_versions(self, user_id: str, application_id: str, page: int = 1) -> Dict:
+        """
+        지원 이력서의 버전 이력을 최신 버전부터 페이지 단위로 조회합니다.
+        전체 건수는 지원 문서의 버전 수를 사용하므로 별도의 count 쿼리가 없습니다.
+        """
+        try:
+            application = self.db.applications.find_one(
+                {'_id': ObjectId(application_id), 'user_id': user_id},
+                {'resume_version_count': 1}
             )
-            
-            if result.modified_count:
-                updated_application = self.db.applications.find_one(
-                    {'_id': ObjectId(application_id)}
-                )
-                updated_application['_id'] = str(updated_application['_id'])
-                return True, "이력서가 업데이트되었습니다", updated_application
-                
-            return False, "이력서 업데이트에 실패했습니다", None
+            if not application:
+                return {
+                    'status': 'error',
+                    'message': "지원 내역을 찾을 수 없습니다"
+                }
+
+            total_items = application.get('resume_version_count', 0)
+            total_pages = (total_items + self.RESUME_VERSIONS_PER_PAGE - 1) // self.RESUME_VERSIONS_PER_PAGE
+            skip = (page - 1) * self.RESUME_VERSIONS_PER_PAGE
+
+            versions = list(self.db.resume_versions.find(
+                {'application_id': application_id},
+                {'application_id': 0, 'user_id': 0}
+            ).sort('version', -1).skip(skip).limit(self.RESUME_VERSIONS_PER_PAGE))
+
+            for version in versions:
+                version['status'] = 'active' if version['version'] == total_items else 'archived'
+
+            return {
+                'status': 'success',
+                'data': versions,
+                'pagination': {
+                    'currentPage': page,
+                    'totalPages': total_pages,
+                    'totalItems': total_items,
+                    'perPage': self.RESUME_VERSIONS_PER_PAGE
+                }
+            }
 
         except Exception as e:
-            return False, str(e), None
\ No newline at end of file
+            return {
+                'status': 'error',
+                'message': str(e)
+            }
+
+    def _legacy_resume_ops(self, application: Dict) -> Tuple[List[UpdateOne], UpdateOne]:
+        """
+        지원 문서의 이력서 버전 배열을 옮기는 연산들을 생성합니다.
+        (resume_versions 컬렉션 upsert 목록, 지원 문서에서 배열을 제거하고 버전 수를 기록하는 연산)
+        """
+        versions = application.get('resume_versions') or []
+        version_numbers = [entry.get('version') or index for index, entry in enumerate(versions, start=1)]
+        version_ops = []
+        for number, entry in zip(version_numbers, versions):
+            version = self._resume_version(
+                application,
+                number,
+                entry.get('resume_url'),
+                entry.get('notes'),
+                entry.get('created_at')
+            )
+            version_ops.append(UpdateOne(
+                {'application_id': version['application_id'], 'version': version['version']},
+                {'$setOnInsert': version},
+                upsert=True
+            ))
+
+        current_resume_url = (
+            application.get('current_resume_url')
+            or (versions[-1].get('resume_url') if versions else application.get('resume_url'))
+        )
+        application_op = UpdateOne(
+            {'_id': application['_id']},
+            {
+                '$set': {
+                    'resume_version_count': max(version_numbers, default=0),
+                    'current_resume_url': current_resume_url
+                },
+                '$unset': {'resume_versions': ''}
+            }
+        )
+        return version_ops, application_op
+
+    def _migrate_legacy_resumes(self, user_id: str, application_id: str) -> bool:
+        """
+        마이그레이션 전의 지원 문서(이력서 버전 배열 보유)를 바로 옮깁니다.
+        새 버전이 기존 버전 번호와 겹치지 않도록 이력서를 갱신하기 전에 호출하며,
+        옮길 배열이 있었으면 True를 반환합니다.
+        """
+        application = self.db.applications.find_one(
+            {'_id': ObjectId(application_id), 'user_id': user_id, 'resume_versions': {'$exists': True}},
+            LEGACY_RESUME_PROJECTION
+        )
+        if not application:
+            return False
+
+        version_ops, application_op = self._legacy_resume_ops(application)
+        if version_ops:
+            self.db.resume_versions.bulk_write(version_ops, ordered=False)
+        self.db.applications.bulk_write([application_op])
+        return True
+
+    def migrate_resume_versions(self) -> int:
+        """
+        지원 문서에 배열로 저장된 이력서 버전(resume_versions)을 resume_versions 컬렉션으로 옮기고
+        지원 문서에는 현재 이력서와 버전 수만 남깁니다. 옮긴 지원 내역 수를 반환합니다.
+        버전 문서는 (application_id, version) 기준으로 upsert하므로 다시 실행해도 안전합니다.
+        """
+        migrated = 0
+        applications = self.db.applications.find(
+            {'resume_versions': {'$exists': True}},
+            LEGACY_RESUME_PROJECTION,
+            batch_size=self.MIGRATION_BATCH_SIZE
+        )
+
+        version_ops: List[UpdateOne] = []
+        application_ops: List[UpdateOne] = []
+
+        def flush():
+            # 버전을 먼저 저장한 뒤 지원 문서의 배열을 제거합니다
+            if version_ops:
+                self.db.resume_versions.bulk_write(version_ops, ordered=False)
+                version_ops.clear()
+            if application_ops:
+                self.db.applications.bulk_write(application_ops, ordered=False)
+                application_ops.clear()
+
+        for application in applications:
+            application_versions, application_op = self._legacy_resume_ops(application)
+            version_ops.extend(application_versions)
+            application_ops.append(application_op)
+            migrated += 1
+
+            if len(application_ops) >= self.MIGRATION_BATCH_SIZE:
+                flush()
+
+        flush()
+        return migrated
@@ -2,6 +2,10 @@ from datetime import datetime
 from typing import Dict, Optional, Tuple
 from bson import ObjectId
 from ..utils.auth_utils import AuthUtils
+from ..utils.documents import serialize_document, update_and_return
+
+# 프로필 응답에서 제외하는 민감한 필드
+PRIVATE_USER_PROJECTION = {'password': 0, 'refresh_token': 0}
 
 class AuthService:
    def __init__(self, db):
@@ -84,15 +88,12 @@ class AuthService:
    def get_profile(self, user_id: str) -> Tuple[bool, str, Optional[Dict]]:
        """사용자 프로필 조회"""
        try:
-           user = self.db.users.find_one({'_id': ObjectId(user_id)})
+           # 비밀번호, refresh token 등 민감한 정보는 조회하지 않습니다
+           user = self.db.users.find_one({'_id': ObjectId(user_id)}, PRIVATE_USER_PROJECTION)
            if not user:
                return False, "User not found", None
            
-           user['_id'] = str(user['_id'])
-           del user['password']  # 민감한 정보 제거
-           if 'refresh_token' in user:
-               del user['refresh_token']  # refresh token도 제거
-           return True, "Profile retrieved successfully", user
+           return True, "Profile retrieved successfully", serialize_document(user)
            
        except Exception as e:
            return False, str(e), None
@@ -100,16 +101,16 @@ class AuthService:
    def update_profile(self, user_id: str, update_data: Dict) -> Tuple[bool, str, Optional[Dict]]:
        """프로필 업데이트"""
        try:
-           user = self.db.users.find_one({'_id': ObjectId(user_id)})
-           if not user:
-               return False, "User not found", None
-
            # 비밀번호 변경 처리
            if 'new_password' in update_data:
                # 현재 비밀번호 확인
                if 'current_password' not in update_data:
                    return False, "Current password is required", None
                
+               user = self.db.users.find_one({'_id': ObjectId(user_id)}, {'password': 1})
+               if not user:
+                   return False, "User not found", None
+
                if not self.auth_utils.verify_password(update_data['current_password'], user['password']):
                    return False, "Current password is incorrect", None
                
@@ -130,20 +131,18 @@ class AuthService:
 
            update_data['updated_at'] = datetime.utcnow()
 
-           result = self.db.users.update_one(
+           # 갱신된 프로필을 다시 조회하지 않고 바로 받습니다 (민감한 필드 제외)
+           updated_user = update_and_return(
+               self.db.users,
                {'_id': ObjectId(user_id)},
-               {'$set': update_data}
+               {'$set': update_data},
+               projection=PRIVATE_USER_PROJECTION
            )
 
-           if result.modified_count:
-               updated_user = self.db.users.find_one({'_id': ObjectId(user_id)})
-               updated_user['_id'] = str(updated_user['_id'])
-               del updated_user['password']
-               if 'refresh_token' in updated_user:
-                   del updated_user['refresh_token']
+           if updated_user:
                return True, "Profile updated successfully", updated_user
 
-           return False, "No changes made", None
+           return False, "User not found", None
 
        except Exception as e:
            return False, str(e), None
@@ -1,10 +1,13 @@
 from typing import Dict, Tuple, Optional, List
 from datetime import datetime
-from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+from .job_service import JobService
+from .user_job_sets import update_user_job_set
 
 class BookmarkService:
     def __init__(self, db):
         self.db = db
+        self.job_service = JobService(db)
         self.ITEMS_PER_PAGE = 20
 
     def toggle_bookmark(self, user_id: str, job_id: str) -> Tuple[bool, str, Optional[Dict]]:
@@ -19,47 +22,83 @@ class BookmarkService:
             Tuple[bool, str, Optional[Dict]]: 성공 여부, 메시지, 북마크 데이터
         """
         try:
-            # 채용공고 존재 여부와 상태를 확인합니다
-            job = self.db.job_postings.find_one({
-                '_id': ObjectId(job_id),
-                'status': 'active'
-            })
+            # 채용공고 존재 여부와 상태를 확인합니다 (활성 공고 캐시 사용)
+            job = self.job_service.get_active_job_summary(job_id)
             
             if not job:
                 return False, "채용공고를 찾을 수 없거나 비활성화되었습니다", None
 
-            # 기존 북마크를 확인합니다
-            existing_bookmark = self.db.bookmarks.find_one({
-                'user_id': user_id,
-                'job_posting_id': job_id
-            })
+            # 기존 북마크가 있으면 바로 삭제합니다 (조회 없이 한 번의 연산)
+            removed_bookmark = self.db.bookmarks.find_one_and_delete(
+                {'user_id': user_id, 'job_posting_id': job_id},
+                projection={'_id': 1}
+            )
             
-            if existing_bookmark:
-                # 북마크가 이미 존재하면 제거합니다
-                self.db.bookmarks.delete_one({'_id': existing_bookmark['_id']})
+            if removed_bookmark:
+                update_user_job_set(user_id, 'bookmarked', [job_id], False)
+                self.job_service.record_popularity(job_id, 'bookmark_count', -1)
                 return True, "북마크가 성공적으로 제거되었습니다", {
                     'action': 'removed',
-                    'bookmark_id': str(existing_bookmark['_id'])
-                }
-            else:
-                # 새로운 북마크를 추가합니다
-                bookmark_data = {
-                    'user_id': user_id,
-                    'job_posting_id': job_id,
-                    'created_at': datetime.utcnow(),
-                    'job_category': job.get('category'),  # 필터링을 위한 추가 정보
-                    'company_id': job.get('company_id')
+                    'bookmark_id': str(removed_bookmark['_id'])
                 }
+
+            # 없으면 새로운 북마크를 추가합니다
+            # (user_id, job_posting_id) 유니크 인덱스가 동시 요청에 의한 중복 저장을 막습니다
+            bookmark_data = {
+                'user_id': user_id,
+                'job_posting_id': job_id,
+                'created_at': datetime.utcnow(),
+                'job_category': job['category'],  # 필터링을 위한 추가 정보
+                'company_id': job['company_id']
+            }
+            try:
                 result = self.db.bookmarks.insert_one(bookmark_data)
-                bookmark_data['_id'] = str(result.inserted_id)
-                return True, "북마크가 성공적으로 추가되었습니다", {
-                    'action': 'added',
-                    'bookmark': bookmark_data
-                }
+            except DuplicateKeyError:
+                # 동시에 들어온 다른 요청이 먼저 추가한 경우 해당 북마크를 반환합니다
+                bookmark_data = self.db.bookmarks.find_one(
+                    {'user_id': user_id, 'job_posting_id': job_id}
+                )
+                if not bookmark_data:
+                    return False, "북마크 처리 중 충돌이 발생했습니다. 다시 시도해주세요", None
+                result = None
+
+            if result is not None:
+                bookmark_data['_id'] = result.inserted_id
+                self.job_service.record_popularity(job_id, 'bookmark_count')
+            bookmark_data['_id'] = str(bookmark_data['_id'])
+            update_user_job_set(user_id, 'bookmarked', [job_id], True)
+            return True, "북마크가 성공적으로 추가되었습니다", {
+                'action': 'added',
+                'bookmark': bookmark_data
+            }
 
         except Exception as e:
             return False, f"북마크 처리 중 오류가 발생했습니다: {str(e)}", None
 
+    def remove_duplicate_bookmarks(self) -> int:
+        """
+        같은 사용자/채용공고의 중복 북마크를 가장 먼저 생성된 하나만 남기고 삭제합니다.
+        유니크 인덱스를 생성하기 전에 실행하며, 삭제된 북마크 수를 반환합니다.
+        """
+        duplicates = self.db.bookmarks.aggregate([
+            {'$sort': {'created_at': 1}},
+            {
+                '$group': {
+                    '_id': {'user_id': '$user_id', 'job_posting_id': '$job_posting_id'},
+                    'ids': {'$push': '$_id'},
+                    'count': {'$sum': 1}
+                }
+            },
+            {'$match': {'count': {'$gt': 1}}}
+        ], allowDiskUse=True)
+
+        removed = 0
+        for duplicate in duplicates:
+            removed += self.db.bookmarks.delete_many(
+                {'_id': {'$in': duplicate['ids'][1:]}}
+            ).deleted_count
+        return removed
+
     def get_user_bookmarks(
         self,
         user_id: str,
@@ -114,13 +153,15 @@ class BookmarkService:
                            .skip(skip)
                            .limit(self.ITEMS_PER_PAGE))
 
-            # 채용공고 정보를 포함시킵니다
+            # 페이지의 채용공고 정보를 한 번의 쿼리로 가져와 포함시킵니다
+            jobs = self.job_service.get_job_cards(
+                bookmark['job_posting_id'] for bookmark in bookmarks
+            )
             for bookmark in bookmarks:
-                bookmark['_id'] = str(bookmark['_id'])
-                job = self.db.job_postings.find_one({'_id': ObjectId(bookmark['job_posting_id'])})
-                if job:
-                    job['_id'] = str(job['_id'])
-                    bookmark['job_posting'] = job
+                # 삭제된 채용공고는 job_posting을 None으로, job_posting_available을 False로 표시합니다
+                job = jobs.get(str(bookmark['job_posting_id']))
+                bookmark['job_posting'] = job
+                bookmark['job_posting_available'] = job is not None
 
             return {
                 'status': 'success',
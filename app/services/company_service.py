@@ -0,0 +1,97 @@
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+from bson import ObjectId
+from pymongo import UpdateMany
+from ..models.init_db import bump_collection_version
+
+class CompanyService:
+    def __init__(self, db):
+        """CompanyService 초기화: 채용공고에 포함되는 회사 스냅샷을 관리합니다."""
+        self.db = db
+        self.BATCH_SIZE = 500  # 백필 시 한 번에 처리할 회사 수
+
+    @staticmethod
+    def build_snapshot(company: Dict) -> Dict:
+        """채용공고에 임베드할 회사 요약 정보(스냅샷)를 생성합니다."""
+        return {
+            '_id': str(company['_id']),
+            'name': company.get('name', ''),
+            'location': company.get('location', '')
+        }
+
+    def get_snapshot(self, company_id) -> Optional[Dict]:
+        """회사 ID로 회사를 조회하여 스냅샷을 반환합니다. 없으면 None을 반환합니다."""
+        if not ObjectId.is_valid(str(company_id)):
+            return None
+
+        company = self.db.companies.find_one(
+            {'_id': ObjectId(str(company_id))},
+            {'name': 1, 'location': 1}
+        )
+        return self.build_snapshot(company) if company else None
+
+    @staticmethod
+    def _stale_snapshot_query(snapshot: Dict) -> Dict:
+        """해당 회사의 채용공고 중 스냅샷이 다른 공고를 찾는 조건을 생성합니다."""
+        return {
+            # 문자열/ObjectId로 저장된 company_id를 모두 처리합니다
+            'company_id': {'$in': [snapshot['_id'], ObjectId(snapshot['_id'])]},
+            'company': {'$ne': snapshot}
+        }
+
+    def _sync_batch(self, snapshots: List[Dict]) -> int:
+        """
+        스냅샷 배치를 반영하고 갱신된 채용공고 수를 반환합니다.
+        updated_at도 함께 갱신하여 상세 ETag와 인덱스 증분 갱신에 반영되게 하고,
+        갱신 대상 공고의 상세 캐시를 무효화합니다.
+        """
+        # job_service가 이 모듈을 import하므로 순환 import를 피해 함수 안에서 가져옵니다
+        from .job_service import invalidate_job_posting
+
+        queries = [self._stale_snapshot_query(snapshot) for snapshot in snapshots]
+        job_ids = [job['_id'] for job in self.db.job_postings.find({'$or': queries}, {'_id': 1})]
+        if not job_ids:
+            return 0
+
+        now = datetime.utcnow()
+        operations = [
+            UpdateMany(query, {'$set': {'company': snapshot, 'updated_at': now}})
+            for query, snapshot in zip(queries, snapshots)
+        ]
+        modified = self.db.job_postings.bulk_write(operations, ordered=False).modified_count
+
+        for job_id in job_ids:
+            invalidate_job_posting(job_id)
+        return modified
+
+    def sync_job_snapshots(self, snapshots: Iterable[Dict]) -> int:
+        """
+        변경된 회사들의 스냅샷을 해당 회사의 채용공고에 일괄 반영합니다.
+        배치 단위 bulk_write로 처리하며, 갱신된 채용공고 수를 반환합니다.
+        """
+        modified = 0
+        batch: List[Dict] = []
+
+        for snapshot in snapshots:
+            batch.append(snapshot)
+            if len(batch) >= self.BATCH_SIZE:
+                modified += self._sync_batch(batch)
+                batch = []
+
+        if batch:
+            modified += self._sync_batch(batch)
+
+        if modified:
+            bump_collection_version(self.db, 'job_postings')
+        return modified
+
+    def backfill_job_snapshots(self) -> int:
+        """모든 회사의 스냅샷을 채용공고에 백필합니다. 갱신된 채용공고 수를 반환합니다."""
+        companies = self.db.companies.find(
+            {},
+            {'name': 1, 'location': 1},
+            batch_size=self.BATCH_SIZE
+        )
+        return self.sync_job_snapshots(
+            self.build_snapshot(company) for company in companies
+        )
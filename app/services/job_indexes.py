@@ -0,0 +1,169 @@
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from ..utils.suggest_index import SuggestionIndex
+from ..utils.bitmap_index import BitmapIndex
+from ..utils.similarity_index import SimilarityIndex
+from ..utils.normalizers import skill_key
+
+logger = logging.getLogger(__name__)
+
+class JobIndexRefresher:
+    """
+    채용공고 기반 인메모리 인덱스를 증분 갱신합니다.
+
+    마지막으로 반영한 updated_at(워터마크) 이후 변경된 공고만 조회하여
+    등록된 인덱스들에 반영합니다. 크롤러가 별도 프로세스에서 실행되어도
+    다음 갱신 주기에 변경 사항이 반영됩니다.
+
+    모든 쓰기 경로는 updated_at을 UTC로 기록합니다. 조회 중에 저장된 공고나 시각이 약간 어긋난
+    공고를 놓치지 않도록 워터마크보다 overlap만큼 앞선 시각부터 다시 읽으며(재반영은 멱등),
+    워터마크는 현재 UTC 시각을 넘지 않게 제한합니다 (미래 시각으로 저장된 공고 대비).
+    """
+
+    def __init__(self, refresh_interval: float = 60, overlap: timedelta = timedelta(minutes=5)):
+        self.refresh_interval = refresh_interval
+        self.overlap = overlap
+        self._handlers: List[Tuple[Iterable[str], Callable, Callable]] = []
+        self._watermark = None
+        self._last_refresh = 0.0
+        self._stale = True
+        self._lock = threading.Lock()
+
+    def register(self, fields: Iterable[str], on_upsert: Callable, on_remove: Callable) -> None:
+        """
+        인덱스를 등록합니다.
+
+        Args:
+            fields: 인덱스 구성에 필요한 채용공고 필드
+            on_upsert: 활성 공고가 추가/변경되었을 때 호출 (job_id, job)
+            on_remove: 공고가 비활성화되었을 때 호출 (job_id)
+        """
+        self._handlers.append((list(fields), on_upsert, on_remove))
+        self._watermark = None  # 새 인덱스를 위해 다음 갱신 시 전체를 다시 읽습니다
+        self._stale = True
+
+    def covered_until(self) -> Optional[datetime]:
+        """
+        이 시각 이전에 수정된 공고는 인덱스에 반영되어 있음을 보장하는 시각을 반환합니다.
+        이후에 수정된 공고는 인덱스에 없을 수 있으므로 호출한 쪽에서 DB 조건으로 보완해야 합니다.
+        아직 인덱스를 구성하지 않았으면 None을 반환합니다.
+        """
+        if self._watermark is None:
+            return None
+        return self._watermark - self.overlap
+
+    def mark_stale(self) -> None:
+        """다음 조회 시 갱신 주기와 관계없이 증분 갱신하도록 표시합니다."""
+        self._stale = True
+
+    def refresh(self, db, force: bool = False) -> int:
+        """변경된 채용공고를 인덱스에 반영하고 반영한 공고 수를 반환합니다."""
+        now = time.monotonic()
+        if not force and not self._stale and now - self._last_refresh < self.refresh_interval:
+            return 0
+
+        with self._lock:
+            # 대기하는 동안 다른 스레드가 갱신을 마쳤을 수 있습니다
+            if not force and not self._stale and time.monotonic() - self._last_refresh < self.refresh_interval:
+                return 0
+
+            projection = {'status': 1, 'updated_at': 1}
+            for fields, _, _ in self._handlers:
+                projection.update({field: 1 for field in fields})
+
+            started_at = datetime.utcnow()
+            if self._watermark is None:
+                query = {'status': 'active'}
+            else:
+                # 조회 중 저장된 공고를 놓치지 않도록 overlap만큼 겹쳐서 다시 읽습니다 (재반영은 멱등)
+                query = {'updated_at': {'$gte': self._watermark - self.overlap}}
+
+            count = 0
+            watermark = self._watermark
+            for job in db.job_postings.find(query, projection, batch_size=500):
+                job_id = str(job['_id'])
+                for _, on_upsert, on_remove in self._handlers:
+                    if job.get('status') == 'active':
+                        on_upsert(job_id, job)
+                    else:
+                        on_remove(job_id)
+
+                updated_at = job.get('updated_at')
+                if updated_at and (watermark is None or updated_at > watermark):
+                    watermark = updated_at
+                count += 1
+
+            if watermark is not None:
+                # 미래 시각으로 저장된 공고 때문에 워터마크가 앞서 나가지 않도록 합니다
+                watermark = min(watermark, started_at)
+            self._watermark = watermark
+            self._last_refresh = time.monotonic()
+            self._stale = False
+
+        if count:
+            logger.info(f"채용공고 인덱스 갱신: {count}개 공고 반영")
+        return count
+
+# 자동완성 인덱스: 기술 스택, 직무분야, 회사명, 공고 제목 단어
+suggestion_index = SuggestionIndex()
+job_index_refresher = JobIndexRefresher()
+
+TITLE_TERM_PATTERN = re.compile(r'[\w+#.]+')  # C++, C#, Node.js 등 기술 용어 보존
+
+def extract_suggestion_terms(job: Dict) -> List[Tuple[str, str]]:
+    """채용공고에서 자동완성 용어 (유형, 용어) 목록을 추출합니다."""
+    terms = [('skill', skill) for skill in job.get('skills') or []]
+    if job.get('sector'):
+        terms.append(('sector', job['sector']))
+    if job.get('company_name'):
+        terms.append(('company', job['company_name']))
+    for word in TITLE_TERM_PATTERN.findall(job.get('title') or ''):
+        word = word.strip('.')
+        if len(word) >= 2:
+            terms.append(('keyword', word))
+    return terms
+
+job_index_refresher.register(
+    fields=['skills', 'sector', 'company_name', 'title'],
+    on_upsert=lambda job_id, job: suggestion_index.add_document(job_id, extract_suggestion_terms(job)),
+    on_remove=suggestion_index.remove_document
+)
+
+# 기술 스택 비트맵 인덱스: 기술 스택 키 -> 공고 비트셋
+skill_index = BitmapIndex()
+
+job_index_refresher.register(
+    fields=['skills'],
+    on_upsert=lambda job_id, job: skill_index.add_document(
+        job_id, [skill_key(skill) for skill in job.get('skills') or []]
+    ),
+    on_remove=skill_index.remove_document
+)
+
+# 유사 공고 인덱스: 제목, 기술 스택, 담당업무, 자격요건의 TF-IDF 벡터
+similarity_index = SimilarityIndex()
+
+def extract_similarity_tokens(job: Dict) -> List[str]:
+    """채용공고에서 유사도 계산용 토큰을 추출합니다. 기술 스택은 가중치를 두기 위해 두 번 포함합니다."""
+    texts = [job.get('title') or '']
+    texts.extend(job.get('tasks') or [])
+    texts.extend(job.get('requirements') or [])
+
+    tokens = [
+        word.strip('.').lower()
+        for text in texts
+        for word in TITLE_TERM_PATTERN.findall(text)
+        if len(word.strip('.')) >= 2
+    ]
+    skill_tokens = [f'skill:{skill_key(skill)}' for skill in job.get('skills') or []]
+    return tokens + skill_tokens * 2
+
+job_index_refresher.register(
+    fields=['title', 'skills', 'tasks', 'requirements'],
+    on_upsert=lambda job_id, job: similarity_index.add_document(job_id, extract_similarity_tokens(job)),
+    on_remove=similarity_index.remove_document
+)
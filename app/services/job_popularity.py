@@ -0,0 +1,185 @@
+import atexit
+import logging
+import math
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+from ..models.init_db import bump_collection_version
+
+logger = logging.getLogger(__name__)
+
+# 인기 카운터 필드 -> 인기 점수(popularity_score) 가중치
+POPULARITY_WEIGHTS = {
+    'view_count': 1,
+    'bookmark_count': 3,
+    'application_count': 5
+}
+
+# 인기 카운터를 반영할 때마다 증가하는 버전 (collection_versions 문서 키)
+# 카운터 반영은 job_postings 컬렉션 버전과 updated_at을 바꾸지 않으므로,
+# 카운터 값으로 정렬하는 인기순 목록의 ETag/본문 캐시 키에는 이 버전을 함께 사용합니다
+POPULARITY_VERSION_KEY = 'job_popularity'
+
+def empty_popularity_counters() -> Dict[str, int]:
+    """새 채용공고에 저장할 초기 인기 카운터 (이후 증감은 $inc로만 반영)"""
+    return {**{field: 0 for field in POPULARITY_WEIGHTS}, 'popularity_score': 0}
+
+class PopularityCounter:
+    """
+    채용공고 인기 카운터(조회/북마크/지원 수)를 모아서 기록하는 write-behind 집계기입니다.
+
+    이벤트마다 공고 문서를 갱신하면 인기 공고 문서에 쓰기가 몰리므로, 공고별 증감을
+    프로세스 메모리에 누적했다가 flush_interval마다(또는 대기 중인 공고가 max_pending개 이상이면)
+    공고별 $inc 하나씩을 bulk_write 한 번으로 반영합니다. 반영은 이벤트를 기록한 요청에서
+    수행되며, 프로세스 종료 시 남은 증감도 반영합니다. 비정상 종료 시에는 마지막 반영 이후의
+    증감이 유실될 수 있으므로 정렬/추천용 근사치로만 사용합니다.
+    """
+
+    def __init__(self, flush_interval: float = 10, max_pending: int = 1000):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[str, Counter] = defaultdict(Counter)
+        self._db = None
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flushes = 0
+        self._flushed_jobs = 0
+        self._failures = 0
+
+    def record(self, db, job_id, field: str, amount: int = 1) -> None:
+        """공고의 카운터 증감을 누적하고, 반영 주기가 되었으면 모아서 반영합니다."""
+        if not amount or not ObjectId.is_valid(str(job_id)):
+            return
+        with self._lock:
+            self._db = db
+            counts = self._pending[str(job_id)]
+            counts[field] += amount
+            counts['popularity_score'] += amount * POPULARITY_WEIGHTS[field]
+            due = (len(self._pending) >= self.max_pending
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """누적된 증감을 bulk_write로 반영하고 갱신한 공고 수를 반환합니다."""
+        # 다른 스레드가 반영 중이면 기다리지 않고 다음 주기에 맡깁니다
+        if not self._flush_lock.acquire(blocking=False):
+            return 0
+        try:
+            with self._lock:
+                pending, self._pending = self._pending, defaultdict(Counter)
+                db = self._db
+                self._last_flush = time.monotonic()
+
+            job_ids = []
+            operations = []
+            for job_id, counts in pending.items():
+                increments = {field: amount for field, amount in counts.items() if amount}
+                if increments:  # 추가 후 취소된 북마크처럼 합계가 0이면 쓰지 않습니다
+                    job_ids.append(job_id)
+                    operations.append(UpdateOne({'_id': ObjectId(job_id)}, {'$inc': increments}))
+            if not operations or db is None:
+                return 0
+
+            failed = set()
+            try:
+                db.job_postings.bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                # 실패한 공고의 증감만 다음 반영 때 다시 시도합니다
+                failed = {error['index'] for error in e.details.get('writeErrors', [])}
+                self._restore({job_ids[index]: pending[job_ids[index]] for index in failed})
+                self._failures += 1
+                logger.warning(f"인기 카운터 일부 반영 실패: {len(failed)}개 공고")
+            except PyMongoError as e:
+                self._restore(pending)
+                self._failures += 1
+                logger.warning(f"인기 카운터 반영 실패, 다음 주기에 재시도: {str(e)}")
+                return 0
+
+            flushed = [job_id for index, job_id in enumerate(job_ids) if index not in failed]
+            if flushed:
+                bump_collection_version(db, POPULARITY_VERSION_KEY)
+                self._flushes += 1
+                self._flushed_jobs += len(flushed)
+            return len(flushed)
+        finally:
+            self._flush_lock.release()
+
+    def _restore(self, pending: Dict[str, Counter]) -> None:
+        """반영하지 못한 증감을 다시 누적합니다."""
+        with self._lock:
+            for job_id, counts in pending.items():
+                self._pending[job_id].update(counts)
+
+    def stats(self) -> Dict:
+        """대기 중인 공고 수와 반영 횟수/실패 횟수를 반환합니다."""
+        with self._lock:
+            return {
+                'pending_jobs': len(self._pending),
+                'flushes': self._flushes,
+                'flushed_jobs': self._flushed_jobs,
+                'failures': self._failures
+            }
+
+class TrendingJobs:
+    """
+    인기 급상승 공고 목록을 주기적으로 미리 계산하여 메모리에서 제공합니다.
+
+    인기 점수 상위 후보를 읽어 게시 후 경과 시간으로 감쇠한 점수
+    (popularity_score / (경과 시간 + 2) ^ gravity)로 다시 정렬하므로,
+    오래 누적된 공고보다 최근에 관심이 몰린 공고가 앞에 옵니다.
+    """
+
+    def __init__(self, size: int = 50, candidates: int = 500,
+                 refresh_interval: float = 60, gravity: float = 1.5):
+        self.size = size
+        self.candidates = candidates
+        self.refresh_interval = refresh_interval
+        self.gravity = gravity
+        self._jobs: List[Dict] = []
+        self._refreshed_at: Optional[datetime] = None
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def _score(self, job: Dict, now: datetime) -> float:
+        created_at = job.get('created_at') or now
+        age_hours = max((now - created_at).total_seconds() / 3600, 0)
+        return (job.get('popularity_score') or 0) / math.pow(age_hours + 2, self.gravity)
+
+    def get(self, db, projection: Dict) -> tuple:
+        """(미리 계산한 공고 목록, 계산 시각)을 반환합니다. 갱신 주기가 지났으면 다시 계산합니다."""
+        if time.monotonic() - self._last_refresh < self.refresh_interval:
+            return self._jobs, self._refreshed_at
+
+        with self._lock:
+            # 대기하는 동안 다른 스레드가 갱신을 마쳤을 수 있습니다
+            if time.monotonic() - self._last_refresh < self.refresh_interval:
+                return self._jobs, self._refreshed_at
+
+            candidates = list(db.job_postings.find(
+                {'status': 'active', 'popularity_score': {'$gt': 0}},
+                {**projection, 'popularity_score': 1, 'created_at': 1}
+            ).sort('popularity_score', -1).limit(self.candidates))
+
+            now = datetime.utcnow()
+            candidates.sort(key=lambda job: self._score(job, now), reverse=True)
+            self._jobs = candidates[:self.size]
+            self._refreshed_at = now
+            self._last_refresh = time.monotonic()
+            return self._jobs, self._refreshed_at
+
+    def invalidate(self) -> None:
+        """다음 조회 시 다시 계산하도록 표시합니다."""
+        self._last_refresh = 0.0
+
+popularity_counter = PopularityCounter()
+trending_jobs = TrendingJobs()
+
+# 프로세스 종료 시 아직 반영하지 않은 증감을 반영합니다
+atexit.register(popularity_counter.flush)
@@ -1,13 +1,108 @@
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 from datetime import datetime
 from bson import ObjectId
+from pymongo import UpdateOne, ASCENDING
 import math
+import time
+from ..utils.cache import LRUCache, make_filter_signature
+from ..utils.json_encoder import dumps
+from ..utils.single_flight import SingleFlight
+from ..utils.normalizers import (
+    parse_salary, empty_salary, normalize_location, normalize_region_filter,
+    canonicalize_skills, skill_key
+)
+from .company_service import CompanyService
+from ..models.init_db import get_collection_version, bump_collection_version
+from .job_indexes import job_index_refresher, suggestion_index, skill_index, similarity_index
+from .user_job_sets import annotate_jobs, get_user_flags_version
+from .job_popularity import (
+    POPULARITY_WEIGHTS, POPULARITY_VERSION_KEY, empty_popularity_counters,
+    popularity_counter, trending_jobs
+)
+
+# 목록 화면(카드)에 필요한 최소 필드만 조회하는 기본 프로젝션
+# description, 섹션 배열(tasks/requirements/...)과 process는 상세 조회(/jobs/<job_id>)에서만 반환합니다
+JOB_CARD_PROJECTION = {
+    'company_id': 1,
+    'company_name': 1,
+    'title': 1,
+    'location': 1,
+    'job_type': 1,
+    'experience_level': 1,
+    'education': 1,
+    'salary_text': 1,
+    'sector': 1,
+    'skills': 1,
+    'deadline': 1,
+    'deadline_timestamp': 1,
+    'created_at': 1,
+    'view_count': 1,
+    'bookmark_count': 1,
+    'application_count': 1
+}
+
+# fields 파라미터로 요청할 수 있는 필드 목록
+SELECTABLE_JOB_FIELDS = {
+    'company_id', 'company_name', 'title', 'description', 'tasks', 'requirements',
+    'preferred', 'benefits', 'process', 'salary', 'salary_text', 'location',
+    'detail_location', 'job_type', 'experience_level', 'education', 'work_shift',
+    'conditions', 'sector', 'skills', 'deadline', 'deadline_timestamp',
+    'original_url', 'status', 'created_at', 'updated_at',
+    'view_count', 'bookmark_count', 'application_count'
+}
+
+# 내보내기(export)에 포함하는 필드
+EXPORT_PROJECTION = {field: 1 for field in SELECTABLE_JOB_FIELDS | {'company', 'region_codes'}}
+
+# 채용공고 상세 응답 캐시 (job_id -> 직렬화된 상세 정보)
+# 공고는 크롤링 시점에만 변경되므로 대부분의 상세 조회는 캐시에서 처리됩니다
+# 항목은 저장 시점의 job_postings 컬렉션 버전으로 태그하므로, 크롤러처럼 다른 프로세스에서
+# 공고를 변경해도 버전이 올라가면 다음 조회에서 미스로 처리됩니다
+job_detail_cache = LRUCache(max_size=2048, ttl=600)
+
+# 패싯 카운트 캐시 (필터 시그니처 -> (전체 건수, 패싯별 카운트))
+facet_cache = LRUCache(max_size=512, ttl=120)
+
+# 패싯 이름 -> 채용공고 필드 (skills는 배열이므로 별도 처리)
+FACET_FIELDS = {
+    'location': 'location',
+    'experience_level': 'experience_level',
+    'job_type': 'job_type',
+    'education': 'education'
+}
+FACET_VALUE_LIMIT = 20  # 패싯별 최대 반환 항목 수
+
+# 지원 가능한(활성) 채용공고 요약 캐시 (job_id -> {'category', 'company_id'})
+# 지원 요청마다 채용공고를 조회하지 않도록 활성 공고만 저장합니다
+active_job_cache = LRUCache(max_size=4096, ttl=60)
+
+# 기본 목록/검색/상세 응답의 인기 카운터가 늦게 반영될 수 있는 최대 시간 (초, 상세 캐시 TTL과 동일)
+# 카운터는 근사치이므로 반영될 때마다 ETag를 바꾸지 않고 이 주기 단위로만 바꿉니다
+COUNTER_STALENESS_SECONDS = 600
+
+# 기술 스택 필터를 비트맵 인덱스의 _id 목록으로 질의하는 최대 공고 수
+# 이보다 많이 일치하는 흔한 기술은 ID 목록을 보내는 비용이 커지므로 skills 멀티키 인덱스를 사용합니다
+SKILL_BITMAP_MAX_IDS = 500
+
+# 같은 조건의 동시 조회(목록/검색/상세)를 하나의 DB 조회로 합칩니다
+# 캐시가 비어 있는 키에 요청이 몰려도 DB에는 한 번만 질의합니다
+request_flight = SingleFlight()
+
+def invalidate_job_posting(job_id) -> None:
+    """채용공고가 저장/수정되었을 때 해당 공고의 캐시를 무효화합니다."""
+    job_detail_cache.invalidate(str(job_id))
+    active_job_cache.invalidate(str(job_id))
+    facet_cache.clear()  # 공고 변경 시 패싯 카운트가 달라질 수 있습니다
+    job_index_refresher.mark_stale()
 
 class JobService:
     def __init__(self, db):
         """JobService 초기화: 채용공고 관련 비즈니스 로직을 처리합니다."""
         self.db = db
+        self.company_service = CompanyService(db)
         self.ITEMS_PER_PAGE = 20  # 페이지당 항목 수
+        self.BACKFILL_BATCH_SIZE = 500  # 백필 시 한 번에 갱신할 문서 수
+        self.MAX_BATCH_SIZE = 50  # 일괄 상세 조회 시 최대 공고 수
 
     def create_job_posting(self, job_data: Dict) -> Tuple[bool, str, Optional[Dict]]:
         """
@@ -19,7 +114,18 @@ class JobService:
             job_data['created_at'] = datetime.utcnow()
             job_data['updated_at'] = datetime.utcnow()
             job_data['status'] = 'active'
+
+            # 인기 카운터 초기화 (이후 증감은 write-behind 집계기가 $inc로 반영)
+            job_data.update(empty_popularity_counters())
             
+            # 회사 스냅샷 임베드 (조회 시 companies 조인을 피하기 위함)
+            if job_data.get('company_id'):
+                job_data['company_id'] = str(job_data['company_id'])
+                snapshot = self.company_service.get_snapshot(job_data['company_id'])
+                if snapshot:
+                    job_data['company'] = snapshot
+                    job_data.setdefault('company_name', snapshot['name'])
+
             # 리스트 타입 필드 정규화
             list_fields = ['tasks', 'requirements', 'preferred', 'benefits', 'skills']
             for field in list_fields:
@@ -28,6 +134,9 @@ class JobService:
                 elif not isinstance(job_data[field], list):
                     job_data[field] = [job_data[field]]
             
+            # 기술 스택 표준화 ("python", " 파이썬" -> "Python")
+            job_data['skills'] = canonicalize_skills(job_data['skills'])
+            
             # 문자열 필드 정규화
             string_fields = ['description', 'location', 'job_type', 'experience_level', 
                            'education', 'work_shift', 'sector', 'salary_text']
@@ -35,12 +144,15 @@ class JobService:
                 if field not in job_data:
                     job_data[field] = ""
             
-            # 급여 정보 정규화
+            # 급여 정보 정규화 (salary가 없으면 salary_text를 파싱하여 연간 환산 금액으로 저장)
             if 'salary' not in job_data or not isinstance(job_data['salary'], dict):
-                job_data['salary'] = {'min': 0, 'max': 0}
+                job_data['salary'] = parse_salary(job_data['salary_text']) or empty_salary()
             else:
                 job_data['salary']['min'] = job_data['salary'].get('min', 0)
-                job_data['salary']['max'] = job_data['salary'].get('max', 0)
+                job_data['salary']['max'] = max(job_data['salary'].get('max', 0), job_data['salary']['min'])
+            
+            # 근무지역 -> 계층형 지역 코드
+            job_data['region_codes'] = normalize_location(job_data['location'])
             
             # 근무조건 정보 정규화
             if 'conditions' not in job_data or not isinstance(job_data['conditions'], dict):
@@ -63,60 +175,202 @@ class JobService:
             
             result = self.db.job_postings.insert_one(job_data)
             job_data['_id'] = str(result.inserted_id)
+            invalidate_job_posting(result.inserted_id)
+            bump_collection_version(self.db, 'job_postings')
             
             return True, "채용공고가 성공적으로 등록되었습니다", job_data
         except Exception as e:
             return False, f"채용공고 등록 실패: {str(e)}", None
 
-    def get_job_postings(self, page: int = 1, filters: Dict = None, sort_by: str = None) -> Dict:
-        """채용공고 목록 조회: 필터링과 정렬 조건을 적용하여 채용공고 목록을 반환합니다."""
-        try:
-            # 기본 필터 (활성 상태)
-            query = {'status': 'active'}
-            
-            # 필터링 조건 적용
-            if filters:
-                if 'location' in filters:
+    def _build_projection(self, fields: Optional[List[str]] = None) -> Dict:
+        """
+        목록 조회용 프로젝션 생성: fields가 주어지면 허용된 필드만 조회하고,
+        없으면 카드 렌더링에 필요한 기본 필드만 조회합니다.
+        """
+        if not fields:
+            return dict(JOB_CARD_PROJECTION)
+
+        projection = {
+            field.strip(): 1 for field in fields
+            if field.strip() in SELECTABLE_JOB_FIELDS
+        }
+        if not projection:
+            raise ValueError(f"조회 가능한 필드가 없습니다: {', '.join(fields)}")
+        return projection
+
+    def _build_list_query(self, filters: Dict = None) -> Dict:
+        """목록 조회용 필터 쿼리를 생성합니다."""
+        # 기본 필터 (활성 상태)
+        query = {'status': 'active'}
+        
+        # 필터링 조건 적용
+        if filters:
+            if 'location' in filters:
+                # 지역 코드로 변환되면 인덱스를 사용하는 정확 일치, 아니면 기존 텍스트 검색
+                region_codes = normalize_region_filter(filters['location'])
+                if len(region_codes) == 1:
+                    query['region_codes'] = region_codes[0]
+                elif region_codes:
+                    query['region_codes'] = {'$in': region_codes}
+                else:
                     query['location'] = {'$regex': filters['location'], '$options': 'i'}
-                if 'experience_level' in filters:
-                    query['experience_level'] = filters['experience_level']
-                if 'min_salary' in filters:
+            if 'experience_level' in filters:
+                query['experience_level'] = filters['experience_level']
+            if 'min_salary' in filters:
+                # 저장 시 salary.max >= salary.min이 보장되므로
+                # (salary.min >= x OR salary.max >= x)는 salary.max >= x와 같습니다.
+                # 단일 범위 조건으로 (status, salary.max) 인덱스를 사용합니다.
+                query['salary.max'] = {'$gte': filters['min_salary']}
+            if 'skills' in filters:
+                # 표준 명칭으로 변환한 뒤 비트맵 인덱스의 교집합(all)/합집합(any)으로 공고를 찾습니다
+                skills = canonicalize_skills(filters['skills'])
+                skill_keys = [skill_key(skill) for skill in skills]
+                job_index_refresher.refresh(self.db)
+                if filters.get('skills_mode') == 'any':
+                    job_ids = skill_index.match_any(skill_keys, limit=SKILL_BITMAP_MAX_IDS)
+                    skills_condition = {'$in': skills}
+                else:
+                    job_ids = skill_index.match_all(skill_keys, limit=SKILL_BITMAP_MAX_IDS)
+                    skills_condition = {'$all': skills}
+
+                # 인덱스가 아직 없거나 일치하는 공고가 많으면 skills 멀티키 인덱스로 조회하고,
+                # 인덱스에 아직 반영되지 않았을 수 있는 최근 수정 공고는 DB의 skills 필드로 찾습니다
+                covered_until = job_index_refresher.covered_until()
+                if covered_until is None or job_ids is None:
+                    query['skills'] = skills_condition
+                else:
                     query['$or'] = [
-                        {'salary.min': {'$gte': filters['min_salary']}},
-                        {'salary.max': {'$gte': filters['min_salary']}}
+                        {'_id': {'$in': [ObjectId(job_id) for job_id in job_ids]}},
+                        {'updated_at': {'$gte': covered_until}, 'skills': skills_condition}
                     ]
-                if 'skills' in filters:
-                    if isinstance(filters['skills'], str):
-                        skills = filters['skills'].split(',')
-                    else:
-                        skills = filters['skills']
-                    query['skills'] = {'$all': skills}
-
-            # 정렬 조건
-            sort_conditions = [('created_at', -1)]  # 기본: 최신순
-            if sort_by:
-                if sort_by == 'salary':
-                    sort_conditions = [('salary.max', -1)]
-                elif sort_by == 'deadline':
-                    sort_conditions = [('deadline_timestamp', 1)]
 
-            # 페이지네이션
-            skip = (page - 1) * self.ITEMS_PER_PAGE
-            
-            # 채용공고 조회
-            job_postings = list(self.db.job_postings.find(query)
+        return query
+
+    def _build_sort(self, sort_by: str = None) -> List[Tuple[str, int]]:
+        """목록 조회용 정렬 조건을 생성합니다."""
+        sort_conditions = [('created_at', -1)]  # 기본: 최신순
+        if sort_by:
+            if sort_by == 'salary':
+                sort_conditions = [('salary.max', -1)]
+            elif sort_by == 'deadline':
+                sort_conditions = [('deadline_timestamp', 1)]
+            elif sort_by == 'popular':
+                # 조회/북마크/지원 수의 가중합 (같은 점수는 최신순)
+                sort_conditions = [('popularity_score', -1), ('created_at', -1)]
+        return sort_conditions
+
+    def _build_facet_stages(self) -> Dict:
+        """패싯 항목별 카운트를 계산하는 $facet 하위 파이프라인을 생성합니다."""
+        stages = {
+            facet: [
+                {'$match': {field: {'$nin': [None, '']}}},
+                {'$group': {'_id': f'${field}', 'count': {'$sum': 1}}},
+                {'$sort': {'count': -1}},
+                {'$limit': FACET_VALUE_LIMIT}
+            ]
+            for facet, field in FACET_FIELDS.items()
+        }
+        stages['skills'] = [
+            {'$unwind': '$skills'},
+            {'$match': {'skills': {'$nin': [None, '']}}},
+            {'$group': {'_id': '$skills', 'count': {'$sum': 1}}},
+            {'$sort': {'count': -1}},
+            {'$limit': FACET_VALUE_LIMIT}
+        ]
+        return stages
+
+    def _query_with_facets(self, query: Dict, projection: Dict,
+                           sort_conditions: List[Tuple[str, int]], skip: int) -> Tuple[List[Dict], int, Dict]:
+        """
+        페이지 데이터와 패싯 카운트를 조회합니다.
+        동일한 필터 조건의 패싯 카운트가 캐시되어 있으면 페이지만 조회하고,
+        없으면 페이지, 전체 건수, 패싯 카운트를 단일 $facet 집계로 계산합니다.
+        """
+        signature = make_filter_signature(query)
+        cached = facet_cache.get(signature)
+        if cached is not None:
+            total_items, facets = cached
+            job_postings = list(self.db.job_postings.find(query, projection)
                             .sort(sort_conditions)
                             .skip(skip)
                             .limit(self.ITEMS_PER_PAGE))
+            return job_postings, total_items, facets
 
-            # ObjectId 문자열로 변환
-            for job in job_postings:
-                job['_id'] = str(job['_id'])
+        pipeline = [
+            {'$match': query},
+            {
+                '$facet': {
+                    'data': [
+                        {'$sort': dict(sort_conditions)},
+                        {'$skip': skip},
+                        {'$limit': self.ITEMS_PER_PAGE},
+                        {'$project': projection}
+                    ],
+                    'total': [{'$count': 'count'}],
+                    **self._build_facet_stages()
+                }
+            }
+        ]
+        result = next(self.db.job_postings.aggregate(pipeline))
+
+        total_items = result['total'][0]['count'] if result['total'] else 0
+        facets = {
+            facet: [{'value': item['_id'], 'count': item['count']} for item in result[facet]]
+            for facet in list(FACET_FIELDS) + ['skills']
+        }
+        facet_cache.set(signature, (total_items, facets))
+        return result['data'], total_items, facets
+
+    def get_job_postings(self, page: int = 1, filters: Dict = None, sort_by: str = None,
+                         fields: Optional[List[str]] = None, facets: bool = False,
+                         user_id: Optional[str] = None) -> Dict:
+        """
+        채용공고 목록 조회: 필터링과 정렬 조건을 적용하여 채용공고 목록을 반환합니다.
+        facets가 True이면 지역/경력/고용형태/학력/기술 스택별 건수를 함께 반환합니다.
+        user_id를 지정하면 각 공고에 is_bookmarked/has_applied 플래그를 추가합니다.
+        """
+        key = ('jobs', make_filter_signature({
+            'page': page, 'filters': filters or {}, 'sort_by': sort_by,
+            'fields': sorted(fields) if fields else None, 'facets': facets
+        }))
+        result = request_flight.do(
+            key, lambda: self._get_job_postings(page, filters, sort_by, fields, facets)
+        )
+        return self._with_user_flags(result, user_id)
+
+    def _with_user_flags(self, result: Dict, user_id: Optional[str]) -> Dict:
+        """목록 결과의 공고들에 사용자 플래그를 추가한 사본을 반환합니다 (공유된 결과는 수정하지 않음)."""
+        if not user_id or result.get('status') != 'success':
+            return result
+        return {**result, 'data': annotate_jobs(self.db, user_id, result['data'])}
+
+    def _get_job_postings(self, page: int, filters: Optional[Dict], sort_by: Optional[str],
+                          fields: Optional[List[str]], facets: bool) -> Dict:
+        """채용공고 목록을 DB에서 조회합니다."""
+        try:
+            projection = self._build_projection(fields)
+            query = self._build_list_query(filters)
+            sort_conditions = self._build_sort(sort_by)
+
+            # 페이지네이션
+            skip = (page - 1) * self.ITEMS_PER_PAGE
+            
+            # 채용공고 조회
+            facet_counts = None
+            if facets:
+                job_postings, total_items, facet_counts = self._query_with_facets(
+                    query, projection, sort_conditions, skip
+                )
+            else:
+                job_postings = list(self.db.job_postings.find(query, projection)
+                                .sort(sort_conditions)
+                                .skip(skip)
+                                .limit(self.ITEMS_PER_PAGE))
+                total_items = self.db.job_postings.count_documents(query)
 
-            total_items = self.db.job_postings.count_documents(query)
             total_pages = math.ceil(total_items / self.ITEMS_PER_PAGE)
 
-            return {
+            result = {
                 'status': 'success',
                 'data': job_postings,
                 'pagination': {
@@ -126,6 +380,10 @@ class JobService:
                     'perPage': self.ITEMS_PER_PAGE
                 }
             }
+            if facet_counts is not None:
+                result['facets'] = facet_counts
+
+            return result
 
         except Exception as e:
             return {
@@ -133,9 +391,24 @@ class JobService:
                 'message': f"채용공고 목록 조회 실패: {str(e)}"
             }
 
-    def search_jobs(self, keyword: str, page: int = 1) -> Dict:
-        """채용공고 검색: 키워드를 사용하여 관련 채용공고를 검색합니다."""
+    def search_jobs(self, keyword: str, page: int = 1, fields: Optional[List[str]] = None,
+                    user_id: Optional[str] = None) -> Dict:
+        """
+        채용공고 검색: 키워드를 사용하여 관련 채용공고를 검색합니다.
+        user_id를 지정하면 각 공고에 is_bookmarked/has_applied 플래그를 추가합니다.
+        """
+        keyword = keyword.strip()
+        # 대소문자 구분 없이 검색하므로 소문자로 정규화한 키워드로 요청을 합칩니다
+        key = ('search', keyword.lower(), page, tuple(sorted(fields)) if fields else None)
+        result = request_flight.do(key, lambda: self._search_jobs(keyword, page, fields))
+        return self._with_user_flags(result, user_id)
+
+    def _search_jobs(self, keyword: str, page: int, fields: Optional[List[str]]) -> Dict:
+        """키워드 검색 결과를 DB에서 조회합니다."""
         try:
+            projection = self._build_projection(fields)
+            projection['company'] = 1  # 임베드된 회사 스냅샷
+
             # 향상된 검색 쿼리
             query = {
                 '$and': [
@@ -163,30 +436,11 @@ class JobService:
             total_pages = math.ceil(total_items / self.ITEMS_PER_PAGE)
             skip = (page - 1) * self.ITEMS_PER_PAGE
             
-            # 회사 정보를 포함한 검색 결과 조회
-            pipeline = [
-                {'$match': query},
-                {'$sort': {'created_at': -1}},
-                {'$skip': skip},
-                {'$limit': self.ITEMS_PER_PAGE},
-                {
-                    '$lookup': {
-                        'from': 'companies',
-                        'localField': 'company_id',
-                        'foreignField': '_id',
-                        'as': 'company'
-                    }
-                },
-                {'$unwind': '$company'}
-            ]
-            
-            job_postings = list(self.db.job_postings.aggregate(pipeline))
-
-            # ObjectId 변환
-            for job in job_postings:
-                job['_id'] = str(job['_id'])
-                job['company_id'] = str(job['company_id'])
-                job['company']['_id'] = str(job['company']['_id'])
+            # 회사 정보는 채용공고에 임베드된 스냅샷을 사용하므로 조인 없이 조회합니다
+            job_postings = list(self.db.job_postings.find(query, projection)
+                            .sort('created_at', -1)
+                            .skip(skip)
+                            .limit(self.ITEMS_PER_PAGE))
 
             return {
                 'status': 'success',
@@ -205,34 +459,365 @@ class JobService:
                 'message': f"채용공고 검색 실패: {str(e)}"
             }
 
-    def get_job_detail(self, job_id: str) -> Tuple[bool, str, Optional[Dict]]:
-        """채용공고 상세 조회: 특정 채용공고의 상세 정보를 회사 정보와 함께 반환합니다."""
+    def get_job_detail(self, job_id: str, user_id: Optional[str] = None) -> Tuple[bool, str, Optional[Dict]]:
+        """
+        채용공고 상세 조회: 특정 채용공고의 상세 정보를 회사 정보와 함께 반환합니다.
+        user_id를 지정하면 is_bookmarked/has_applied 플래그를 추가한 사본을 반환합니다.
+        """
         try:
-            # 채용공고와 회사 정보를 한 번에 조회
-            pipeline = [
-                {'$match': {'_id': ObjectId(job_id)}},
-                {
-                    '$lookup': {
-                        'from': 'companies',
-                        'localField': 'company_id',
-                        'foreignField': '_id',
-                        'as': 'company'
-                    }
-                },
-                {'$unwind': '$company'}
-            ]
-            
-            job = next(self.db.job_postings.aggregate(pipeline), None)
+            # 현재 컬렉션 버전으로 캐시된 상세 정보가 있으면 공고 조회 없이 사용
+            version = self.get_listing_version()
+            job = job_detail_cache.get(job_id, version)
+            if job is None:
+                # 같은 공고를 동시에 조회하는 요청은 하나의 DB 조회 결과를 공유합니다
+                job = request_flight.do(('job', job_id, version),
+                                        lambda: self._load_job_detail(job_id, version))
             
             if not job:
                 return False, "해당 채용공고를 찾을 수 없습니다", None
 
-            # ObjectId 변환
-            job['_id'] = str(job['_id'])
-            job['company_id'] = str(job['company_id'])
-            job['company']['_id'] = str(job['company']['_id'])
-
+            self.record_popularity(job_id, 'view_count')
+            if user_id:
+                job = annotate_jobs(self.db, user_id, [job])[0]
             return True, "채용공고 조회 성공", job
 
         except Exception as e:
-            return False, f"채용공고 조회 실패: {str(e)}", None
\ No newline at end of file
+            return False, f"채용공고 조회 실패: {str(e)}", None
+
+    def _load_job_detail(self, job_id: str, version: int) -> Optional[Dict]:
+        """
+        채용공고를 DB에서 조회하여 상세 캐시에 저장합니다.
+        version은 조회 전에 읽은 컬렉션 버전이므로, 조회 도중 변경되면 다음 조회에서 미스가 됩니다.
+        """
+        # 회사 스냅샷이 임베드되어 있으므로 단일 컬렉션에서 조회합니다
+        job = self.db.job_postings.find_one({'_id': ObjectId(job_id)})
+        if job:
+            job_detail_cache.set(job_id, job, version)
+        return job
+
+    @staticmethod
+    def _active_job_summary(job: Dict) -> Dict:
+        """지원 처리에 필요한 채용공고 요약 정보를 생성합니다."""
+        return {
+            'category': job.get('category') or job.get('sector') or None,
+            'company_id': job.get('company_id')
+        }
+
+    def get_active_job_summary(self, job_id: str) -> Optional[Dict]:
+        """
+        지원 가능한(활성) 채용공고의 요약 정보(category, company_id)를 반환합니다.
+        활성 공고가 아니거나 존재하지 않으면 None을 반환합니다.
+        """
+        summary = active_job_cache.get(job_id)
+        if summary is not None:
+            return summary
+
+        job = self.db.job_postings.find_one(
+            {'_id': ObjectId(job_id), 'status': 'active'},
+            {'category': 1, 'sector': 1, 'company_id': 1}
+        )
+        if not job:
+            return None
+
+        summary = self._active_job_summary(job)
+        active_job_cache.set(job_id, summary)
+        return summary
+
+    def get_active_job_summaries(self, job_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        여러 채용공고의 활성 여부와 요약 정보를 반환합니다 (job_id -> 요약).
+        캐시에 없는 공고는 한 번의 $in 쿼리로 확인하며, 활성 공고가 아닌 ID는 결과에 포함되지 않습니다.
+        """
+        summaries = {}
+        missing = []
+        for job_id in job_ids:
+            summary = active_job_cache.get(job_id)
+            if summary is not None:
+                summaries[job_id] = summary
+            elif ObjectId.is_valid(job_id):
+                missing.append(ObjectId(job_id))
+
+        if missing:
+            jobs = self.db.job_postings.find(
+                {'_id': {'$in': missing}, 'status': 'active'},
+                {'category': 1, 'sector': 1, 'company_id': 1}
+            )
+            for job in jobs:
+                job_id = str(job['_id'])
+                summaries[job_id] = self._active_job_summary(job)
+                active_job_cache.set(job_id, summaries[job_id])
+        return summaries
+
+    def get_job_cards(self, job_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        여러 채용공고를 카드 필드만으로 한 번의 $in 쿼리로 조회합니다.
+        지원/북마크 목록처럼 공고 정보를 함께 보여줄 때 사용하며, job_id -> 공고 dict를 반환합니다.
+        존재하지 않거나 형식이 잘못된 ID는 결과에 포함되지 않습니다.
+        """
+        object_ids = list({ObjectId(job_id) for job_id in job_ids if ObjectId.is_valid(str(job_id))})
+        if not object_ids:
+            return {}
+
+        projection = {**JOB_CARD_PROJECTION, 'company': 1, 'status': 1}
+        return {
+            str(job['_id']): job
+            for job in self.db.job_postings.find({'_id': {'$in': object_ids}}, projection)
+        }
+
+    def get_job_details(self, job_ids: List[str]) -> Dict:
+        """
+        채용공고 일괄 상세 조회: 여러 채용공고를 캐시와 한 번의 $in 조회로 가져옵니다.
+        응답은 요청한 순서대로 항목별 상태(found, not_found, invalid_id)를 포함합니다.
+        """
+        try:
+            # 중복 제거 (요청 순서 유지)
+            job_ids = list(dict.fromkeys(job_id.strip() for job_id in job_ids if job_id.strip()))
+            if not job_ids:
+                raise ValueError("조회할 채용공고 ID를 입력해주세요")
+            if len(job_ids) > self.MAX_BATCH_SIZE:
+                raise ValueError(f"한 번에 최대 {self.MAX_BATCH_SIZE}개까지 조회할 수 있습니다")
+
+            # 현재 컬렉션 버전으로 캐시된 공고는 바로 사용하고 나머지만 조회합니다
+            version = self.get_listing_version()
+            found = {}
+            missing = []
+            for job_id in job_ids:
+                if not ObjectId.is_valid(job_id):
+                    continue
+                cached_job = job_detail_cache.get(job_id, version)
+                if cached_job is not None:
+                    found[job_id] = cached_job
+                else:
+                    missing.append(ObjectId(job_id))
+
+            if missing:
+                for job in self.db.job_postings.find({'_id': {'$in': missing}}):
+                    job_id = str(job['_id'])
+                    job_detail_cache.set(job_id, job, version)
+                    found[job_id] = job
+
+            items = []
+            for job_id in job_ids:
+                if not ObjectId.is_valid(job_id):
+                    items.append({'job_id': job_id, 'status': 'invalid_id', 'data': None})
+                elif job_id in found:
+                    items.append({'job_id': job_id, 'status': 'found', 'data': found[job_id]})
+                else:
+                    items.append({'job_id': job_id, 'status': 'not_found', 'data': None})
+
+            return {
+                'status': 'success',
+                'data': items,
+                'summary': {
+                    'requested': len(job_ids),
+                    'found': sum(1 for item in items if item['status'] == 'found')
+                }
+            }
+
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': f"채용공고 일괄 조회 실패: {str(e)}"
+            }
+
+    def suggest(self, query: str, limit: int = 10) -> Dict:
+        """자동완성: 기술 스택, 직무분야, 회사명, 공고 제목 단어 중 접두어가 일치하는 용어를 빈도순으로 반환합니다."""
+        try:
+            job_index_refresher.refresh(self.db)
+            return {
+                'status': 'success',
+                'data': suggestion_index.suggest(query, limit)
+            }
+
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': f"자동완성 조회 실패: {str(e)}"
+            }
+
+    def _backfill(self, projection: Dict, build_update) -> int:
+        """
+        모든 채용공고를 배치 단위로 읽어 build_update(job)가 반환한 $set을 bulk_write로 반영합니다.
+        build_update가 None을 반환하면 해당 공고는 건너뜁니다. 갱신된 공고 수를 반환합니다.
+        """
+        modified = 0
+        operations = []
+        cursor = self.db.job_postings.find({}, projection, batch_size=self.BACKFILL_BATCH_SIZE)
+
+        for job in cursor:
+            update = build_update(job)
+            if update:
+                operations.append(UpdateOne({'_id': job['_id']}, {'$set': update}))
+            if len(operations) >= self.BACKFILL_BATCH_SIZE:
+                modified += self.db.job_postings.bulk_write(operations, ordered=False).modified_count
+                operations = []
+
+        if operations:
+            modified += self.db.job_postings.bulk_write(operations, ordered=False).modified_count
+
+        if modified:
+            bump_collection_version(self.db, 'job_postings')
+        return modified
+
+    def backfill_salaries(self) -> int:
+        """기존 채용공고의 salary_text를 파싱하여 salary(연간 환산 금액)를 채웁니다."""
+        return self._backfill(
+            {'salary_text': 1},
+            lambda job: {'salary': parse_salary(job.get('salary_text', '')) or empty_salary()}
+        )
+
+    def backfill_region_codes(self) -> int:
+        """기존 채용공고의 location을 변환하여 region_codes를 채웁니다."""
+        return self._backfill(
+            {'location': 1},
+            lambda job: {'region_codes': normalize_location(job.get('location', ''))}
+        )
+
+    def backfill_skills(self) -> int:
+        """기존 채용공고의 skills를 표준 명칭으로 변환합니다."""
+        return self._backfill(
+            {'skills': 1},
+            lambda job: {'skills': canonicalize_skills(job.get('skills') or [])}
+        )
+
+    def get_similar_jobs(self, job_id: str, limit: int = 10) -> Tuple[bool, str, Optional[List[Dict]]]:
+        """유사 채용공고 조회: 미리 계산된 TF-IDF 벡터의 코사인 유사도가 높은 공고를 반환합니다."""
+        try:
+            if not ObjectId.is_valid(job_id):
+                return False, "해당 채용공고를 찾을 수 없습니다", None
+
+            job_index_refresher.refresh(self.db)
+            ranked = similarity_index.similar(job_id, limit)
+            if job_id not in similarity_index:
+                return False, "해당 채용공고를 찾을 수 없습니다", None
+
+            # 유사 공고 카드를 한 번의 $in 조회로 가져와 유사도 순서대로 정렬합니다
+            jobs = {
+                str(job['_id']): job for job in self.db.job_postings.find(
+                    {'_id': {'$in': [ObjectId(similar_id) for similar_id, _ in ranked]}},
+                    JOB_CARD_PROJECTION
+                )
+            }
+
+            similar_jobs = []
+            for similar_id, score in ranked:
+                job = jobs.get(similar_id)
+                if job:
+                    job['similarity'] = score
+                    similar_jobs.append(job)
+
+            return True, "유사 채용공고 조회 성공", similar_jobs
+
+        except Exception as e:
+            return False, f"유사 채용공고 조회 실패: {str(e)}", None
+
+    def iter_export_lines(self, updated_since: Optional[datetime] = None,
+                          batch_size: int = 1000) -> Iterator[str]:
+        """
+        활성 채용공고를 NDJSON 한 줄씩 생성합니다.
+        배치 커서로 읽으므로 전체 목록을 메모리에 올리지 않으며,
+        updated_at 오름차순이므로 마지막 줄의 updated_at을 다음 증분 조회의 updated_since로 사용할 수 있습니다.
+        """
+        query = {'status': 'active'}
+        if updated_since:
+            query['updated_at'] = {'$gte': updated_since}
+
+        cursor = (self.db.job_postings.find(query, EXPORT_PROJECTION, batch_size=batch_size)
+                  .sort('updated_at', ASCENDING))
+        try:
+            for job in cursor:
+                yield dumps(job) + '\n'
+        finally:
+            cursor.close()
+
+    def record_popularity(self, job_id: str, field: str, amount: int = 1) -> None:
+        """
+        공고의 인기 카운터(view_count, bookmark_count, application_count)를 증감합니다.
+        이벤트마다 쓰지 않고 write-behind 집계기에 누적했다가 주기적으로 모아서 반영합니다.
+        """
+        popularity_counter.record(self.db, job_id, field, amount)
+
+    def get_trending_jobs(self, limit: int = 20, user_id: Optional[str] = None) -> Dict:
+        """
+        인기 급상승 공고 목록을 반환합니다.
+        주기적으로 미리 계산한 목록을 메모리에서 제공하므로 요청마다 DB를 조회하지 않습니다.
+        """
+        try:
+            jobs, refreshed_at = trending_jobs.get(self.db, {**JOB_CARD_PROJECTION, 'company': 1})
+            return {
+                'status': 'success',
+                'data': annotate_jobs(self.db, user_id, jobs[:limit]),
+                'refreshed_at': refreshed_at
+            }
+
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': f"인기 채용공고 조회 실패: {str(e)}"
+            }
+
+    def get_popularity_version(self) -> int:
+        """
+        인기 카운터 버전을 반환합니다. 카운터가 반영될 때마다 증가하므로
+        카운터 값으로 정렬하는 인기순 목록(sort_by=popular)의 ETag 계산에 사용합니다.
+        """
+        return get_collection_version(self.db, POPULARITY_VERSION_KEY)
+
+    def get_counter_bucket(self) -> int:
+        """
+        기본 목록/검색/상세 응답의 ETag에 포함할 시간 버전 (COUNTER_STALENESS_SECONDS마다 바뀝니다).
+        카운터 반영마다 ETag가 바뀌지 않으므로 304 응답과 본문 캐시가 유지되고,
+        응답의 카운터는 최대 이 시간만큼 늦게 반영됩니다.
+        """
+        return int(time.time() // COUNTER_STALENESS_SECONDS)
+
+    def rebuild_popularity_counters(self) -> int:
+        """
+        북마크/지원 내역으로 bookmark_count, application_count를 다시 계산하고
+        popularity_score를 재구성합니다. 조회수는 기록된 값을 유지합니다. 갱신된 공고 수를 반환합니다.
+        """
+        popularity_counter.flush()  # 누적된 증감이 재구성 값에 덮어써지지 않도록 먼저 반영합니다
+
+        def count_by_job(collection, query: Dict) -> Dict[str, int]:
+            return {
+                str(item['_id']): item['count']
+                for item in collection.aggregate([
+                    {'$match': query},
+                    {'$group': {'_id': '$job_posting_id', 'count': {'$sum': 1}}}
+                ], allowDiskUse=True)
+            }
+
+        bookmark_counts = count_by_job(self.db.bookmarks, {})
+        application_counts = count_by_job(self.db.applications, {'status': {'$ne': 'canceled'}})
+
+        def build_update(job: Dict) -> Dict:
+            job_id = str(job['_id'])
+            counts = {
+                'view_count': job.get('view_count') or 0,
+                'bookmark_count': bookmark_counts.get(job_id, 0),
+                'application_count': application_counts.get(job_id, 0)
+            }
+            counts['popularity_score'] = sum(
+                counts[field] * weight for field, weight in POPULARITY_WEIGHTS.items()
+            )
+            return counts
+
+        modified = self._backfill({'view_count': 1}, build_update)
+        trending_jobs.invalidate()
+        return modified
+
+    def get_user_flags_version(self, user_id: str) -> str:
+        """사용자의 북마크/지원 집합 버전을 반환합니다 (사용자별 응답 ETag에 사용)."""
+        return get_user_flags_version(self.db, user_id)
+
+    def get_listing_version(self) -> int:
+        """채용공고 컬렉션 버전을 반환합니다. 목록/검색 응답의 ETag 계산에 사용합니다."""
+        return get_collection_version(self.db, 'job_postings')
+
+    def get_cache_stats(self) -> Dict:
+        """채용공고 상세 캐시의 적중/미스/제거 통계와 요청 병합, 인기 카운터 반영 통계를 반환합니다."""
+        return {
+            **job_detail_cache.stats(),
+            'single_flight': request_flight.stats(),
+            'popularity': popularity_counter.stats()
+        }
\ No newline at end of file
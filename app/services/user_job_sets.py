@@ -0,0 +1,89 @@
+import itertools
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+from ..utils.cache import LRUCache
+
+# 사용자별 북마크/지원한 채용공고 ID 집합 캐시
+# (user_id -> {'bookmarked': set, 'applied': set, 'version': str})
+# 북마크 토글/지원 시 이 프로세스의 집합은 바로 갱신되고, 다른 워커의 집합은 TTL이 지나면 다시 로드됩니다
+user_job_sets = LRUCache(max_size=10000, ttl=300)
+
+# 집합이 로드되거나 변경될 때마다 증가하는 버전 (사용자별 응답 ETag에 사용)
+# 워커 프로세스마다 카운터가 따로 증가하므로 프로세스 토큰을 붙여 버전이 겹치지 않게 합니다
+_PROCESS_TOKEN = os.urandom(4).hex()
+_counter = itertools.count(1)
+_lock = threading.Lock()
+
+def _next_version() -> str:
+    return f'{_PROCESS_TOKEN}:{next(_counter)}'
+
+def _load(db, user_id: str) -> Dict:
+    """DB에서 사용자의 북마크/지원(취소되지 않은) 채용공고 ID 집합을 로드합니다."""
+    bookmarked = {
+        str(bookmark['job_posting_id'])
+        for bookmark in db.bookmarks.find({'user_id': user_id}, {'job_posting_id': 1})
+    }
+    applied = {
+        str(application['job_posting_id'])
+        for application in db.applications.find(
+            {'user_id': user_id, 'status': {'$ne': 'canceled'}}, {'job_posting_id': 1}
+        )
+    }
+    return {'bookmarked': bookmarked, 'applied': applied, 'version': _next_version()}
+
+def get_user_job_sets(db, user_id: str) -> Dict:
+    """사용자의 북마크/지원 집합을 반환합니다. 캐시에 없으면 한 번 로드합니다."""
+    sets = user_job_sets.get(user_id)
+    if sets is None:
+        sets = _load(db, user_id)
+        user_job_sets.set(user_id, sets)
+    return sets
+
+def get_user_flags_version(db, user_id: str) -> str:
+    """사용자의 북마크/지원 집합 버전을 반환합니다 (집합이 바뀌면 함께 바뀝니다)."""
+    return get_user_job_sets(db, user_id)['version']
+
+def update_user_job_set(user_id: str, name: str, job_ids: Iterable[str], present: bool) -> None:
+    """
+    북마크 토글/지원/취소 후 캐시된 집합을 갱신합니다.
+    캐시에 없는 사용자는 다음 조회 시 DB에서 로드하므로 아무것도 하지 않습니다.
+
+    Args:
+        user_id: 사용자 ID
+        name: 'bookmarked' 또는 'applied'
+        job_ids: 변경된 채용공고 ID들
+        present: True면 추가, False면 제거
+    """
+    sets = user_job_sets.get(user_id)
+    if sets is None:
+        return
+    with _lock:
+        target: Set[str] = sets[name]
+        for job_id in job_ids:
+            if present:
+                target.add(str(job_id))
+            else:
+                target.discard(str(job_id))
+        sets['version'] = _next_version()
+
+def invalidate_user_job_sets(user_id: str) -> None:
+    """사용자의 집합을 캐시에서 제거합니다 (다음 조회 시 다시 로드)."""
+    user_job_sets.invalidate(user_id)
+
+def annotate_jobs(db, user_id: Optional[str], jobs: List[Dict]) -> List[Dict]:
+    """
+    채용공고 목록에 is_bookmarked/has_applied 플래그를 추가한 사본을 반환합니다.
+    목록/상세 캐시의 공고 dict는 여러 요청이 공유하므로 원본은 수정하지 않습니다.
+    """
+    if not user_id:
+        return jobs
+    sets = get_user_job_sets(db, user_id)
+    return [
+        {
+            **job,
+            'is_bookmarked': str(job['_id']) in sets['bookmarked'],
+            'has_applied': str(job['_id']) in sets['applied']
+        }
+        for job in jobs
+    ]
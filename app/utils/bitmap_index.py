@@ -0,0 +1,111 @@
+import threading
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+
+def _popcount(bitmap: int) -> int:
+    return bin(bitmap).count('1')
+
+class BitmapIndex:
+    """
+    키(예: 기술 스택)별로 문서 집합을 비트맵으로 관리하는 역색인입니다.
+
+    각 문서에 순번(비트 위치)을 부여하고 키마다 파이썬 정수를 비트셋으로 사용합니다.
+    AND/OR 조건은 비트 연산(&, |)으로 계산하며, 문서 단위로 증분 갱신할 수 있습니다.
+    제거된 문서의 순번은 재사용하여 비트맵이 계속 커지지 않도록 합니다.
+    """
+
+    def __init__(self):
+        self._ordinals: Dict[Hashable, int] = {}   # 문서 ID -> 비트 위치
+        self._doc_ids: List[Hashable] = []         # 비트 위치 -> 문서 ID
+        self._free: List[int] = []                 # 재사용 가능한 비트 위치
+        self._bitmaps: Dict[Hashable, int] = {}    # 키 -> 비트셋
+        self._doc_keys: Dict[Hashable, Set[Hashable]] = {}  # 문서 ID -> 색인된 키
+        self._lock = threading.RLock()
+
+    def add_document(self, doc_id: Hashable, keys: Iterable[Hashable]) -> None:
+        """문서를 색인합니다. 이미 색인된 문서는 키 변경분만 반영합니다."""
+        with self._lock:
+            keys = set(keys)
+            ordinal = self._ordinals.get(doc_id)
+            if ordinal is None:
+                ordinal = self._free.pop() if self._free else len(self._doc_ids)
+                if ordinal == len(self._doc_ids):
+                    self._doc_ids.append(doc_id)
+                else:
+                    self._doc_ids[ordinal] = doc_id
+                self._ordinals[doc_id] = ordinal
+
+            bit = 1 << ordinal
+            previous = self._doc_keys.get(doc_id, set())
+            for key in previous - keys:
+                self._clear_bit(key, bit)
+            for key in keys - previous:
+                self._bitmaps[key] = self._bitmaps.get(key, 0) | bit
+            self._doc_keys[doc_id] = keys
+
+    def remove_document(self, doc_id: Hashable) -> None:
+        """문서를 인덱스에서 제거하고 비트 위치를 반환합니다."""
+        with self._lock:
+            ordinal = self._ordinals.pop(doc_id, None)
+            if ordinal is None:
+                return
+
+            bit = 1 << ordinal
+            for key in self._doc_keys.pop(doc_id, set()):
+                self._clear_bit(key, bit)
+            self._doc_ids[ordinal] = None
+            self._free.append(ordinal)
+
+    def _clear_bit(self, key: Hashable, bit: int) -> None:
+        remaining = self._bitmaps.get(key, 0) & ~bit
+        if remaining:
+            self._bitmaps[key] = remaining
+        else:
+            self._bitmaps.pop(key, None)
+
+    def match_all(self, keys: Iterable[Hashable], limit: Optional[int] = None) -> Optional[List[Hashable]]:
+        """
+        모든 키를 포함하는 문서 ID 목록을 반환합니다 (AND).
+        limit을 지정하면 일치하는 문서가 limit개를 넘을 때 목록을 만들지 않고 None을 반환합니다.
+        """
+        with self._lock:
+            keys = list(keys)
+            if not keys:
+                return []
+            # 가장 작은 비트맵부터 교집합을 계산하여 빨리 비게 만듭니다
+            bitmaps = sorted((self._bitmaps.get(key, 0) for key in keys), key=_popcount)
+            result = bitmaps[0]
+            for bitmap in bitmaps[1:]:
+                if not result:
+                    break
+                result &= bitmap
+            return self._decode(result, limit)
+
+    def match_any(self, keys: Iterable[Hashable], limit: Optional[int] = None) -> Optional[List[Hashable]]:
+        """
+        키 중 하나라도 포함하는 문서 ID 목록을 반환합니다 (OR).
+        limit을 지정하면 일치하는 문서가 limit개를 넘을 때 목록을 만들지 않고 None을 반환합니다.
+        """
+        with self._lock:
+            result = 0
+            for key in keys:
+                result |= self._bitmaps.get(key, 0)
+            return self._decode(result, limit)
+
+    def _decode(self, bitmap: int, limit: Optional[int] = None) -> Optional[List[Hashable]]:
+        """비트셋을 문서 ID 목록으로 변환합니다 (limit개를 넘으면 None)."""
+        if limit is not None and _popcount(bitmap) > limit:
+            return None
+        doc_ids = []
+        while bitmap:
+            lowest = bitmap & -bitmap
+            doc_ids.append(self._doc_ids[lowest.bit_length() - 1])
+            bitmap ^= lowest
+        return doc_ids
+
+    def count(self, key: Hashable) -> int:
+        """키를 포함하는 문서 수를 반환합니다."""
+        with self._lock:
+            return _popcount(self._bitmaps.get(key, 0))
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
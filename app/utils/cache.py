@@ -0,0 +1,94 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+class LRUCache:
+    """
+    크기 제한(LRU)과 만료 시간(TTL)을 함께 적용하는 스레드 안전 캐시입니다.
+
+    가장 오래 사용되지 않은 항목부터 제거하며, TTL이 지난 항목은 조회 시점에 폐기합니다.
+    저장 시 버전을 함께 기록하면, 조회 시 전달한 버전과 다른 항목은 미스로 처리하고 폐기합니다
+    (다른 프로세스의 쓰기처럼 invalidate()가 호출되지 않는 변경을 컬렉션 버전으로 감지할 때 사용).
+    적중/미스/제거 횟수를 집계하여 stats()로 제공합니다.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable, version: Optional[Hashable] = None) -> Optional[Any]:
+        """캐시된 값을 반환합니다. 없거나 만료되었거나 버전이 다른 경우 None을 반환합니다."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, expires_at, entry_version = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            if version is not None and entry_version != version:
+                del self._data[key]
+                self._invalidations += 1
+                self._misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, version: Optional[Hashable] = None) -> None:
+        """값을 (버전과 함께) 저장하고 용량을 초과하면 가장 오래된 항목을 제거합니다."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl, version)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """특정 키를 무효화합니다. 항목이 존재했으면 True를 반환합니다."""
+        with self._lock:
+            if self._data.pop(key, None) is None:
+                return False
+            self._invalidations += 1
+            return True
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스/제거 통계를 반환합니다."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'size': len(self._data),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0.0,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'invalidations': self._invalidations
+            }
+
+def make_filter_signature(query: Dict) -> str:
+    """필터 쿼리를 키 순서와 무관한 캐시 키(해시)로 변환합니다."""
+    normalized = json.dumps(query, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
@@ -0,0 +1,78 @@
+import gzip
+from typing import Hashable, Optional
+from flask import Flask, Response, request
+from .cache import LRUCache
+from .json_encoder import dumps_bytes
+
+try:
+    import brotli  # 설치되어 있으면 br 인코딩을 지원합니다
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+MIN_COMPRESS_SIZE = 1024  # 이보다 작은 응답은 압축하지 않습니다 (바이트)
+COMPRESSIBLE_MIMETYPES = ('application/json',)
+SUPPORTED_ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+# (캐시 키, 인코딩) -> 직렬화/압축이 끝난 응답 본문
+response_body_cache = LRUCache(512, ttl=300)
+
+def negotiate_encoding() -> Optional[str]:
+    """Accept-Encoding 헤더에서 사용할 압축 방식을 고릅니다. 없으면 None을 반환합니다."""
+    return request.accept_encodings.best_match(SUPPORTED_ENCODINGS)
+
+def compress_body(data: bytes, encoding: str) -> bytes:
+    """본문을 지정한 방식으로 압축합니다."""
+    if encoding == 'br':
+        return brotli.compress(data, quality=5)
+    return gzip.compress(data, compresslevel=6)
+
+def _encode_body(data: bytes, encoding: Optional[str]) -> tuple:
+    """임계값 이상인 본문만 압축하여 (본문, 적용된 인코딩)을 반환합니다."""
+    if encoding and len(data) >= MIN_COMPRESS_SIZE:
+        return compress_body(data, encoding), encoding
+    return data, None
+
+def _build_response(body: bytes, encoding: Optional[str]) -> Response:
+    response = Response(body, mimetype='application/json')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+def cached_json_response(cache_key: Hashable) -> Optional[Response]:
+    """
+    캐시된 응답 본문이 있으면 직렬화/압축 없이 그대로 응답을 만듭니다.
+    캐시 키에는 응답 내용이 바뀌면 함께 바뀌는 값(ETag 등)을 사용해야 합니다.
+    """
+    encoding = negotiate_encoding()
+    entry = response_body_cache.get((cache_key, encoding))
+    if entry is None:
+        return None
+    return _build_response(*entry)
+
+def cache_json_response(cache_key: Hashable, payload) -> Response:
+    """페이로드를 직렬화/압축하여 캐시에 저장하고 응답을 반환합니다."""
+    encoding = negotiate_encoding()
+    entry = _encode_body(dumps_bytes(payload) + b'\n', encoding)
+    response_body_cache.set((cache_key, encoding), entry)
+    return _build_response(*entry)
+
+def compress_response(response: Response) -> Response:
+    """after_request 훅: 임계값 이상의 JSON 응답을 클라이언트가 지원하는 방식으로 압축합니다."""
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return response
+    response.vary.add('Accept-Encoding')
+
+    if (response.status_code != 200 or response.direct_passthrough
+            or response.is_streamed or 'Content-Encoding' in response.headers):
+        return response
+
+    body, encoding = _encode_body(response.get_data(), negotiate_encoding())
+    if encoding:
+        response.set_data(body)
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+def init_compression(app: Flask) -> None:
+    """앱의 모든 JSON 응답에 압축을 적용합니다."""
+    app.after_request(compress_response)
@@ -0,0 +1,30 @@
+from typing import Dict, Iterable, Optional
+from pymongo import ReturnDocument
+
+def serialize_document(doc: Dict, exclude: Iterable[str] = ()) -> Dict:
+    """응답용으로 문서의 _id를 문자열로 바꾸고 제외할 필드를 제거합니다."""
+    doc['_id'] = str(doc['_id'])
+    for field in exclude:
+        doc.pop(field, None)
+    return doc
+
+def update_and_return(collection, query: Dict, update, projection: Optional[Dict] = None,
+                      exclude: Iterable[str] = ()) -> Optional[Dict]:
+    """
+    find_one_and_update로 문서를 갱신하고 갱신된 문서를 응답용으로 변환해 반환합니다.
+    갱신 후 다시 조회하지 않으므로 한 번의 왕복으로 처리됩니다. 일치하는 문서가 없으면 None을 반환합니다.
+
+    Args:
+        collection: 대상 컬렉션
+        query: 갱신할 문서 조건
+        update: 갱신 내용 (연산자 문서 또는 파이프라인)
+        projection: 반환할 필드 (민감하거나 큰 필드는 0으로 제외)
+        exclude: 조회 후 응답에서 제거할 필드
+    """
+    doc = collection.find_one_and_update(
+        query,
+        update,
+        projection=projection,
+        return_document=ReturnDocument.AFTER
+    )
+    return serialize_document(doc, exclude) if doc else None
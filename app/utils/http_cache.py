@@ -0,0 +1,28 @@
+import hashlib
+from typing import Optional
+from flask import Response, request
+
+def make_etag(*parts) -> str:
+    """응답을 식별하는 값들로 ETag 값을 생성합니다."""
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+def request_signature() -> str:
+    """쿼리 파라미터를 순서와 무관하게 정규화한 문자열을 반환합니다."""
+    return '&'.join(f'{key}={value}' for key, value in sorted(request.args.items(multi=True)))
+
+def not_modified(etag: str) -> Optional[Response]:
+    """
+    If-None-Match가 ETag와 일치하면 본문 없는 304 응답을 반환합니다.
+    일치하지 않으면 None을 반환하며, 호출한 쪽에서 전체 응답을 생성합니다.
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        return with_etag(response, etag)
+    return None
+
+def with_etag(response: Response, etag: str) -> Response:
+    """응답에 약한 ETag를 설정하고, 클라이언트가 재검증하도록 Cache-Control을 지정합니다."""
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
@@ -0,0 +1,61 @@
+import json
+from datetime import date, datetime, timezone
+from typing import Any
+from bson import ObjectId
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson  # 설치되어 있으면 C 구현 JSON 라이브러리를 사용합니다
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+def bson_default(value: Any) -> Any:
+    """JSON 기본 타입이 아닌 BSON 값을 변환합니다 (ObjectId -> 문자열, 날짜 -> ISO 8601)."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        # MongoDB의 날짜는 naive UTC이므로 orjson(OPT_NAIVE_UTC)과 같이 +00:00을 붙입니다
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+if orjson is not None:
+    # naive datetime은 UTC로 간주하여 +00:00을 붙입니다 (표준 json 경로와 같은 형식)
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON 바이트로 직렬화합니다."""
+        return orjson.dumps(obj, default=bson_default, option=ORJSON_OPTIONS)
+else:
+    def dumps_bytes(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON 바이트로 직렬화합니다."""
+        return json.dumps(
+            obj, default=bson_default, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+
+def dumps(obj: Any) -> str:
+    """객체를 JSON 문자열로 직렬화합니다."""
+    return dumps_bytes(obj).decode('utf-8')
+
+class MongoJSONProvider(DefaultJSONProvider):
+    """
+    ObjectId, datetime, 중첩 문서를 그대로 직렬화하는 Flask JSON 프로바이더입니다.
+    서비스에서 문서마다 ObjectId를 문자열로 바꾸지 않아도 jsonify로 응답할 수 있습니다.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            # indent 등 옵션이 필요한 경우에는 표준 json을 사용합니다
+            kwargs.setdefault('default', bson_default)
+            kwargs.setdefault('ensure_ascii', False)
+            return json.dumps(obj, **kwargs)
+        return dumps(obj)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
@@ -0,0 +1,285 @@
+import re
+from typing import Dict, List, Optional
+
+# 급여 지급 주기 키워드 (앞에 있는 키워드일수록 우선)
+SALARY_PERIOD_KEYWORDS = [
+    ('hour', ('시급',)),
+    ('day', ('일급', '일당')),
+    ('month', ('월급',)),
+    ('year', ('연봉',)),
+]
+
+# 명시적인 키워드가 없을 때만 사용하는 약식 표기 ("월 300만원", "년 4,000만원")
+SALARY_PERIOD_SHORT_KEYWORDS = [
+    ('month', ('월',)),
+    ('year', ('년',)),
+]
+
+# 지급 주기별 연간 환산 배수 (주 40시간 기준 월 209시간, 월 22일 근무)
+ANNUAL_MULTIPLIERS = {
+    'year': 1,
+    'month': 12,
+    'day': 22 * 12,
+    'hour': 209 * 12,
+}
+
+SALARY_NUMBER = r'\d[\d,]*(?:\.\d+)?'
+
+# 단위가 붙은 금액 하나 ("1억 2,000만", "3,500만", "9,860원")
+# 단위 없는 숫자는 "3,500~4,000만원"처럼 범위의 앞쪽일 때만 금액으로 인정합니다 ("주 5일"의 5는 제외)
+SALARY_AMOUNT_PATTERN = re.compile(
+    rf'(?P<eok>{SALARY_NUMBER})\s*억(?:\s*(?P<eok_man>{SALARY_NUMBER})\s*만)?'
+    rf'|(?P<man>{SALARY_NUMBER})\s*만'
+    rf'|(?P<won>{SALARY_NUMBER})\s*원'
+    rf'|(?P<bare>{SALARY_NUMBER})(?=\s*[~\-]\s*\d)'
+)
+
+# 괄호 안의 보조 표기 ("연봉 3,600만원(월 300만원)", "(주 5일)")
+SALARY_PARENTHESIS_PATTERN = re.compile(r'\([^)]*\)')
+
+def _to_number(text: str) -> float:
+    return float(text.replace(',', ''))
+
+def _extract_salary_amounts(text: str) -> List[float]:
+    """급여 문자열에서 금액(만원 단위)을 추출합니다."""
+    amounts = []
+    bare_numbers = []  # 범위 앞쪽의 단위 없는 숫자 (뒤 금액의 단위를 따릅니다)
+    for match in SALARY_AMOUNT_PATTERN.finditer(text):
+        if match.group('bare'):
+            bare_numbers.append(_to_number(match.group('bare')))
+            continue
+
+        if match.group('eok'):
+            value = _to_number(match.group('eok')) * 10000
+            if match.group('eok_man'):
+                value += _to_number(match.group('eok_man'))
+            scale = 10000
+        elif match.group('man'):
+            value = _to_number(match.group('man'))
+            scale = 1
+        else:
+            value = _to_number(match.group('won')) / 10000  # 원 단위 -> 만원 단위
+            scale = 1 / 10000
+
+        amounts.extend(number * scale for number in bare_numbers)
+        bare_numbers = []
+        amounts.append(value)
+    return amounts
+
+def _find_period(text: str, keywords: List) -> Optional[str]:
+    for period, words in keywords:
+        if any(word in text for word in words):
+            return period
+    return None
+
+def _detect_salary_period(text: str, full_text: str) -> str:
+    """
+    급여 문자열에서 지급 주기를 판별합니다. 명시되지 않으면 연봉으로 간주합니다.
+    금액을 읽은 본문의 키워드를 우선하고, 괄호 안에서는 명시적인 키워드(월급, 연봉 등)만 사용합니다.
+    """
+    return (_find_period(text, SALARY_PERIOD_KEYWORDS)
+            or _find_period(text, SALARY_PERIOD_SHORT_KEYWORDS)
+            or _find_period(full_text, SALARY_PERIOD_KEYWORDS)
+            or 'year')
+
+def parse_salary(salary_text: str) -> Optional[Dict]:
+    """
+    급여 문자열을 연간 환산 금액(만원 단위)으로 변환합니다.
+
+    "3,500~4,000만원"          -> {'min': 3500, 'max': 4000, 'unit': '만원', 'period': 'year'}
+    "월급 300만원"              -> {'min': 3600, 'max': 3600, 'unit': '만원', 'period': 'month'}
+    "1억 2,000만원"             -> {'min': 12000, 'max': 12000, 'unit': '만원', 'period': 'year'}
+    "연봉 3,600만원(월 300만원)" -> {'min': 3600, 'max': 3600, 'unit': '만원', 'period': 'year'}
+    "회사내규에 따름"           -> None
+
+    괄호 밖에 금액이 있으면 괄호 안의 보조 표기는 무시합니다.
+    min은 항상 max 이하이며, 금액이 하나뿐이면 min과 max가 같습니다.
+
+    Args:
+        salary_text: 크롤링된 급여 문자열
+
+    Returns:
+        Optional[Dict]: 변환된 급여 정보. 금액이 없으면 None
+    """
+    if not salary_text:
+        return None
+
+    text = SALARY_PARENTHESIS_PATTERN.sub(' ', salary_text)
+    amounts = _extract_salary_amounts(text)
+    if not amounts:
+        text = salary_text
+        amounts = _extract_salary_amounts(text)
+    if not amounts:
+        return None
+
+    period = _detect_salary_period(text, salary_text)
+    annual = [round(amount * ANNUAL_MULTIPLIERS[period]) for amount in amounts]
+    if not any(annual):
+        return None
+
+    return {
+        'min': min(annual),
+        'max': max(annual),
+        'unit': '만원',
+        'period': period
+    }
+
+def empty_salary() -> Dict:
+    """급여 정보가 없거나 변환할 수 없을 때 저장하는 기본값입니다."""
+    return {'min': 0, 'max': 0, 'unit': '만원', 'period': None}
+
+# 시/도 정식 명칭과 약칭 -> 표준 약칭
+SIDO_ALIASES = {
+    '서울': ('서울특별시', '서울시', '서울'),
+    '부산': ('부산광역시', '부산시', '부산'),
+    '대구': ('대구광역시', '대구시', '대구'),
+    '인천': ('인천광역시', '인천시', '인천'),
+    '광주': ('광주광역시', '광주'),
+    '대전': ('대전광역시', '대전시', '대전'),
+    '울산': ('울산광역시', '울산시', '울산'),
+    '세종': ('세종특별자치시', '세종시', '세종'),
+    '경기': ('경기도', '경기'),
+    '강원': ('강원특별자치도', '강원도', '강원'),
+    '충북': ('충청북도', '충북'),
+    '충남': ('충청남도', '충남'),
+    '전북': ('전북특별자치도', '전라북도', '전북'),
+    '전남': ('전라남도', '전남'),
+    '경북': ('경상북도', '경북'),
+    '경남': ('경상남도', '경남'),
+    '제주': ('제주특별자치도', '제주도', '제주'),
+    '전국': ('전국',),
+    '해외': ('해외',),
+}
+SIDO_LOOKUP = {alias: sido for sido, aliases in SIDO_ALIASES.items() for alias in aliases}
+
+REGION_SEPARATOR = '>'  # 계층 구분자 (예: 서울>강남구)
+SIGUNGU_PATTERN = re.compile(r'^\S+(시|군|구)$')
+
+def _normalize_sido(token: str) -> Optional[str]:
+    """'서울전체', '서울특별시' 같은 시/도 표기를 표준 약칭으로 변환합니다."""
+    token = token.replace('전체', '')
+    return SIDO_LOOKUP.get(token)
+
+def normalize_location(location_text: str) -> List[str]:
+    """
+    근무지역 문자열을 계층형 지역 코드 목록으로 변환합니다.
+
+    "서울 강남구"          -> ['서울', '서울>강남구']
+    "경기 성남시 분당구 외" -> ['경기', '경기>성남시', '경기>성남시>분당구']
+    "서울전체, 부산 해운대구" -> ['서울', '부산', '부산>해운대구']
+
+    상위 지역 코드를 함께 저장하므로 시/도 또는 시/군/구 필터를
+    인덱스를 사용하는 정확 일치 조건으로 처리할 수 있습니다.
+
+    Args:
+        location_text: 크롤링된 근무지역 문자열
+
+    Returns:
+        List[str]: 지역 코드 목록. 인식할 수 없으면 빈 목록
+    """
+    codes: List[str] = []
+    for part in re.split(r'[,/·]', location_text or ''):
+        tokens = part.split()
+        if not tokens:
+            continue
+
+        sido = _normalize_sido(tokens[0])
+        if not sido:
+            continue
+
+        path = [sido]
+        for token in tokens[1:]:
+            if not SIGUNGU_PATTERN.match(token) or len(path) >= 3:
+                break
+            path.append(token)
+
+        for depth in range(1, len(path) + 1):
+            code = REGION_SEPARATOR.join(path[:depth])
+            if code not in codes:
+                codes.append(code)
+
+    return codes
+
+def normalize_region_filter(location: str) -> List[str]:
+    """
+    지역 필터 입력을 지역 코드 목록으로 변환합니다.
+    "서울 강남구, 부산"처럼 여러 지역이면 각 지역의 가장 구체적인 코드를 반환하며,
+    인식할 수 없는 입력이면 빈 목록을 반환합니다.
+    """
+    codes = normalize_location(location)
+    return [
+        code for code in codes
+        if not any(other.startswith(code + REGION_SEPARATOR) for other in codes)
+    ]
+
+# 기술 스택 표준 명칭 -> 별칭 (별칭은 소문자/공백 제거 후 비교)
+SKILL_ALIASES = {
+    'Python': ('python', '파이썬'),
+    'Java': ('java', '자바'),
+    'JavaScript': ('javascript', 'js', '자바스크립트'),
+    'TypeScript': ('typescript', 'ts', '타입스크립트'),
+    'C': ('c', 'c언어'),
+    'C++': ('c++', 'cpp'),
+    'C#': ('c#', 'csharp'),
+    'Go': ('go', 'golang', '고'),
+    'Kotlin': ('kotlin', '코틀린'),
+    'Swift': ('swift', '스위프트'),
+    'PHP': ('php',),
+    'Ruby': ('ruby', '루비'),
+    'React': ('react', 'react.js', 'reactjs', '리액트'),
+    'Vue.js': ('vue', 'vue.js', 'vuejs', '뷰'),
+    'Angular': ('angular', 'angularjs', '앵귤러'),
+    'Node.js': ('node', 'node.js', 'nodejs', '노드'),
+    'Spring': ('spring', '스프링'),
+    'Spring Boot': ('springboot', '스프링부트'),
+    'Django': ('django', '장고'),
+    'Flask': ('flask', '플라스크'),
+    'Flutter': ('flutter', '플러터'),
+    'Android': ('android', '안드로이드'),
+    'iOS': ('ios',),
+    'SQL': ('sql',),
+    'MySQL': ('mysql',),
+    'PostgreSQL': ('postgresql', 'postgres'),
+    'Oracle': ('oracle', '오라클'),
+    'MongoDB': ('mongodb', 'mongo', '몽고디비'),
+    'Redis': ('redis', '레디스'),
+    'AWS': ('aws', 'amazonwebservices'),
+    'Docker': ('docker', '도커'),
+    'Kubernetes': ('kubernetes', 'k8s', '쿠버네티스'),
+    'Linux': ('linux', '리눅스'),
+    'Git': ('git', '깃'),
+    'AI': ('ai', '인공지능'),
+    '머신러닝': ('머신러닝', 'machinelearning', 'ml'),
+    '딥러닝': ('딥러닝', 'deeplearning'),
+}
+
+def skill_key(skill: str) -> str:
+    """기술 스택 비교용 키 (소문자, 공백 제거)"""
+    return ''.join((skill or '').split()).lower()
+
+SKILL_LOOKUP = {skill_key(alias): skill for skill, aliases in SKILL_ALIASES.items() for alias in aliases}
+
+def canonicalize_skill(skill: str) -> str:
+    """기술 스택을 표준 명칭으로 변환합니다. 사전에 없으면 공백만 정리하여 반환합니다."""
+    skill = ' '.join((skill or '').split())
+    if skill.endswith(' 외'):
+        skill = skill[:-2].rstrip()  # 사람인 목록의 "... 외" 표기 제거
+    return SKILL_LOOKUP.get(skill_key(skill), skill)
+
+def canonicalize_skills(skills) -> List[str]:
+    """
+    기술 스택 목록을 표준 명칭으로 변환하고 중복을 제거합니다.
+    "Python", "python", " 파이썬"은 모두 "Python" 하나가 됩니다.
+    """
+    if isinstance(skills, str):
+        skills = skills.split(',')
+
+    canonical: List[str] = []
+    seen = set()
+    for skill in skills or []:
+        name = canonicalize_skill(skill)
+        key = skill_key(name)
+        if key and key not in seen:
+            seen.add(key)
+            canonical.append(name)
+    return canonical
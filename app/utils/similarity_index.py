@@ -0,0 +1,209 @@
+import math
+import threading
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+import numpy as np
+
+class SimilarityIndex:
+    """
+    TF-IDF 벡터 기반 유사 문서 인덱스입니다.
+
+    어휘/IDF와 L2 정규화된 TF-IDF 행렬(NumPy)을 한 번 구성한 뒤, 문서가 추가/변경/제거되면
+    현재 어휘/IDF로 해당 문서의 행만 다시 계산합니다. 변경된 문서가 전체의 rebuild_ratio를
+    넘으면 어휘/IDF를 포함한 전체 재구성을 백그라운드 스레드에서 수행하고 결과를 교체하므로,
+    조회 요청은 전체 재구성 비용을 기다리지 않습니다 (최초 구성만 첫 조회에서 수행).
+    유사도는 행렬-벡터 곱(코사인 유사도)으로 계산합니다.
+
+    행렬은 프로세스(워커)마다 하나씩 메모리에 올라가므로 float16으로 저장합니다.
+    메모리 상한은 약 (문서 수 × 1.25) × max_features × 2바이트로, 기본값(1024)이면
+    문서당 약 2.5KB, 5만 건에 약 125MB입니다. 유사도는 기준 문서 벡터의 0이 아닌 열만
+    float32로 변환하여 계산하므로, 추가 메모리는 (문서 수 × 기준 문서의 용어 수)로 제한됩니다.
+    """
+
+    dtype = np.float16  # 행렬 저장 타입 (계산은 float32)
+
+    def __init__(self, max_features: int = 1024, min_df: int = 1, rebuild_ratio: float = 0.2):
+        self.max_features = max_features  # 어휘 크기 상한 (문서 빈도 상위)
+        self.min_df = min_df
+        self.rebuild_ratio = rebuild_ratio  # 전체 재구성을 시작하는 변경 문서 비율
+        self._term_counts: Dict[Hashable, Counter] = {}
+        self._columns: Dict[str, int] = {}
+        self._idf = np.zeros(0, dtype=np.float32)
+        self._matrix = np.zeros((0, 0), dtype=self.dtype)  # 여유 행을 포함한 행렬
+        self._doc_ids: List[Optional[Hashable]] = []  # 행 -> 문서 ID (제거된 행은 None)
+        self._rows: Dict[Hashable, int] = {}
+        self._free_rows: List[int] = []
+        self._built = False
+        self._changes = 0  # 마지막 전체 재구성 이후 변경된 문서 수
+        self._rebuilding = False
+        self._changed_during_rebuild = set()
+        self._rebuilds = 0
+        self._lock = threading.RLock()
+
+    def add_document(self, doc_id: Hashable, tokens: Iterable[str]) -> None:
+        """문서의 토큰을 등록합니다. 이미 등록된 문서는 교체합니다."""
+        counts = Counter(tokens)
+        with self._lock:
+            if self._term_counts.get(doc_id) == counts:
+                return
+            self._term_counts[doc_id] = counts
+            self._document_changed(doc_id)
+
+    def remove_document(self, doc_id: Hashable) -> None:
+        """문서를 인덱스에서 제거합니다."""
+        with self._lock:
+            if self._term_counts.pop(doc_id, None) is not None:
+                self._document_changed(doc_id)
+
+    def _document_changed(self, doc_id: Hashable) -> None:
+        """변경된 문서의 행만 갱신하고, 변경이 누적되면 백그라운드 재구성을 시작합니다."""
+        if not self._built:
+            return  # 최초 구성 시 함께 계산됩니다
+        self._apply_row(doc_id)
+        if self._rebuilding:
+            self._changed_during_rebuild.add(doc_id)
+        self._changes += 1
+        if not self._rebuilding and self._changes > self.rebuild_ratio * max(len(self._term_counts), 1):
+            self._rebuilding = True
+            threading.Thread(target=self._rebuild_in_background, daemon=True).start()
+
+    def _vectorize(self, counts: Counter, columns: Dict[str, int], idf: np.ndarray) -> np.ndarray:
+        """토큰 빈도를 L2 정규화된 TF-IDF 벡터로 변환합니다."""
+        vector = np.zeros(len(columns), dtype=np.float32)
+        for term, count in counts.items():
+            column = columns.get(term)
+            if column is not None:
+                vector[column] = (1 + math.log(count)) * idf[column]  # 로그 스케일 TF
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _apply_row(self, doc_id: Hashable) -> None:
+        """현재 어휘/IDF로 문서의 행을 다시 계산하거나, 제거된 문서의 행을 비웁니다."""
+        counts = self._term_counts.get(doc_id)
+        row = self._rows.get(doc_id)
+        if counts is None:
+            if row is not None:
+                self._matrix[row] = 0
+                self._doc_ids[row] = None
+                self._free_rows.append(row)
+                del self._rows[doc_id]
+            return
+
+        if row is None:
+            row = self._allocate_row()
+            self._rows[doc_id] = row
+            self._doc_ids[row] = doc_id
+        self._matrix[row] = self._vectorize(counts, self._columns, self._idf)
+
+    def _allocate_row(self) -> int:
+        """빈 행을 재사용하거나 행렬 끝에 행을 추가합니다 (용량이 부족하면 두 배로 늘립니다)."""
+        if self._free_rows:
+            return self._free_rows.pop()
+        row = len(self._doc_ids)
+        if row >= self._matrix.shape[0]:
+            grown = np.zeros((max(16, row * 2), self._matrix.shape[1]), dtype=self.dtype)
+            grown[:row] = self._matrix[:row]
+            self._matrix = grown
+        self._doc_ids.append(None)
+        return row
+
+    def _build(self, term_counts: Dict[Hashable, Counter]) -> tuple:
+        """어휘, IDF, TF-IDF 행렬을 계산합니다 (인덱스 상태는 변경하지 않음)."""
+        doc_ids = list(term_counts)
+        document_frequency = Counter()
+        for counts in term_counts.values():
+            document_frequency.update(counts.keys())
+
+        vocabulary = [
+            term for term, df in document_frequency.most_common(self.max_features)
+            if df >= self.min_df
+        ]
+        columns = {term: column for column, term in enumerate(vocabulary)}
+        total = len(doc_ids)
+        idf = np.array(
+            [math.log((1 + total) / (1 + document_frequency[term])) + 1 for term in vocabulary],
+            dtype=np.float32
+        )
+
+        # 재구성 이후 추가되는 문서를 위해 여유 행을 둡니다
+        matrix = np.zeros((total + max(16, total // 4), len(vocabulary)), dtype=self.dtype)
+        for row, doc_id in enumerate(doc_ids):
+            matrix[row] = self._vectorize(term_counts[doc_id], columns, idf)
+        return columns, idf, matrix, doc_ids
+
+    def _install(self, built: tuple) -> None:
+        """계산된 어휘/IDF/행렬로 인덱스 상태를 교체합니다."""
+        self._columns, self._idf, self._matrix, doc_ids = built
+        self._doc_ids = list(doc_ids)
+        self._rows = {doc_id: row for row, doc_id in enumerate(doc_ids)}
+        self._free_rows = []
+        self._built = True
+        self._changes = 0
+        self._rebuilds += 1
+
+    def rebuild(self) -> None:
+        """어휘/IDF를 포함하여 인덱스 전체를 즉시 다시 계산합니다."""
+        with self._lock:
+            self._install(self._build(dict(self._term_counts)))
+
+    def _rebuild_in_background(self) -> None:
+        """현재 문서들의 사본으로 전체를 재구성한 뒤, 그동안 변경된 문서의 행을 다시 반영합니다."""
+        try:
+            with self._lock:
+                # Counter는 교체만 되고 수정되지 않으므로 얕은 복사로 충분합니다
+                term_counts = dict(self._term_counts)
+                self._changed_during_rebuild = set()
+            built = self._build(term_counts)
+            with self._lock:
+                self._install(built)
+                for doc_id in self._changed_during_rebuild:
+                    self._apply_row(doc_id)
+                self._changes = len(self._changed_during_rebuild)
+        finally:
+            with self._lock:
+                self._rebuilding = False
+                self._changed_during_rebuild = set()
+
+    def similar(self, doc_id: Hashable, limit: int = 10) -> List[Tuple[Hashable, float]]:
+        """문서와 코사인 유사도가 높은 순으로 (문서 ID, 유사도) 목록을 반환합니다."""
+        with self._lock:
+            if not self._built:
+                self.rebuild()
+
+            row = self._rows.get(doc_id)
+            if row is None or limit <= 0:
+                return []
+
+            matrix = self._matrix[:len(self._doc_ids)]
+            # 기준 벡터가 0인 열은 내적에 기여하지 않으므로 0이 아닌 열만 사용합니다
+            columns = np.flatnonzero(matrix[row])
+            scores = matrix[:, columns].astype(np.float32) @ matrix[row, columns].astype(np.float32)
+            scores[row] = -1  # 자기 자신 제외 (제거된 빈 행은 0이므로 결과에서 빠집니다)
+
+            limit = min(limit, len(scores) - 1)
+            if limit <= 0:
+                return []
+            candidates = np.argpartition(-scores, limit - 1)[:limit]
+            ranked = candidates[np.argsort(-scores[candidates])]
+            return [
+                (self._doc_ids[index], round(float(scores[index]), 4))
+                for index in ranked if scores[index] > 0
+            ]
+
+    def stats(self) -> Dict:
+        """문서 수, 어휘 크기, 행렬 메모리, 전체 재구성 횟수와 마지막 재구성 이후 변경된 문서 수를 반환합니다."""
+        with self._lock:
+            return {
+                'documents': len(self._term_counts),
+                'features': len(self._columns),
+                'matrix_bytes': self._matrix.nbytes,
+                'rebuilds': self._rebuilds,
+                'changes_since_rebuild': self._changes,
+                'rebuilding': self._rebuilding
+            }
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._term_counts
+
+    def __len__(self) -> int:
+        return len(self._term_counts)
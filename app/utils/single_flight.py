@@ -0,0 +1,63 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class _Call:
+    """진행 중인 하나의 계산과 그 결과를 보관합니다."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight:
+    """
+    같은 키의 동시 요청을 하나의 계산으로 합치는 요청 병합(single-flight) 도구입니다.
+
+    먼저 들어온 요청만 실제로 계산하고, 계산이 끝나기 전에 들어온 같은 키의 요청은
+    그 결과(또는 예외)를 그대로 공유합니다. 계산이 끝나면 키를 제거하므로
+    결과를 캐시하지는 않습니다. 공유된 결과는 호출한 쪽에서 수정하지 않아야 합니다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._executions = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """키에 대해 진행 중인 계산이 있으면 기다렸다가 결과를 공유하고, 없으면 fn을 실행합니다."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def stats(self) -> Dict:
+        """실제 실행 횟수와 결과를 공유받은 요청 수를 반환합니다."""
+        with self._lock:
+            return {
+                'in_flight': len(self._calls),
+                'executions': self._executions,
+                'shared': self._shared
+            }
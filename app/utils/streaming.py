@@ -0,0 +1,38 @@
+import zlib
+from typing import Iterable, Iterator
+
+def ndjson_chunks(lines: Iterable[str], compress: bool = False,
+                  chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    NDJSON 줄들을 일정 크기의 바이트 청크로 묶어 반환합니다.
+    compress가 True이면 gzip 형식으로 스트리밍 압축합니다.
+
+    Args:
+        lines: 줄바꿈으로 끝나는 JSON 문자열들
+        compress: gzip 압축 여부
+        chunk_size: 청크 크기 (바이트)
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None  # wbits=31: gzip 헤더
+    buffer = []
+    buffered = 0
+
+    def flush() -> bytes:
+        data = b''.join(buffer)
+        buffer.clear()
+        return compressor.compress(data) if compressor else data
+
+    for line in lines:
+        encoded = line.encode('utf-8')
+        buffer.append(encoded)
+        buffered += len(encoded)
+        if buffered >= chunk_size:
+            buffered = 0
+            chunk = flush()
+            if chunk:
+                yield chunk
+
+    chunk = flush()
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
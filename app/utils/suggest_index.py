@@ -0,0 +1,81 @@
+import heapq
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+class SuggestionIndex:
+    """
+    자동완성용 접두어 인덱스입니다.
+
+    (정규화된 용어, 유형) 튜플을 정렬된 배열로 유지하고 이진 탐색으로 접두어 범위를 찾은 뒤,
+    범위 안에서 빈도 상위 k개를 반환합니다.
+    문서 단위로 용어를 추가/제거할 수 있어 전체 재구성 없이 증분 갱신이 가능합니다.
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[str, str]] = []                  # 정렬된 (용어, 유형) 목록
+        self._entries: Dict[Tuple[str, str], Dict] = {}         # (용어, 유형) -> {'text', 'type', 'count'}
+        self._doc_terms: Dict[Hashable, List[Tuple[str, str]]] = {}  # 문서 ID -> 색인된 용어 목록
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """비교용 용어 정규화 (공백 정리, 소문자 변환)"""
+        return ' '.join(text.split()).lower()
+
+    def add_document(self, doc_id: Hashable, terms: Iterable[Tuple[str, str]]) -> None:
+        """
+        문서의 용어를 색인합니다. 이미 색인된 문서는 기존 용어를 제거한 뒤 다시 색인합니다.
+
+        Args:
+            doc_id: 문서 식별자
+            terms: (유형, 원문 용어) 목록
+        """
+        with self._lock:
+            self.remove_document(doc_id)
+
+            keys = []
+            for term_type, text in terms:
+                normalized = self.normalize(text or '')
+                if not normalized:
+                    continue
+
+                key = (normalized, term_type)
+                if key in keys:
+                    continue
+                keys.append(key)
+
+                entry = self._entries.get(key)
+                if entry is None:
+                    self._entries[key] = {'text': text.strip(), 'type': term_type, 'count': 1}
+                    insort(self._keys, key)
+                else:
+                    entry['count'] += 1
+
+            self._doc_terms[doc_id] = keys
+
+    def remove_document(self, doc_id: Hashable) -> None:
+        """문서의 용어를 인덱스에서 제거합니다."""
+        with self._lock:
+            for key in self._doc_terms.pop(doc_id, []):
+                entry = self._entries[key]
+                entry['count'] -= 1
+                if entry['count'] <= 0:
+                    del self._entries[key]
+                    del self._keys[bisect_left(self._keys, key)]
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """접두어로 시작하는 용어 중 빈도 상위 limit개를 반환합니다."""
+        normalized = self.normalize(prefix or '')
+        if not normalized:
+            return []
+
+        with self._lock:
+            start = bisect_left(self._keys, (normalized,))
+            end = bisect_left(self._keys, (normalized + '\uffff',))
+            candidates = (self._entries[key] for key in self._keys[start:end])
+            top = heapq.nlargest(limit, candidates, key=lambda entry: entry['count'])
+            return [dict(entry) for entry in top]
+
+    def __len__(self) -> int:
+        return len(self._keys)
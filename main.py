@@ -12,6 +12,8 @@ from app.routes.job_routes import job_bp
 from app.routes.application_routes import application_bp
 from app.routes.bookmark_routes import bookmark_bp
 from app.crawlers.saramin_crawler import SaraminCrawler
+from app.utils.json_encoder import MongoJSONProvider
+from app.utils.compression import init_compression
 from flask_cors import CORS
 
 # 환경변수 로드
@@ -19,7 +21,9 @@ load_dotenv()
 
 def create_app():
     app = Flask(__name__)
+    app.json = MongoJSONProvider(app)  # ObjectId/datetime을 처리하는 JSON 직렬화
     CORS(app)  # CORS 설정 추가
+    init_compression(app)  # 1KB 이상의 JSON 응답을 gzip/br로 압축
 
     # JWT 설정
     app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'your-secret-key')
@@ -93,6 +97,17 @@ def create_app():
                         "totalItems": {"type": "integer"},
                         "perPage": {"type": "integer", "example": 20}
                     }
+                },
+                "ResumeVersion": {
+                    "type": "object",
+                    "properties": {
+                        "_id": {"type": "string"},
+                        "version": {"type": "integer"},
+                        "resume_url": {"type": "string"},
+                        "notes": {"type": "string"},
+                        "status": {"type": "string", "example": "active"},
+                        "created_at": {"type": "string", "format": "date-time"}
+                    }
                 }
             }
         },
@@ -0,0 +1,48 @@
+from pymongo import MongoClient
+from app.services.job_service import JobService
+from app.utils.streaming import ndjson_chunks
+from datetime import datetime
+import argparse
+import logging
+import os
+import sys
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def main():
+    parser = argparse.ArgumentParser(description='활성 채용공고를 NDJSON으로 내보냅니다')
+    parser.add_argument('--output', '-o', help='출력 파일 경로 (기본: 표준 출력)')
+    parser.add_argument('--updated-since', help='이 시각(ISO 8601) 이후 수정된 공고만 내보냅니다')
+    parser.add_argument('--gzip', action='store_true', help='gzip으로 압축합니다')
+    args = parser.parse_args()
+
+    updated_since = datetime.fromisoformat(args.updated_since) if args.updated_since else None
+
+    try:
+        # MongoDB 연결
+        client = MongoClient(os.getenv('MONGODB_URI', 'mongodb://localhost:27017'))
+        db = client[os.getenv('DATABASE_NAME', 'job_portal')]
+
+        output = open(args.output, 'wb') if args.output else sys.stdout.buffer
+        try:
+            lines = JobService(db).iter_export_lines(updated_since=updated_since)
+            for chunk in ndjson_chunks(lines, compress=args.gzip):
+                output.write(chunk)
+        finally:
+            if args.output:
+                output.close()
+
+        logger.info("내보내기 완료")
+
+    except Exception as e:
+        logger.error(f"실행 중 오류 발생: {str(e)}")
+    finally:
+        if 'client' in locals():
+            client.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+from pymongo import MongoClient
+from app.services.company_service import CompanyService
+from app.services.job_service import JobService
+from app.services.application_service import ApplicationService
+from app.services.bookmark_service import BookmarkService
+from app.models.init_db import init_indexes
+import argparse
+import logging
+import os
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def backfill_company_snapshots(db):
+    """모든 채용공고에 회사 스냅샷을 백필합니다"""
+    modified = CompanyService(db).backfill_job_snapshots()
+    logger.info(f"회사 스냅샷 백필 완료: {modified}개 채용공고 갱신")
+
+def backfill_salaries(db):
+    """salary_text를 파싱하여 salary를 백필합니다"""
+    modified = JobService(db).backfill_salaries()
+    logger.info(f"급여 정보 백필 완료: {modified}개 채용공고 갱신")
+
+def backfill_region_codes(db):
+    """location을 변환하여 region_codes를 백필합니다"""
+    modified = JobService(db).backfill_region_codes()
+    logger.info(f"지역 코드 백필 완료: {modified}개 채용공고 갱신")
+
+def backfill_skills(db):
+    """skills를 표준 명칭으로 변환합니다"""
+    modified = JobService(db).backfill_skills()
+    logger.info(f"기술 스택 표준화 완료: {modified}개 채용공고 갱신")
+
+def rebuild_application_stats(db):
+    """지원 내역으로 사용자별 지원 통계 문서를 재구성합니다"""
+    users = ApplicationService(db).rebuild_statistics()
+    logger.info(f"지원 통계 재구성 완료: {users}명")
+
+def backfill_application_flags(db):
+    """기존 지원 내역에 is_active(취소 여부)를 백필합니다 (indexes 작업 전에 실행)"""
+    modified = ApplicationService(db).backfill_active_flags()
+    logger.info(f"지원 활성 플래그 백필 완료: {modified}건 갱신")
+
+def migrate_resume_versions(db):
+    """지원 문서의 이력서 버전 배열을 resume_versions 컬렉션으로 옮깁니다"""
+    migrated = ApplicationService(db).migrate_resume_versions()
+    logger.info(f"이력서 버전 마이그레이션 완료: {migrated}건")
+
+def remove_duplicate_bookmarks(db):
+    """중복 북마크를 정리합니다 (indexes 작업 전에 실행)"""
+    removed = BookmarkService(db).remove_duplicate_bookmarks()
+    logger.info(f"중복 북마크 정리 완료: {removed}건 삭제")
+
+def rebuild_popularity_counters(db):
+    """북마크/지원 내역으로 채용공고 인기 카운터를 재계산합니다"""
+    modified = JobService(db).rebuild_popularity_counters()
+    logger.info(f"인기 카운터 재계산 완료: {modified}개 채용공고 갱신")
+
+def create_indexes(db):
+    """models/init_db.py에 정의된 인덱스를 생성합니다"""
+    init_indexes(db)
+    logger.info("인덱스 생성 완료")
+
+# 실행 가능한 마이그레이션 작업 목록
+TASKS = {
+    'indexes': create_indexes,
+    'company-snapshots': backfill_company_snapshots,
+    'salaries': backfill_salaries,
+    'region-codes': backfill_region_codes,
+    'skills': backfill_skills,
+    'application-stats': rebuild_application_stats,
+    'application-flags': backfill_application_flags,
+    'resume-versions': migrate_resume_versions,
+    'bookmark-dedupe': remove_duplicate_bookmarks,
+    'popularity-counters': rebuild_popularity_counters,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description='데이터 백필/마이그레이션 실행')
+    parser.add_argument('tasks', nargs='+', choices=list(TASKS), help='실행할 작업')
+    args = parser.parse_args()
+
+    try:
+        # MongoDB 연결
+        client = MongoClient(os.getenv('MONGODB_URI', 'mongodb://localhost:27017'))
+        db = client[os.getenv('DATABASE_NAME', 'job_portal')]
+
+        for task in args.tasks:
+            logger.info(f"작업 시작: {task}")
+            TASKS[task](db)
+
+    except Exception as e:
+        logger.error(f"실행 중 오류 발생: {str(e)}")
+    finally:
+        if 'client' in locals():
+            client.close()
+
+if __name__ == "__main__":
+    main()
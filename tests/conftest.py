@@ -0,0 +1,36 @@
+import mongomock
+import pytest
+from flask import Flask
+from flask_jwt_extended import JWTManager
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """모듈 단위 캐시는 테스트 간에 공유되므로 테스트마다 비웁니다."""
+    from app.utils.compression import response_body_cache
+    from app.services.job_service import job_detail_cache, facet_cache, active_job_cache
+    from app.services.user_job_sets import user_job_sets
+    from app.services.job_popularity import popularity_counter
+
+    for cache in (response_body_cache, job_detail_cache, facet_cache, active_job_cache, user_job_sets):
+        cache.clear()
+    popularity_counter.flush()
+    yield
+
+@pytest.fixture
+def db():
+    return mongomock.MongoClient().db
+
+@pytest.fixture
+def app(db):
+    from app.utils.json_encoder import MongoJSONProvider
+    from app.utils.compression import init_compression
+    from app.routes.job_routes import job_bp
+
+    app = Flask(__name__)
+    app.config['JWT_SECRET_KEY'] = 'test-secret-key-for-jwt-signing-only'
+    JWTManager(app)
+    app.json = MongoJSONProvider(app)
+    init_compression(app)
+    app.db = db
+    app.register_blueprint(job_bp, url_prefix='/jobs')
+    return app
@@ -0,0 +1,28 @@
+from datetime import datetime
+from app.services.application_service import ApplicationService
+from app.services.job_service import JobService
+
+def test_first_stats_write_includes_existing_applications(db):
+    job_service = JobService(db)
+    job_ids = [
+        job_service.create_job_posting({'title': f'공고 {index}', 'sector': '웹개발',
+                                        'original_url': f'u{index}'})[2]['_id']
+        for index in range(3)
+    ]
+    # 통계 문서가 도입되기 전에 저장된 지원 내역
+    now = datetime.utcnow()
+    db.applications.insert_many([
+        {'user_id': 'u1', 'job_posting_id': job_id, 'status': 'in_review',
+         'is_active': True, 'created_at': now, 'updated_at': now}
+        for job_id in job_ids[:2]
+    ])
+
+    application_service = ApplicationService(db)
+    success, _, _ = application_service.apply_job('u1', job_ids[2], {'resume_url': 'https://example.com/cv'})
+    assert success
+
+    success, _, statistics = application_service.get_application_statistics('u1')
+    assert success
+    assert statistics['total_applications'] == 3
+    assert statistics['status_distribution'] == {'in_review': 2, 'applied': 1}
+    assert statistics['category_distribution'] == {'웹개발': 3}
@@ -0,0 +1,24 @@
+from bson import ObjectId
+from app.services.company_service import CompanyService
+from app.services.job_service import JobService
+
+def test_snapshot_sync_refreshes_detail_and_etag(app, db):
+    company_id = db.companies.insert_one({'name': '테크 컴퍼니', 'location': '서울'}).inserted_id
+    job_service = JobService(db)
+    _, _, job = job_service.create_job_posting({
+        'title': '백엔드 개발자', 'company_id': str(company_id), 'original_url': 'u1'
+    })
+    client = app.test_client()
+
+    first = client.get(f"/jobs/{job['_id']}")
+    assert first.get_json()['data']['company']['location'] == '서울'
+    before = db.job_postings.find_one({'_id': ObjectId(job['_id'])})['updated_at']
+
+    db.companies.update_one({'_id': company_id}, {'$set': {'location': '부산'}})
+    company_service = CompanyService(db)
+    assert company_service.sync_job_snapshots([company_service.get_snapshot(company_id)]) == 1
+    assert db.job_postings.find_one({'_id': ObjectId(job['_id'])})['updated_at'] > before
+
+    second = client.get(f"/jobs/{job['_id']}", headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.get_json()['data']['company']['location'] == '부산'
@@ -0,0 +1,29 @@
+from datetime import datetime
+from app.models.init_db import bump_collection_version
+from app.services.job_service import JobService, job_detail_cache
+
+def test_detail_cache_misses_after_write_from_another_process(app, db):
+    job_service = JobService(db)
+    success, _, job = job_service.create_job_posting({
+        'title': '백엔드 개발자',
+        'sector': '웹개발',
+        'original_url': 'https://example.com/jobs/1'
+    })
+    assert success
+    client = app.test_client()
+
+    first = client.get(f"/jobs/{job['_id']}")
+    assert client.get(f"/jobs/{job['_id']}").headers['ETag'] == first.headers['ETag']
+
+    # 크롤러 프로세스의 쓰기: 이 프로세스의 캐시는 무효화되지 않고 컬렉션 버전만 증가합니다
+    db.job_postings.update_one(
+        {'title': '백엔드 개발자'},
+        {'$set': {'title': '시니어 백엔드 개발자', 'updated_at': datetime.utcnow()}}
+    )
+    bump_collection_version(db, 'job_postings')
+
+    invalidations = job_detail_cache.stats()['invalidations']
+    second = client.get(f"/jobs/{job['_id']}", headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.get_json()['data']['title'] == '시니어 백엔드 개발자'
+    assert job_detail_cache.stats()['invalidations'] == invalidations + 1
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+from app.services.job_service import JobService
+from app.services.job_indexes import job_index_refresher
+
+def insert_job(db, title, updated_at):
+    return str(db.job_postings.insert_one({
+        'title': title,
+        'skills': ['Python'],
+        'status': 'active',
+        'created_at': updated_at,
+        'updated_at': updated_at
+    }).inserted_id)
+
+def skill_search(job_service):
+    result = job_service.get_job_postings(filters={'skills': ['python']})
+    assert result['status'] == 'success'
+    return {job['title'] for job in result['data']}
+
+def test_skill_filter_finds_postings_missing_from_index(db):
+    job_service = JobService(db)
+    job_service.create_job_posting({'title': 'indexed', 'skills': ['Python'], 'original_url': 'u1'})
+    assert skill_search(job_service) == {'indexed'}
+
+    # 인덱스 갱신 주기 전에 다른 프로세스가 저장한 공고 (로컬 시각으로 저장되어 UTC보다 앞선 경우)
+    insert_job(db, 'future-stamped', datetime.utcnow() + timedelta(hours=9))
+    assert skill_search(job_service) == {'indexed', 'future-stamped'}
+
+def test_watermark_does_not_pass_current_time(db):
+    job_service = JobService(db)
+    insert_job(db, 'future-stamped', datetime.utcnow() + timedelta(hours=9))
+    job_index_refresher.refresh(db, force=True)
+    assert job_index_refresher.covered_until() <= datetime.utcnow()
+
+    insert_job(db, 'utc-stamped', datetime.utcnow())
+    job_index_refresher.refresh(db, force=True)
+    assert skill_search(job_service) == {'future-stamped', 'utc-stamped'}
+
+def test_common_skill_uses_skills_index_instead_of_id_list(db, monkeypatch):
+    monkeypatch.setattr('app.services.job_service.SKILL_BITMAP_MAX_IDS', 1)
+    job_service = JobService(db)
+    job_service.create_job_posting({'title': 'python', 'skills': ['Python'], 'original_url': 'u1'})
+    job_service.create_job_posting({'title': 'python-react', 'skills': ['Python', 'React'], 'original_url': 'u2'})
+    job_index_refresher.refresh(db, force=True)
+
+    # 두 공고가 일치하므로 _id 목록 대신 skills 조건을 사용합니다
+    common = job_service._build_list_query({'skills': ['python']})
+    assert common['skills'] == {'$all': ['Python']} and '$or' not in common
+    assert skill_search(job_service) == {'python', 'python-react'}
+
+    # 한 공고만 일치하면 비트맵 결과(_id 목록)와 최근 수정 공고 조건을 사용합니다
+    selective = job_service._build_list_query({'skills': ['python', 'react']})
+    assert len(selective['$or'][0]['_id']['$in']) == 1
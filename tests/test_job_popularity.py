@@ -0,0 +1,58 @@
+from app.services.job_service import JobService, job_detail_cache
+from app.services.job_popularity import popularity_counter
+
+def create_job(job_service, index=0):
+    success, _, job = job_service.create_job_posting({
+        'title': f'백엔드 개발자 {index}',
+        'sector': '웹개발',
+        'original_url': f'https://example.com/jobs/{index}'
+    })
+    assert success
+    return job['_id']
+
+def test_default_listing_etag_survives_counter_flush(app, db):
+    job_service = JobService(db)
+    job_id = create_job(job_service)
+    client = app.test_client()
+
+    etag = client.get('/jobs').headers['ETag']
+    job_service.record_popularity(job_id, 'bookmark_count')
+    assert popularity_counter.flush() == 1
+
+    assert client.get('/jobs', headers={'If-None-Match': etag}).status_code == 304
+
+def test_popular_listing_etag_changes_after_counter_flush(app, db):
+    job_service = JobService(db)
+    job_id = create_job(job_service)
+    client = app.test_client()
+
+    first = client.get('/jobs?sort_by=popular')
+    etag = first.headers['ETag']
+    assert client.get('/jobs?sort_by=popular', headers={'If-None-Match': etag}).status_code == 304
+
+    job_service.record_popularity(job_id, 'bookmark_count')
+    assert popularity_counter.flush() == 1
+
+    second = client.get('/jobs?sort_by=popular', headers={'If-None-Match': etag})
+    assert second.status_code == 200
+    assert second.headers['ETag'] != etag
+    assert second.get_json()['data'][0]['bookmark_count'] == 1
+
+def test_detail_polling_keeps_304_and_cache_while_counters_flush(app, db, monkeypatch):
+    job_service = JobService(db)
+    job_id = create_job(job_service)
+    client = app.test_client()
+    monkeypatch.setattr(popularity_counter, 'flush_interval', 0)  # 조회마다 카운터를 반영
+
+    etag = client.get(f'/jobs/{job_id}').headers['ETag']
+    before = job_detail_cache.stats()
+    statuses = [
+        client.get(f'/jobs/{job_id}', headers={'If-None-Match': etag}).status_code
+        for _ in range(3)
+    ]
+    after = job_detail_cache.stats()
+
+    assert statuses == [304, 304, 304]
+    assert after['hits'] - before['hits'] == 3
+    assert after['invalidations'] == before['invalidations']
+    assert db.job_postings.find_one()['view_count'] == 4
@@ -0,0 +1,19 @@
+import json
+from datetime import date, datetime, timezone
+from app.utils.json_encoder import bson_default, dumps
+
+def test_naive_datetimes_serialize_as_explicit_utc_on_both_paths():
+    document = {
+        'created_at': datetime(2026, 10, 19, 12, 38, 12, 61000),
+        'updated_at': datetime(2026, 10, 19, 12, 38, 12),
+        'synced_at': datetime(2026, 10, 19, 12, 38, 12, tzinfo=timezone.utc),
+        'deadline': date(2026, 11, 1)
+    }
+    fast = json.loads(dumps(document))
+    fallback = json.loads(json.dumps(document, default=bson_default))
+
+    assert fast == fallback
+    assert fast['created_at'] == '2026-10-19T12:38:12.061000+00:00'
+    assert fast['updated_at'] == '2026-10-19T12:38:12+00:00'
+    assert fast['synced_at'] == '2026-10-19T12:38:12+00:00'
+    assert fast['deadline'] == '2026-11-01'
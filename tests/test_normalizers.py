@@ -0,0 +1,20 @@
+import pytest
+from app.utils.normalizers import parse_salary
+
+@pytest.mark.parametrize('salary_text, expected', [
+    ('3,500~4,000만원', (3500, 4000, 'year')),
+    ('월급 300만원', (3600, 3600, 'month')),
+    ('1억 2,000만원', (12000, 12000, 'year')),
+    ('1~1.5억', (10000, 15000, 'year')),
+    ('연봉 3,600만원(월 300만원)', (3600, 3600, 'year')),
+    ('연봉 4000만원 (주 5일)', (4000, 4000, 'year')),
+    ('300만원 (월급)', (3600, 3600, 'month')),
+    ('시급 9,860원', (2473, 2473, 'hour')),
+])
+def test_parse_salary(salary_text, expected):
+    salary = parse_salary(salary_text)
+    assert (salary['min'], salary['max'], salary['period']) == expected
+
+@pytest.mark.parametrize('salary_text', ['회사내규에 따름', '면접 후 결정', '주 5일', ''])
+def test_parse_salary_without_amount(salary_text):
+    assert parse_salary(salary_text) is None
@@ -0,0 +1,34 @@
+from datetime import datetime
+from bson import ObjectId
+from app.services.application_service import ApplicationService
+
+def test_resume_update_before_migration_keeps_legacy_versions(db):
+    now = datetime.utcnow()
+    application_id = str(db.applications.insert_one({
+        'user_id': 'u1',
+        'job_posting_id': 'job',
+        'status': 'applied',
+        'resume_url': 'https://example.com/cv-1',
+        'resume_versions': [
+            {'version': 1, 'resume_url': 'https://example.com/cv-1', 'created_at': now},
+            {'version': 2, 'resume_url': 'https://example.com/cv-2', 'created_at': now}
+        ],
+        'created_at': now,
+        'updated_at': now
+    }).inserted_id)
+
+    application_service = ApplicationService(db)
+    success, _, application = application_service.manage_application_resume(
+        'u1', application_id, {'resume_url': 'https://example.com/cv-3'}
+    )
+    assert success
+    assert application['current_resume_version']['version'] == 3
+    assert 'resume_versions' not in db.applications.find_one({'_id': ObjectId(application_id)})
+
+    # 이후 마이그레이션을 실행해도 옮길 배열이 없으므로 이력이 유지됩니다
+    assert application_service.migrate_resume_versions() == 0
+    result = application_service.get_resume_versions('u1', application_id)
+    assert result['status'] == 'success'
+    assert [version['resume_url'] for version in result['data']] == [
+        'https://example.com/cv-3', 'https://example.com/cv-2', 'https://example.com/cv-1'
+    ]
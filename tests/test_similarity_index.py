@@ -0,0 +1,44 @@
+import time
+from app.utils.similarity_index import SimilarityIndex
+
+def build_index():
+    index = SimilarityIndex(rebuild_ratio=0.5)
+    index.add_document('backend', ['python', 'django', 'api', 'server'])
+    index.add_document('frontend', ['react', 'typescript', 'css', 'ui'])
+    index.add_document('data', ['python', 'pandas', 'sql', 'etl'])
+    index.add_document('mobile', ['kotlin', 'android', 'ui', 'app'])
+    return index
+
+def test_changes_update_rows_without_full_rebuild():
+    index = build_index()
+    assert [doc_id for doc_id, _ in index.similar('backend')] == ['data']
+    assert index.stats()['rebuilds'] == 1
+
+    index.add_document('api', ['python', 'django', 'api'])
+    assert index.similar('backend')[0][0] == 'api'
+
+    index.remove_document('data')
+    assert 'data' not in [doc_id for doc_id, _ in index.similar('backend')]
+    assert index.similar('data') == []
+    assert index.stats()['rebuilds'] == 1
+
+def test_many_changes_rebuild_in_background():
+    index = build_index()
+    index.similar('backend')
+    for number in range(5):
+        index.add_document(f'python-{number}', ['python', 'django', f'term-{number}'])
+
+    deadline = time.monotonic() + 5
+    while (index.stats()['rebuilding'] or index.stats()['rebuilds'] < 2) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert index.stats()['rebuilds'] >= 2
+    assert index.stats()['features'] > 0
+    assert {doc_id for doc_id, _ in index.similar('backend', limit=5)} >= {f'python-{n}' for n in range(5)}
+
+def test_matrix_is_stored_in_half_precision():
+    index = build_index()
+    assert [doc_id for doc_id, _ in index.similar('backend')] == ['data']
+
+    stats = index.stats()
+    assert index._matrix.dtype.itemsize == 2
+    assert stats['matrix_bytes'] == index._matrix.shape[0] * stats['features'] * 2